@@ -0,0 +1,125 @@
+"""Benchmark filesystem calls made by package discovery.
+
+Builds a synthetic workspace with N packages (1000 by default) and counts
+the stat/listing calls made by the pre-index discovery algorithm, by a
+cold scan (no index) and by a warm scan (index present, nothing changed).
+
+Usage:
+    python benchmarks/bench_discovery.py [--packages 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from agentic_crew.core.discovery import (
+    FRAMEWORK_DIRS,
+    discover_all_framework_configs,
+    discover_packages,
+    scan_crew_configs,
+)
+
+_COUNTED = ("stat", "lstat", "scandir", "listdir")
+
+
+@contextmanager
+def count_fs_calls() -> Iterator[Counter[str]]:
+    """Count os.stat/lstat/scandir/listdir calls made inside the block."""
+    counts: Counter[str] = Counter()
+    originals = {name: getattr(os, name) for name in _COUNTED}
+
+    def counting(name: str) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counts[name] += 1
+            return originals[name](*args, **kwargs)
+
+        return wrapper
+
+    with patch.multiple(os, **{name: counting(name) for name in _COUNTED}):
+        yield counts
+
+
+def legacy_discover(workspace_root: Path) -> tuple[dict[str, Path], dict[str, dict[str, Path]]]:
+    """The discovery algorithm before the index: iterdir + exists() per candidate, run twice."""
+    packages: dict[str, Path] = {}
+    all_configs: dict[str, dict[str, Path]] = {}
+    packages_dir = workspace_root / "packages"
+    for _ in ("discover_packages", "discover_all_framework_configs"):
+        if packages_dir.exists():
+            for pkg_dir in packages_dir.iterdir():
+                if not pkg_dir.is_dir():
+                    continue
+                for dir_name in FRAMEWORK_DIRS:
+                    config_dir = pkg_dir / dir_name
+                    if config_dir.exists() and (config_dir / "manifest.yaml").exists():
+                        packages.setdefault(pkg_dir.name, config_dir)
+                        all_configs.setdefault(pkg_dir.name, {})[dir_name] = config_dir
+        for dir_name in FRAMEWORK_DIRS:
+            config_dir = workspace_root / dir_name
+            if config_dir.exists() and (config_dir / "manifest.yaml").exists():
+                break
+    return packages, all_configs
+
+
+def build_workspace(root: Path, count: int) -> None:
+    """Create `count` packages; every other one has a crew config."""
+    past = time.time() - 3600
+    for i in range(count):
+        pkg_dir = root / "packages" / f"pkg{i:04d}"
+        pkg_dir.mkdir(parents=True)
+        (pkg_dir / "src").mkdir()
+        if i % 2 == 0:
+            config_dir = pkg_dir / FRAMEWORK_DIRS[i % len(FRAMEWORK_DIRS)]
+            config_dir.mkdir()
+            (config_dir / "manifest.yaml").write_text("crews: {}\n")
+    # Age directories and manifests so the index can trust their mtimes
+    for dirpath, _dirnames, filenames in os.walk(root):
+        os.utime(dirpath, (past, past))
+        for filename in filenames:
+            os.utime(os.path.join(dirpath, filename), (past, past))
+
+
+def _measure(label: str, fn: Callable[[], Any]) -> None:
+    with count_fs_calls() as counts:
+        start = time.perf_counter()
+        fn()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    calls = ", ".join(f"{name}={counts[name]}" for name in _COUNTED)
+    print(f"{label:<34} {calls:<52} {elapsed_ms:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packages", type=int, default=1000, help="Number of synthetic packages")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "workspace"
+        os.environ["AGENTIC_CREW_CACHE_DIR"] = str(Path(tmp) / "cache")
+        build_workspace(root, args.packages)
+
+        def both() -> None:
+            scan = scan_crew_configs(root)
+            discover_packages(root, scan=scan)
+            discover_all_framework_configs(root, scan=scan)
+
+        print(f"Discovery over {args.packages} synthetic packages (list + all-frameworks views)\n")
+        _measure("legacy iterdir + exists()", lambda: legacy_discover(root))
+        os.environ["AGENTIC_CREW_NO_CACHE"] = "1"
+        _measure("scandir scan, index disabled", both)
+        del os.environ["AGENTIC_CREW_NO_CACHE"]
+        _measure("scandir scan, cold index", both)
+        _measure("scandir scan, warm index", both)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark YAML parse time for large agents/tasks files.
+
+Generates synthetic agents.yaml and tasks.yaml documents and times the
+pure-Python SafeLoader against libyaml's CSafeLoader (used by
+agentic_crew.utils.files.load_yaml when available).
+
+Usage:
+    python benchmarks/bench_yaml.py [--agents 500] [--tasks 2000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+import yaml
+from agentic_crew.utils.files import LIBYAML_AVAILABLE, load_yaml
+
+
+def build_agents(count: int) -> str:
+    """Build an agents.yaml document with `count` agents."""
+    return yaml.safe_dump(
+        {
+            f"agent_{i}": {
+                "role": f"Specialist {i}",
+                "goal": "Produce thorough, well-structured output for the assigned task. " * 3,
+                "backstory": "An experienced engineer with a long history of shipping reliable systems.\n" * 5,
+                "allow_delegation": i % 2 == 0,
+                "tools": ["read_file", "write_file", "list_directory"],
+            }
+            for i in range(count)
+        }
+    )
+
+
+def build_tasks(count: int, agents: int) -> str:
+    """Build a tasks.yaml document with `count` tasks."""
+    return yaml.safe_dump(
+        {
+            f"task_{i}": {
+                "description": f"Step {i}: analyze the input and write a report.\n" * 4,
+                "expected_output": "A markdown report with findings and recommendations.",
+                "agent": f"agent_{i % agents}",
+                "context": [f"task_{j}" for j in range(max(0, i - 3), i)],
+            }
+            for i in range(count)
+        }
+    )
+
+
+def _best_ms(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--agents", type=int, default=500, help="Number of agents in agents.yaml")
+    parser.add_argument("--tasks", type=int, default=2000, help="Number of tasks in tasks.yaml")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    documents = {
+        "agents.yaml": build_agents(args.agents),
+        "tasks.yaml": build_tasks(args.tasks, args.agents),
+    }
+
+    print(f"libyaml available: {LIBYAML_AVAILABLE}\n")
+    print(f"{'file':<12} {'size':>10} {'SafeLoader':>12} {'load_yaml':>12} {'speedup':>8}")
+    for name, text in documents.items():
+        assert load_yaml(text) == yaml.load(text, Loader=yaml.SafeLoader)
+        pure_ms = _best_ms(lambda text=text: yaml.load(text, Loader=yaml.SafeLoader), args.repeat)
+        fast_ms = _best_ms(lambda text=text: load_yaml(text), args.repeat)
+        size_kb = f"{len(text) / 1024:.0f} KiB"
+        print(f"{name:<12} {size_kb:>10} {pure_ms:>9.1f} ms {fast_ms:>9.1f} ms {pure_ms / fast_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ Usage:
     from agentic_crew.core.decomposer import run_crew_auto, get_runner, detect_framework
     from agentic_crew.core.discovery import discover_packages, get_crew_config
     from agentic_crew.core.manager import ManagerAgent
+    from agentic_crew.core.result_store import ResultStore
+    from agentic_crew.core.workflow import WorkflowError, WorkflowResult, WorkflowStep
+    from agentic_crew.runners.events import CrewEvent
 
     # Auto-detect framework and run a crew
     packages = discover_packages()
@@ -32,24 +35,72 @@ Usage:
 
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 
-# Core exports - framework-agnostic functionality
-from agentic_crew.core.decomposer import (
-    decompose_crew,
-    detect_framework,
-    get_available_frameworks,
-    get_runner,
-    is_framework_available,
-    run_crew_auto,
-)
-from agentic_crew.core.discovery import (
-    discover_all_framework_configs,
-    discover_packages,
-    get_crew_config,
-    list_crews,
-)
-from agentic_crew.core.manager import ManagerAgent
+# Public names are resolved on first access (PEP 562) so that importing
+# agentic_crew, or any submodule such as agentic_crew.main, does not pull
+# in the decomposer, the manager (asyncio) or the discovery stack (PyYAML).
+_LAZY_ATTRS: dict[str, str] = {
+    # Decomposer - framework detection and selection
+    "detect_framework": "agentic_crew.core.decomposer",
+    "get_available_frameworks": "agentic_crew.core.decomposer",
+    "is_framework_available": "agentic_crew.core.decomposer",
+    "get_runner": "agentic_crew.core.decomposer",
+    "decompose_crew": "agentic_crew.core.decomposer",
+    "run_crew_auto": "agentic_crew.core.decomposer",
+    "run_crew_auto_async": "agentic_crew.core.decomposer",
+    "stream_crew_auto": "agentic_crew.core.decomposer",
+    "astream_crew_auto": "agentic_crew.core.decomposer",
+    "run_crew_batch": "agentic_crew.core.decomposer",
+    "BatchResult": "agentic_crew.core.decomposer",
+    "CrewEvent": "agentic_crew.runners.events",
+    "DeadlineExceeded": "agentic_crew.runners.base",
+    "use_deadline": "agentic_crew.runners.base",
+    # Discovery - find and load crew configs
+    "discover_packages": "agentic_crew.core.discovery",
+    "discover_all_framework_configs": "agentic_crew.core.discovery",
+    "get_crew_config": "agentic_crew.core.discovery",
+    "CrewConfig": "agentic_crew.core.crew_config",
+    "list_crews": "agentic_crew.core.discovery",
+    # Manager - hierarchical orchestration
+    "ManagerAgent": "agentic_crew.core.manager",
+    "WorkflowStep": "agentic_crew.core.workflow",
+    "WorkflowResult": "agentic_crew.core.workflow",
+    "WorkflowError": "agentic_crew.core.workflow",
+    "ResultStore": "agentic_crew.core.result_store",
+    "CrewProcessPool": "agentic_crew.core.process_pool",
+}
+
+if TYPE_CHECKING:
+    from agentic_crew.core.crew_config import CrewConfig
+    from agentic_crew.core.decomposer import (
+        BatchResult,
+        astream_crew_auto,
+        decompose_crew,
+        detect_framework,
+        get_available_frameworks,
+        get_runner,
+        is_framework_available,
+        run_crew_auto,
+        run_crew_auto_async,
+        run_crew_batch,
+        stream_crew_auto,
+    )
+    from agentic_crew.core.discovery import (
+        discover_all_framework_configs,
+        discover_packages,
+        get_crew_config,
+        list_crews,
+    )
+    from agentic_crew.core.manager import ManagerAgent
+    from agentic_crew.core.process_pool import CrewProcessPool
+    from agentic_crew.core.result_store import ResultStore
+    from agentic_crew.core.workflow import WorkflowError, WorkflowResult, WorkflowStep
+    from agentic_crew.runners.base import DeadlineExceeded, use_deadline
+    from agentic_crew.runners.events import CrewEvent
 
 __all__ = [
     # Version
@@ -61,11 +112,38 @@ __all__ = [
     "get_runner",
     "decompose_crew",
     "run_crew_auto",
+    "run_crew_auto_async",
+    "stream_crew_auto",
+    "astream_crew_auto",
+    "run_crew_batch",
+    "BatchResult",
+    "CrewEvent",
+    "DeadlineExceeded",
+    "use_deadline",
     # Discovery - find and load crew configs
     "discover_packages",
     "discover_all_framework_configs",
     "get_crew_config",
+    "CrewConfig",
     "list_crews",
     # Manager - hierarchical orchestration
     "ManagerAgent",
+    "WorkflowStep",
+    "WorkflowResult",
+    "WorkflowError",
+    "ResultStore",
+    "CrewProcessPool",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
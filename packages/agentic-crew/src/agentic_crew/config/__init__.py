@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from agentic_crew.config.llm import get_llm
+from agentic_crew.config.llm import close_llm_pool, get_llm
 
 __all__ = [
+    "close_llm_pool",
     "get_llm",
 ]
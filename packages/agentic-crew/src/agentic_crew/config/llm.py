@@ -2,19 +2,43 @@
 
 Uses Anthropic Claude directly via ANTHROPIC_API_KEY.
 Falls back to OpenRouter if OPENROUTER_API_KEY is set.
+
+LLM clients are pooled per process: agents, crews and runs asking for the
+same provider, model, temperature and endpoint share one client (and its
+HTTP connection pool) instead of each opening their own. close_llm_pool()
+closes them.
+
+Prompt caching is on by default wherever the client supports it: the
+stable prefix of each request (tool schemas and system prompt: an agent's
+role, goal and backstory, or a combined crew prompt) is marked cacheable
+so repeated turns, tasks and runs read it from the cache instead of paying
+full input price and latency. LangGraph agents mark their system prompts
+with cacheable_prompt(), Strands agents use Bedrock prompt caching, and
+CrewAI agents on OpenRouter get the breakpoint from LiteLLM (CrewAI's
+native Anthropic client has no cache option). Set
+AGENTIC_CREW_NO_PROMPT_CACHE=1 to disable it.
 """
 
 from __future__ import annotations
 
+import contextlib
 import os
+import threading
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from agentic_crew.utils.lru import LRUCache
 
-try:
+if TYPE_CHECKING:
     from crewai import LLM
-except ImportError:
-    # Allow module to load even if crewai not installed (for testing)
-    LLM = None  # type: ignore
+else:
+    # crewai.LLM, imported by get_llm() on first use: importing CrewAI takes
+    # seconds, and the LangGraph runner uses this module's client pool too
+    LLM = None
+
+_crewai_missing = False
 
 
 class LLMProvider(Enum):
@@ -33,6 +57,90 @@ class LLMConfig:
     description: str
 
 
+NO_PROMPT_CACHE_ENV = "AGENTIC_CREW_NO_PROMPT_CACHE"
+
+# Anthropic cache breakpoint; caches everything up to and including the block
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+
+# LiteLLM option adding a cache breakpoint after the system message
+_CACHE_INJECTION_POINTS = [{"location": "message", "role": "system"}]
+
+# Maximum number of LLM clients kept in the pool
+LLM_POOL_SIZE = 32
+
+# (provider, model, temperature, base_url, api key) -> client
+_llm_pool = LRUCache(LLM_POOL_SIZE)
+_llm_pool_lock = threading.Lock()
+
+
+def prompt_cache_enabled() -> bool:
+    """Return True unless prompt caching is disabled via the environment."""
+    return os.environ.get(NO_PROMPT_CACHE_ENV, "") in ("", "0")
+
+
+def cacheable_prompt(text: str) -> str | list[dict[str, Any]]:
+    """Mark a system prompt as a prompt-cache prefix, in Anthropic content-block form.
+
+    Tool schemas precede the system prompt in a request, so they are
+    cached along with it.
+
+    Args:
+        text: System prompt text.
+
+    Returns:
+        A single text block with a cache breakpoint, or the text itself
+        when prompt caching is disabled.
+    """
+    if not prompt_cache_enabled():
+        return text
+    return [{"type": "text", "text": text, "cache_control": dict(PROMPT_CACHE_CONTROL)}]
+
+
+def pooled_llm(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the pooled LLM client for a key, creating it on first use.
+
+    Clients evicted from the bounded pool are not closed, since agents
+    built earlier may still hold them; they are released with their last
+    user.
+
+    Args:
+        key: Identifies the client; include everything the client is
+            configured with (provider, model, temperature, base URL, key).
+        factory: Creates the client when the pool has none for the key.
+
+    Returns:
+        The shared client.
+    """
+    llm = _llm_pool.get(key)
+    if llm is None:
+        with _llm_pool_lock:
+            llm = _llm_pool.get(key)
+            if llm is None:
+                llm = factory()
+                _llm_pool.put(key, llm)
+    return llm
+
+
+def llm_pool_info() -> dict[str, int]:
+    """Return hit/miss statistics and the size of the LLM client pool."""
+    return _llm_pool.info()
+
+
+def close_llm_pool() -> None:
+    """Close and drop every pooled LLM client.
+
+    Clients without a close() method are just dropped.
+    """
+    with _llm_pool_lock:
+        clients = _llm_pool.values()
+        _llm_pool.clear()
+    for llm in clients:
+        close = getattr(llm, "close", None)
+        if callable(close):
+            with contextlib.suppress(Exception):
+                close()
+
+
 # Model identifiers
 _CLAUDE_HAIKU_45 = "claude-haiku-4-5-20251001"
 _CLAUDE_SONNET_45 = "claude-sonnet-4-5-20250929"
@@ -92,7 +200,8 @@ def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.7, provider: LLMP
         - openrouter/auto (fallback via OpenRouter)
 
     Returns:
-        Configured LLM instance, or None if no API key set
+        Configured LLM instance, or None if no API key set. Calls with the
+        same settings share one instance (see pooled_llm).
 
     Note:
         Tries ANTHROPIC_API_KEY first, falls back to OPENROUTER_API_KEY.
@@ -103,55 +212,97 @@ def get_llm(model: str = DEFAULT_MODEL, temperature: float = 0.7, provider: LLMP
         >>> llm = get_llm("claude-opus-4-20250514", temperature=0.3)
         >>> llm = get_llm(provider=LLMProvider.OPENROUTER)
     """
-    if LLM is None:
+    if _crewai_llm() is None:
         return None
 
-    # Determine provider
+    resolved = resolve_llm(model, provider)
+    if resolved is None:
+        return None
+    provider, model = resolved
+    if provider == LLMProvider.ANTHROPIC:
+        return _create_anthropic_llm(model, temperature, os.environ["ANTHROPIC_API_KEY"])
+    return _create_openrouter_llm(model, temperature, os.environ["OPENROUTER_API_KEY"])
+
+
+def resolve_llm(model: str = DEFAULT_MODEL, provider: LLMProvider | None = None) -> tuple[LLMProvider, str] | None:
+    """Choose the provider and model get_llm() uses, without building a client.
+
+    The choice depends on which API keys are set, so results produced with
+    one environment can differ from another's for the same crew config.
+
+    Args:
+        model: Model identifier.
+        provider: Force specific provider. If None, auto-detects based on
+                 available API keys.
+
+    Returns:
+        (provider, model as sent to that provider), or None if the needed
+        API key is not set.
+    """
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
     openrouter_key = os.getenv("OPENROUTER_API_KEY")
 
-    # Force provider if specified
-    if provider == LLMProvider.ANTHROPIC:
-        if not anthropic_key:
+    # Force provider if specified; otherwise try Anthropic first for
+    # direct Claude models and fall back to OpenRouter
+    if provider is None:
+        if anthropic_key and not model.startswith("openrouter/"):
+            provider = LLMProvider.ANTHROPIC
+        elif openrouter_key:
+            provider = LLMProvider.OPENROUTER
+        else:
             return None
-        return _create_anthropic_llm(model, temperature, anthropic_key)
 
-    if provider == LLMProvider.OPENROUTER:
-        if not openrouter_key:
-            return None
-        return _create_openrouter_llm(model, temperature, openrouter_key)
-
-    # Auto-detect: Try Anthropic first for direct Claude models
-    if anthropic_key and not model.startswith("openrouter/"):
-        return _create_anthropic_llm(model, temperature, anthropic_key)
+    if provider == LLMProvider.ANTHROPIC:
+        return (provider, model) if anthropic_key else None
+    if not openrouter_key:
+        return None
+    # Convert model name to OpenRouter format if needed
+    if not model.startswith("openrouter/"):
+        model = MODELS.get("openrouter-auto", "openrouter/auto")
+    return provider, model
 
-    # Fall back to OpenRouter
-    if openrouter_key:
-        return _create_openrouter_llm(model, temperature, openrouter_key)
 
-    return None
+def _crewai_llm() -> Any:
+    """Return crewai.LLM, importing it on first use (None if CrewAI is not installed)."""
+    global LLM, _crewai_missing
+    if LLM is None and not _crewai_missing:
+        try:
+            from crewai import LLM as crewai_llm
+        except ImportError:
+            _crewai_missing = True
+        else:
+            LLM = crewai_llm
+    return LLM
 
 
 def _create_anthropic_llm(model: str, temperature: float, api_key: str) -> LLM:
-    """Create Anthropic LLM instance."""
-    return LLM(
-        model=model,
-        api_key=api_key,
-        temperature=temperature,
+    """Get the pooled Anthropic LLM instance."""
+    return pooled_llm(
+        (LLMProvider.ANTHROPIC.value, model, temperature, None, api_key),
+        lambda: LLM(
+            model=model,
+            api_key=api_key,
+            temperature=temperature,
+        ),
     )
 
 
 def _create_openrouter_llm(model: str, temperature: float, api_key: str) -> LLM:
-    """Create OpenRouter LLM instance."""
-    # Convert model name to OpenRouter format if needed
-    if not model.startswith("openrouter/"):
-        model = MODELS.get("openrouter-auto", "openrouter/auto")
-
-    return LLM(
-        model=model,
-        api_key=api_key,
-        base_url="https://openrouter.ai/api/v1",
-        temperature=temperature,
+    """Get the pooled OpenRouter LLM instance (model in OpenRouter format, see resolve_llm)."""
+    base_url = "https://openrouter.ai/api/v1"
+    # OpenRouter calls go through LiteLLM, which can add the cache breakpoint
+    extra: dict[str, Any] = {}
+    if prompt_cache_enabled():
+        extra["cache_control_injection_points"] = _CACHE_INJECTION_POINTS
+    return pooled_llm(
+        (LLMProvider.OPENROUTER.value, model, temperature, base_url, api_key, bool(extra)),
+        lambda: LLM(
+            model=model,
+            api_key=api_key,
+            base_url=base_url,
+            temperature=temperature,
+            **extra,
+        ),
     )
 
 
@@ -2,16 +2,56 @@
 
 from __future__ import annotations
 
-from agentic_crew.core.discovery import discover_packages, get_crew_config, load_manifest
-from agentic_crew.core.loader import load_crew_from_config
-from agentic_crew.core.manager import ManagerAgent
-from agentic_crew.core.runner import run_crew
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Resolved on first access (PEP 562); see agentic_crew/__init__.py
+_LAZY_ATTRS: dict[str, str] = {
+    "discover_packages": "agentic_crew.core.discovery",
+    "load_manifest": "agentic_crew.core.discovery",
+    "scan_crew_configs": "agentic_crew.core.discovery",
+    "get_crew_config": "agentic_crew.core.discovery",
+    "CrewConfig": "agentic_crew.core.crew_config",
+    "invalidate_config_cache": "agentic_crew.core.discovery",
+    "load_crew_from_config": "agentic_crew.core.loader",
+    "run_crew": "agentic_crew.core.runner",
+    "ManagerAgent": "agentic_crew.core.manager",
+}
+
+if TYPE_CHECKING:
+    from agentic_crew.core.crew_config import CrewConfig
+    from agentic_crew.core.discovery import (
+        discover_packages,
+        get_crew_config,
+        invalidate_config_cache,
+        load_manifest,
+        scan_crew_configs,
+    )
+    from agentic_crew.core.loader import load_crew_from_config
+    from agentic_crew.core.manager import ManagerAgent
+    from agentic_crew.core.runner import run_crew
 
 __all__ = [
     "discover_packages",
     "load_manifest",
+    "scan_crew_configs",
     "get_crew_config",
+    "CrewConfig",
+    "invalidate_config_cache",
     "load_crew_from_config",
     "run_crew",
     "ManagerAgent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
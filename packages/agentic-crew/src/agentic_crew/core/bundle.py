@@ -0,0 +1,188 @@
+"""Compiled crew bundles - pre-resolved crew configs for fast cold start.
+
+`agentic-crew compile` resolves a config directory's manifest, every
+crew's agents and tasks YAML, and its knowledge path listing into a single
+file next to manifest.yaml. get_crew_config() prefers an up-to-date bundle
+over the YAML sources, so a cold process loads one marshal blob instead
+of parsing several YAML files.
+
+File layout:
+
+    MAGIC (4 bytes) | version (uint16, big endian) | sha256(payload) | payload
+
+The payload is a marshal-encoded dict. It records a content hash of the
+source files plus their (mtime_ns, size) stamps. A bundle is used only if
+every stamp still matches; when a stamp differs (or was too recent to
+trust at compile time) the sources are re-hashed and the bundle is still
+used if their content is unchanged. Anything else falls back to YAML.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import marshal
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Any
+
+from agentic_crew.utils.cache import RACY_WINDOW_NS, atomic_write
+from agentic_crew.utils.files import load_yaml
+
+BUNDLE_NAME = "manifest.bundle"
+BUNDLE_VERSION = 1
+MANIFEST_NAME = "manifest.yaml"
+
+_MAGIC = b"ACRB"
+_HEADER = struct.Struct(">4sH32s")
+_MARSHAL_VERSION = 4
+
+# Stamp size recorded for referenced files that do not exist
+_MISSING = -1
+
+
+def get_bundle_path(config_dir: Path) -> Path:
+    """Get the bundle file used for a config directory."""
+    return config_dir / BUNDLE_NAME
+
+
+def compile_bundle(config_dir: Path) -> dict[str, Any]:
+    """Compile a config directory's crews into a bundle file.
+
+    Args:
+        config_dir: Path to the config directory (.crew/, .crewai/, ...).
+
+    Returns:
+        Summary dict with path, crews and content_hash.
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest.yaml.
+        ValueError: If the YAML cannot be represented in a bundle.
+    """
+    sources: dict[str, bytes | None] = {MANIFEST_NAME: (config_dir / MANIFEST_NAME).read_bytes()}
+    stamps: dict[str, tuple[int | None, int]] = {MANIFEST_NAME: _stamp(config_dir / MANIFEST_NAME)}
+    manifest = load_yaml(sources[MANIFEST_NAME]) or {}
+
+    crews: dict[str, Any] = {}
+    knowledge: dict[str, bool] = {}
+    for crew_name, crew_config in (manifest.get("crews") or {}).items():
+        if not isinstance(crew_config, dict) or "agents" not in crew_config or "tasks" not in crew_config:
+            # Left to get_crew_config's YAML path so it reports the error
+            continue
+
+        entry: dict[str, Any] = {}
+        for key in ("agents", "tasks"):
+            rel = crew_config[key]
+            if rel not in sources:
+                sources[rel] = _read_optional(config_dir / rel)
+                stamps[rel] = _stamp(config_dir / rel)
+            entry[key] = (load_yaml(sources[rel]) or {}) if sources[rel] is not None else {}
+
+        entry["knowledge_paths"] = []
+        for rel in crew_config.get("knowledge", []):
+            exists = knowledge.setdefault(rel, (config_dir / rel).exists())
+            if exists:
+                entry["knowledge_paths"].append(rel)
+        crews[crew_name] = entry
+
+    content_hash = _content_hash(sources)
+    data = {
+        "content_hash": content_hash,
+        "sources": [[rel, mtime_ns, size] for rel, (mtime_ns, size) in sorted(stamps.items())],
+        "knowledge": sorted([rel, exists] for rel, exists in knowledge.items()),
+        "manifest": manifest,
+        "crews": crews,
+    }
+    try:
+        payload = marshal.dumps(data, _MARSHAL_VERSION)
+    except ValueError as e:
+        raise ValueError(f"Cannot compile {config_dir}: config contains values a bundle cannot store ({e})") from e
+
+    bundle_path = get_bundle_path(config_dir)
+    _write_bundle(bundle_path, _HEADER.pack(_MAGIC, BUNDLE_VERSION, hashlib.sha256(payload).digest()) + payload)
+    return {"path": bundle_path, "crews": list(crews), "content_hash": content_hash}
+
+
+def load_bundle(config_dir: Path) -> dict[str, Any] | None:
+    """Load a config directory's bundle if it matches the YAML sources.
+
+    Args:
+        config_dir: Path to the config directory.
+
+    Returns:
+        Bundle data (manifest, crews, ...) or None if there is no bundle
+        or it is corrupt, from another version, or stale.
+    """
+    try:
+        with open(get_bundle_path(config_dir), "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    if len(blob) < _HEADER.size:
+        return None
+    magic, version, digest = _HEADER.unpack_from(blob)
+    payload = blob[_HEADER.size :]
+    if magic != _MAGIC or version != BUNDLE_VERSION or hashlib.sha256(payload).digest() != digest:
+        return None
+    try:
+        data = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    return data if _is_fresh(config_dir, data) else None
+
+
+def _is_fresh(config_dir: Path, data: dict[str, Any]) -> bool:
+    """Check a bundle's recorded sources against the files on disk."""
+    for rel, exists in data["knowledge"]:
+        if (config_dir / rel).exists() != exists:
+            return False
+
+    needs_hash = False
+    for rel, mtime_ns, size in data["sources"]:
+        current_mtime, current_size = _stamp(config_dir / rel, trust_recent=True)
+        if (size == _MISSING) != (current_size == _MISSING):
+            return False
+        if mtime_ns is None or (current_mtime, current_size) != (mtime_ns, size):
+            needs_hash = True
+
+    if not needs_hash:
+        return True
+    sources = {rel: _read_optional(config_dir / rel) for rel, _mtime, _size in data["sources"]}
+    return _content_hash(sources) == data["content_hash"]
+
+
+def _stamp(path: Path, trust_recent: bool = False) -> tuple[int | None, int]:
+    """Return (mtime_ns, size) for a file; mtime is None if too recent to trust."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None, _MISSING
+    if not trust_recent and st.st_mtime_ns >= time.time_ns() - RACY_WINDOW_NS:
+        return None, st.st_size
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_optional(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _content_hash(sources: dict[str, bytes | None]) -> str:
+    """Hash source paths and contents in a stable order."""
+    digest = hashlib.sha256()
+    for rel in sorted(sources):
+        content = sources[rel]
+        digest.update(rel.encode())
+        digest.update(b"\0")
+        digest.update(b"-" if content is None else b"+" + len(content).to_bytes(8, "big") + content)
+    return digest.hexdigest()
+
+
+def _write_bundle(bundle_path: Path, blob: bytes) -> None:
+    """Atomically write a bundle so readers never see a partial file."""
+    atomic_write(bundle_path, blob, prefix=".bundle-")
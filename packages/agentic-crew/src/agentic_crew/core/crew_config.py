@@ -0,0 +1,151 @@
+"""Lazy crew configuration mapping returned by get_crew_config().
+
+Listing crews or showing a crew's name/description does not need the
+agents and tasks YAML or the knowledge directories. CrewConfig is a dict
+whose expensive fields are produced by loader callables on first access,
+so callers that only read cheap fields never pay for the rest.
+
+CrewConfig subclasses dict so existing runners, isinstance checks and
+``**config`` unpacking keep working. Any operation that exposes all
+values (iteration, items(), equality, copying, pickling) loads every
+pending field first.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+class CrewConfig(dict):
+    """Dict-compatible crew configuration with lazily loaded fields.
+
+    Example:
+        ```python
+        config = get_crew_config(config_dir, "analyzer")
+        config["description"]          # no agents/tasks YAML parsed yet
+        config.is_loaded("agents")     # False
+        config["agents"]               # parsed now, then kept
+        ```
+    """
+
+    def __init__(self, data: dict[str, Any], loaders: dict[str, Callable[[], Any]] | None = None):
+        """Initialize the config.
+
+        Args:
+            data: Fields available immediately.
+            loaders: Field name -> zero-argument callable producing its value.
+                     Each loader runs at most once, on first access.
+        """
+        super().__init__(data)
+        self._loaders: dict[str, Callable[[], Any]] = dict(loaders or {})
+        self._lock = threading.RLock()
+
+    def is_loaded(self, key: str) -> bool:
+        """Return True if the field has no pending loader."""
+        return key not in self._loaders
+
+    def _load(self, key: Any) -> None:
+        with self._lock:
+            loader = self._loaders.get(key)
+            if loader is None:
+                return
+            # Store before dropping the loader so a failed load can be retried
+            dict.__setitem__(self, key, loader())
+            del self._loaders[key]
+
+    def load_all(self) -> CrewConfig:
+        """Run every pending loader and return self."""
+        for key in list(self._loaders):
+            self._load(key)
+        return self
+
+    # Lookup ------------------------------------------------------------------
+
+    def __missing__(self, key: Any) -> Any:
+        if key in self._loaders:
+            self._load(key)
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._load(key)
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._loaders or super().__contains__(key)
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self._loaders)
+
+    # Whole-mapping views load everything -------------------------------------
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(super(CrewConfig, self.load_all()).keys()))
+
+    def keys(self):  # type: ignore[override]
+        return super(CrewConfig, self.load_all()).keys()
+
+    def values(self):  # type: ignore[override]
+        return super(CrewConfig, self.load_all()).values()
+
+    def items(self):  # type: ignore[override]
+        return super(CrewConfig, self.load_all()).items()
+
+    def __eq__(self, other: object) -> bool:
+        self.load_all()
+        if isinstance(other, CrewConfig):
+            other.load_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CrewConfig({super(CrewConfig, self.load_all()).__repr__()})"
+
+    def copy(self) -> dict[str, Any]:  # type: ignore[override]
+        """Return a plain dict copy with every field loaded."""
+        return dict(self.items())
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Loaders are closures; copies and pickles are plain dicts
+        return (dict, (dict(self.items()),))
+
+    # Mutation drops pending loaders for the affected keys --------------------
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._loaders.pop(key, None)
+            super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            if self._loaders.pop(key, None) is not None and not super().__contains__(key):
+                return
+            super().__delitem__(key)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._load(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[Any, Any]:
+        self.load_all()
+        return super().popitem()
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._load(key)
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaders.clear()
+            super().clear()
@@ -23,11 +23,29 @@ Usage:
 
 from __future__ import annotations
 
-import importlib
+import asyncio
+import contextlib
+import hashlib
+import importlib.util
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from agentic_crew.utils.cache import RACY_WINDOW_NS, atomic_write, cache_enabled, get_cache_dir
+from agentic_crew.utils.lru import LRUCache
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Iterator
+
+    from agentic_crew.core.process_pool import CrewProcessPool
     from agentic_crew.runners.base import BaseRunner
+    from agentic_crew.runners.events import CrewEvent
     from agentic_crew.runners.single_agent_runner import SingleAgentRunner
 
 # Framework detection cache
@@ -36,9 +54,21 @@ _framework_cache: dict[str, bool] = {}
 # Framework priority (first available wins)
 FRAMEWORK_PRIORITY = ["crewai", "langgraph", "strands"]
 
+# Maximum number of built crews kept for reuse by run_crew_auto()/decompose_crew(cache=True)
+BUILT_CREW_CACHE_SIZE = 32
+
+# (framework, fingerprint) -> _BuiltCrew
+_built_crews = LRUCache(BUILT_CREW_CACHE_SIZE)
+
 
 def is_framework_available(framework: str) -> bool:
-    """Check if a framework is installed and importable.
+    """Check if a framework is installed, without importing it.
+
+    Importing CrewAI alone pulls in LiteLLM and takes seconds, so
+    availability is decided with importlib.util.find_spec(); the real
+    import happens when a runner builds a crew. Results are persisted
+    across processes and reused while the sys.path directories (e.g.
+    site-packages) are unchanged.
 
     Args:
         framework: Framework name (crewai, langgraph, strands)
@@ -54,15 +84,80 @@ def is_framework_available(framework: str) -> bool:
         _framework_cache[framework] = False
         return False
 
-    try:
-        importlib.import_module(framework)
-        _framework_cache[framework] = True
+    # One lookup answers every framework, so detect them all together
+    detected = _read_detected_frameworks()
+    if detected is None:
+        detected = {name: _find_framework(name) for name in FRAMEWORK_PRIORITY}
+        _write_detected_frameworks(detected)
+    for name, available in detected.items():
+        _framework_cache.setdefault(name, available)
+    return _framework_cache[framework]
+
+
+def _find_framework(framework: str) -> bool:
+    """Locate a framework's top-level package without executing it."""
+    if sys.modules.get(framework) is not None:
         return True
-    except ImportError:
-        _framework_cache[framework] = False
+    try:
+        return importlib.util.find_spec(framework) is not None
+    except (ImportError, ValueError):
         return False
 
 
+def _detection_path() -> Path:
+    """Get the detection file for this interpreter and sys.path."""
+    key = hashlib.sha256(json.dumps([sys.executable, sys.path]).encode()).hexdigest()[:16]
+    return get_cache_dir("frameworks") / f"{key}.json"
+
+
+def _path_state() -> dict[str, int | None]:
+    """Record the mtime of every sys.path entry.
+
+    Installing or removing a distribution adds or removes entries in a
+    sys.path directory, which changes that directory's mtime.
+    """
+    state: dict[str, int | None] = {}
+    for entry in sys.path:
+        try:
+            state[entry or "."] = os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            state[entry or "."] = None
+    return state
+
+
+def _read_detected_frameworks() -> dict[str, bool] | None:
+    """Read persisted detection results if the environment is unchanged."""
+    if not cache_enabled():
+        return None
+    try:
+        with open(_detection_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("frameworks", {}).keys() != set(FRAMEWORK_PRIORITY)
+        or data.get("path_state") != _path_state()
+    ):
+        return None
+    return data["frameworks"]
+
+
+def _write_detected_frameworks(detected: dict[str, bool]) -> None:
+    """Persist detection results; skipped while sys.path entries are settling."""
+    if not cache_enabled():
+        return
+    state = _path_state()
+    cutoff_ns = time.time_ns() - RACY_WINDOW_NS
+    if any(mtime_ns is not None and mtime_ns >= cutoff_ns for mtime_ns in state.values()):
+        return
+
+    with contextlib.suppress(OSError):
+        payload = json.dumps({"frameworks": detected, "path_state": state})
+        atomic_write(_detection_path(), payload, prefix=".frameworks-")
+
+
 def detect_framework(preferred: str | None = None) -> str:
     """Detect the best available AI framework.
 
@@ -205,6 +300,7 @@ def is_cli_runner_available(profile: str) -> bool:
 def decompose_crew(
     crew_config: dict[str, Any],
     framework: str | None = None,
+    cache: bool = False,
 ) -> Any:
     """Decompose a crew configuration to a framework-specific crew.
 
@@ -215,6 +311,11 @@ def decompose_crew(
         crew_config: Crew configuration from loader.
         framework: Target framework or None for auto-detect.
                    If crew_config has required_framework, that takes precedence.
+        cache: Reuse a previously built crew for an identical config (see
+               crew_fingerprint). The returned object is then shared with
+               run_crew_auto() and other callers without any locking, so
+               only pass True if nothing runs it concurrently. By default
+               the crew is private to the caller.
 
     Returns:
         Framework-specific crew object ready to run.
@@ -222,6 +323,12 @@ def decompose_crew(
     Raises:
         RuntimeError: If required framework is not available.
     """
+    framework = _enforce_required_framework(crew_config, framework)
+    return _get_built_crew(crew_config, framework, cache).crew
+
+
+def _enforce_required_framework(crew_config: dict[str, Any], framework: str | None) -> str | None:
+    """Apply a config's required_framework to the requested framework."""
     # Check if crew config requires a specific framework
     required_framework = crew_config.get("required_framework")
 
@@ -240,8 +347,7 @@ def decompose_crew(
             )
         framework = required_framework
 
-    runner = get_runner(framework)
-    return runner.build_crew(crew_config)
+    return framework
 
 
 def _get_install_command(framework: str) -> str:
@@ -254,20 +360,95 @@ def _get_install_command(framework: str) -> str:
     return install_commands.get(framework, framework)
 
 
+# Built-crew cache ---------------------------------------------------------------
+
+
+@dataclass
+class _BuiltCrew:
+    """A built crew, the runner that built it, and a lease for running it."""
+
+    runner: BaseRunner
+    crew: Any
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    key: tuple[str, str] | None = None
+
+
+def crew_fingerprint(crew_config: dict[str, Any], framework: str) -> str:
+    """Compute a canonical fingerprint of a crew config for a framework.
+
+    Model selection lives in the config (the crew's llm section and each
+    agent's llm), so it is covered by the fingerprint. The full manifest
+    is left out: changes to other crews in the same package do not affect
+    this one.
+
+    Args:
+        crew_config: Crew configuration.
+        framework: Framework the crew is built for.
+
+    Returns:
+        Hex digest identifying the built crew.
+    """
+    relevant = {key: value for key, value in crew_config.items() if key != "manifest"}
+    canonical = json.dumps([framework, relevant], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def clear_crew_cache() -> None:
+    """Drop every cached built crew."""
+    _built_crews.clear()
+
+
+def crew_cache_info() -> dict[str, int]:
+    """Return hit/miss statistics for the built-crew cache."""
+    return _built_crews.info()
+
+
+def _get_built_crew(crew_config: dict[str, Any], framework: str | None, cache: bool) -> _BuiltCrew:
+    """Return a cached built crew, building (and caching) it on a miss.
+
+    Nothing is cached when caching is disabled by the caller, by the
+    config (``reusable: false``) or by the runner (reusable_crews).
+    """
+    use_cache = cache and crew_config.get("reusable", True)
+    key = None
+    if use_cache:
+        if framework is None or framework == "auto":
+            framework = detect_framework()
+        key = (framework, crew_fingerprint(crew_config, framework))
+        cached = _built_crews.get(key)
+        if cached is not None:
+            return cached
+
+    runner = get_runner(framework)
+    entry = _BuiltCrew(runner, runner.build_crew(crew_config))
+    if key is not None and runner.reusable_crews:
+        entry.key = key
+        _built_crews.put(key, entry)
+    return entry
+
+
 # Convenience function for simple use cases
 def run_crew_auto(
     crew_config: dict[str, Any],
     inputs: dict[str, Any] | None = None,
     framework: str | None = None,
+    cache: bool = True,
 ) -> str:
     """Run a crew using the best available framework.
 
+    Built crews are cached by config fingerprint, so repeated runs of the
+    same crew in one process skip rebuilding agents, tasks and LLMs. A
+    cached crew is run by one caller at a time; concurrent callers get a
+    freshly built crew.
+
     Args:
         crew_config: Crew configuration from loader.
         inputs: Optional inputs for the crew.
         framework: Optional framework override. If crew_config has
                    required_framework (from .crewai/.strands/.langgraph dir),
                    that takes precedence.
+        cache: Reuse a cached built crew. Pass False for crews that must
+               not keep state between runs.
 
     Returns:
         Crew output as string.
@@ -276,23 +457,303 @@ def run_crew_auto(
         RuntimeError: If required framework is not available.
         ValueError: If requested framework conflicts with required framework.
     """
-    # Check if crew config requires a specific framework
-    required_framework = crew_config.get("required_framework")
+    framework = _enforce_required_framework(crew_config, framework)
+    entry = _lease_built_crew(crew_config, framework, cache)
+    try:
+        return entry.runner.run(entry.crew, inputs or {})
+    finally:
+        entry.lock.release()
 
-    if required_framework:
-        if framework and framework != required_framework and framework != "auto":
-            raise ValueError(
-                f"Crew requires {required_framework} (defined in .{required_framework}/ directory) "
-                f"but {framework} was requested"
-            )
 
-        if not is_framework_available(required_framework):
-            raise RuntimeError(
-                f"Crew requires {required_framework} but it's not installed. "
-                f"Install with: pip install {_get_install_command(required_framework)}"
-            )
-        framework = required_framework
+async def run_crew_auto_async(
+    crew_config: dict[str, Any],
+    inputs: dict[str, Any] | None = None,
+    framework: str | None = None,
+    cache: bool = True,
+) -> str:
+    """Run a crew on the current event loop using the framework's async API.
 
-    runner = get_runner(framework)
-    crew = runner.build_crew(crew_config)
-    return runner.run(crew, inputs or {})
+    Same selection and caching rules as run_crew_auto(), but the crew is
+    executed with BaseRunner.arun(), so many crews can run concurrently on
+    one event loop without a blocked thread per crew. When a run executor
+    is set (see runners.base.use_executor), crews are also built there.
+
+    Cancelling the coroutine cancels the run. A crew whose run was
+    cancelled is dropped from the cache, since a thread-bound runner may
+    still be using it.
+
+    Args:
+        crew_config: Crew configuration from loader.
+        inputs: Optional inputs for the crew.
+        framework: Optional framework override. If crew_config has
+                   required_framework, that takes precedence.
+        cache: Reuse a cached built crew.
+
+    Returns:
+        Crew output as string.
+
+    Raises:
+        RuntimeError: If required framework is not available.
+        ValueError: If requested framework conflicts with required framework.
+    """
+    from agentic_crew.runners.base import run_executor, run_in_executor
+
+    framework = _enforce_required_framework(crew_config, framework)
+    if run_executor.get() is not None:
+        # Keep (possibly slow) crew builds off the event loop
+        lease = asyncio.ensure_future(run_in_executor(_lease_built_crew, crew_config, framework, cache))
+        try:
+            entry = await asyncio.shield(lease)
+        except asyncio.CancelledError:
+            # The build still completes in its thread; hand the crew back then
+            lease.add_done_callback(_release_lease)
+            raise
+    else:
+        entry = _lease_built_crew(crew_config, framework, cache)
+    cancelled = False
+    try:
+        return await entry.runner.arun(entry.crew, inputs or {})
+    except asyncio.CancelledError:
+        # A thread-bound run may still be using the crew; keep it leased
+        # and out of the cache instead of handing it to the next caller
+        cancelled = True
+        if entry.key is not None:
+            _built_crews.pop(entry.key)
+        raise
+    finally:
+        if not cancelled:
+            entry.lock.release()
+
+
+def stream_crew_auto(
+    crew_config: dict[str, Any],
+    inputs: dict[str, Any] | None = None,
+    framework: str | None = None,
+    cache: bool = True,
+) -> Iterator[CrewEvent]:
+    """Run a crew, yielding normalized progress events (see BaseRunner.stream).
+
+    Same selection and caching rules as run_crew_auto().
+
+    Args:
+        crew_config: Crew configuration from loader.
+        inputs: Optional inputs for the crew.
+        framework: Optional framework override. If crew_config has
+                   required_framework, that takes precedence.
+        cache: Reuse a cached built crew.
+
+    Yields:
+        CrewEvent objects; the last one has type "final".
+
+    Raises:
+        RuntimeError: If required framework is not available.
+        ValueError: If requested framework conflicts with required framework.
+    """
+    framework = _enforce_required_framework(crew_config, framework)
+    entry = _lease_built_crew(crew_config, framework, cache)
+    try:
+        yield from entry.runner.stream(entry.crew, inputs or {})
+    finally:
+        entry.lock.release()
+
+
+async def astream_crew_auto(
+    crew_config: dict[str, Any],
+    inputs: dict[str, Any] | None = None,
+    framework: str | None = None,
+    cache: bool = True,
+) -> AsyncIterator[CrewEvent]:
+    """Async variant of stream_crew_auto() (see BaseRunner.astream).
+
+    Args:
+        crew_config: Crew configuration from loader.
+        inputs: Optional inputs for the crew.
+        framework: Optional framework override.
+        cache: Reuse a cached built crew.
+
+    Yields:
+        CrewEvent objects; the last one has type "final".
+    """
+    framework = _enforce_required_framework(crew_config, framework)
+    entry = _lease_built_crew(crew_config, framework, cache)
+    try:
+        async for event in entry.runner.astream(entry.crew, inputs or {}):
+            yield event
+    finally:
+        entry.lock.release()
+
+
+def _lease_built_crew(crew_config: dict[str, Any], framework: str | None, cache: bool) -> _BuiltCrew:
+    """Return a built crew whose lock is held by the caller.
+
+    A cached crew that is already running elsewhere is not shared; the
+    caller gets a freshly built, uncached crew instead.
+    """
+    entry = _get_built_crew(crew_config, framework, cache)
+    if not entry.lock.acquire(blocking=False):
+        entry = _get_built_crew(crew_config, framework, cache=False)
+        entry.lock.acquire()
+    return entry
+
+
+def _release_lease(lease: asyncio.Future) -> None:
+    """Release a crew leased by a build whose caller went away."""
+    if not lease.cancelled() and lease.exception() is None:
+        lease.result().lock.release()
+
+
+# Batch execution ----------------------------------------------------------------
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one input in run_crew_batch().
+
+    Attributes:
+        index: Position of the input in the batch.
+        inputs: The inputs the crew ran with.
+        output: Crew output, or None if the run failed.
+        error: Error message, or None if the run succeeded.
+        duration_ms: Time spent running this input.
+    """
+
+    index: int
+    inputs: dict[str, Any]
+    output: str | None = None
+    error: str | None = None
+    duration_ms: int = 0
+
+    @property
+    def success(self) -> bool:
+        """Whether the crew ran without raising."""
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result in the CLI's JSON shape."""
+        data: dict[str, Any] = {"index": self.index, "success": self.success}
+        if self.success:
+            data["output"] = self.output
+        else:
+            data["error"] = self.error
+        data["duration_ms"] = self.duration_ms
+        return data
+
+
+# Marks a batch worker as finished in the result queue
+_WORKER_DONE = object()
+
+
+def run_crew_batch(
+    crew_config: dict[str, Any],
+    inputs_iter: Iterable[dict[str, Any]],
+    concurrency: int = 4,
+    framework: str | None = None,
+    pool: CrewProcessPool | None = None,
+) -> Iterator[BatchResult]:
+    """Run one crew over many inputs with bounded concurrency.
+
+    Each of up to ``concurrency`` worker threads builds the crew once (the
+    first may reuse run_crew_auto's cached crew) and runs it for one input
+    after another. Crews that keep state between runs (``reusable: false``
+    or a runner without reusable_crews) are built afresh for every input
+    instead. Inputs are consumed lazily, so the iterable may be a
+    generator over a large file.
+
+    With a pool, the threads hand each input to a worker process instead,
+    so CPU-bound crews run in parallel and a crashing run fails only its
+    own input.
+
+    Args:
+        crew_config: Crew configuration from loader.
+        inputs_iter: Inputs for each run.
+        concurrency: Maximum number of crews running at once.
+        framework: Optional framework override. If crew_config has
+                   required_framework, that takes precedence.
+        pool: Optional CrewProcessPool to run the crews in (see
+              agentic_crew.core.process_pool).
+
+    Yields:
+        BatchResult per input, in completion order. A crew that raises
+        produces a result with ``error`` set instead of ending the batch.
+        Closing the generator early stops new runs and waits for the
+        in-flight ones.
+
+    Raises:
+        RuntimeError: If required framework is not available.
+        ValueError: If concurrency is below 1 or the framework request
+                    conflicts with required_framework.
+        Exception: Anything raised while building the crew or reading
+                   inputs_iter.
+
+    Example:
+        ```python
+        species = [{"species": name} for name in ("otter", "beaver", "muskrat")]
+        for result in run_crew_batch(config, species, concurrency=8):
+            print(result.index, result.output if result.success else result.error)
+        ```
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    framework = _enforce_required_framework(crew_config, framework)
+
+    reusable = crew_config.get("reusable", True)
+    items = enumerate(inputs_iter)
+    items_lock = threading.Lock()
+    results: queue.SimpleQueue[Any] = queue.SimpleQueue()
+    stop = threading.Event()
+
+    def next_item() -> tuple[int, dict[str, Any]] | None:
+        with items_lock:
+            return None if stop.is_set() else next(items, None)
+
+    def worker() -> None:
+        entry: _BuiltCrew | None = None
+        try:
+            while (item := next_item()) is not None:
+                index, inputs = item
+                if entry is None and pool is None:
+                    entry = _lease_built_crew(crew_config, framework, cache=reusable)
+                start = time.monotonic()
+                try:
+                    if pool is not None:
+                        output = pool.run(crew_config, inputs, framework)
+                    elif entry is not None:
+                        output = entry.runner.run(entry.crew, inputs or {})
+                except Exception as e:
+                    results.put(BatchResult(index, inputs, error=str(e), duration_ms=_elapsed_ms(start)))
+                else:
+                    results.put(BatchResult(index, inputs, output=output, duration_ms=_elapsed_ms(start)))
+                if entry is not None and not (reusable and entry.runner.reusable_crews):
+                    # The crew kept this input's state (e.g. conversation history)
+                    entry.lock.release()
+                    entry = None
+        except Exception as e:
+            # Building the crew or reading the inputs failed; abort the batch
+            results.put(e)
+        finally:
+            if entry is not None:
+                entry.lock.release()
+            results.put(_WORKER_DONE)
+
+    workers = [threading.Thread(target=worker, name=f"agentic-crew-batch-{i}", daemon=True) for i in range(concurrency)]
+    for thread in workers:
+        thread.start()
+
+    running = len(workers)
+    try:
+        while running:
+            result = results.get()
+            if result is _WORKER_DONE:
+                running -= 1
+            elif isinstance(result, Exception):
+                raise result
+            else:
+                yield result
+    finally:
+        stop.set()
+        for thread in workers:
+            thread.join()
+
+
+def _elapsed_ms(start: float) -> int:
+    return int((time.monotonic() - start) * 1000)
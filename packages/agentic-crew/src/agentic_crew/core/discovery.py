@@ -6,15 +6,43 @@ Supports framework-specific configuration directories:
 - .strands/  - Strands-specific configurations
 
 The discovery order matches framework priority for auto-detection.
+Scan results are persisted in a discovery index (see discovery_index.py)
+so repeated CLI invocations only rescan directories that changed.
+
+Parsed YAML files (manifests, agents, tasks) are kept in a process-wide
+LRU cache validated by (mtime_ns, size), so repeated lookups in a
+long-lived process cost a stat instead of a YAML parse. Use
+invalidate_config_cache() to drop entries explicitly.
+
+get_crew_config() prefers an up-to-date compiled bundle (see bundle.py,
+written by `agentic-crew compile`) over the YAML sources.
+
+index_crews() maps crew names to the packages that define them from the
+manifests alone, so resolving a crew without its package does not parse
+every package's crew configs.
 """
 
 from __future__ import annotations
 
+import copy
+import logging
+import os
+import time
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from agentic_crew.core.bundle import load_bundle
+from agentic_crew.core.crew_config import CrewConfig
+from agentic_crew.core.discovery_index import ConfigLocation, WorkspaceScan, scan_workspace
+from agentic_crew.utils.cache import RACY_WINDOW_NS
+from agentic_crew.utils.files import load_yaml
+from agentic_crew.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
 # Framework directory names in priority order
 # .crew is framework-agnostic (can run on any available framework)
 # Framework-specific dirs enforce that framework
@@ -39,6 +67,13 @@ FRAMEWORK_TO_DIR: dict[str | None, str] = {
 }
 
 
+# Maximum number of parsed YAML files kept in memory
+CONFIG_CACHE_SIZE = 512
+
+# Absolute path -> ((mtime_ns, size), parsed data)
+_config_cache = LRUCache(CONFIG_CACHE_SIZE)
+
+
 def get_workspace_root() -> Path:
     """Get the workspace root directory.
 
@@ -52,9 +87,31 @@ def get_workspace_root() -> Path:
     return Path.cwd()
 
 
+def scan_crew_configs(workspace_root: Path | None = None) -> WorkspaceScan:
+    """Scan a workspace once for every package's framework config directories.
+
+    This is the single traversal behind discover_packages(),
+    discover_all_framework_configs() and list_crews(); those functions are
+    views over its result. The scan is backed by the persisted discovery
+    index, so unchanged packages are not rescanned.
+
+    Args:
+        workspace_root: Root of the workspace. If None, auto-detected.
+
+    Returns:
+        WorkspaceScan mapping package name -> {framework -> ConfigLocation}
+        (config_dir and manifest path), plus config dirs at the workspace
+        root. Framework is None for framework-agnostic .crew/ directories.
+    """
+    if workspace_root is None:
+        workspace_root = get_workspace_root()
+    return scan_workspace(workspace_root, DIR_TO_FRAMEWORK)
+
+
 def discover_packages(
     workspace_root: Path | None = None,
     framework: str | None = None,
+    scan: WorkspaceScan | None = None,
 ) -> dict[str, Path]:
     """Discover all packages with crew configuration directories.
 
@@ -62,44 +119,49 @@ def discover_packages(
         workspace_root: Root of the workspace. If None, auto-detected.
         framework: Optional framework to filter by (crewai, langgraph, strands).
                    If None, returns first found directory per package.
+        scan: A scan_crew_configs() result of workspace_root to reuse
+              instead of scanning again.
 
     Returns:
         Dict mapping package name to its config directory path.
     """
+    locations = _select_locations(workspace_root, framework, scan)
+    return {pkg_name: location.config_dir for pkg_name, location in locations.items()}
+
+
+def _select_locations(
+    workspace_root: Path | None,
+    framework: str | None,
+    scan: WorkspaceScan | None,
+) -> dict[str, ConfigLocation]:
+    """Pick each package's highest-priority config location accepted by framework."""
     if workspace_root is None:
         workspace_root = get_workspace_root()
+    if scan is None:
+        scan = scan_crew_configs(workspace_root)
 
-    packages = {}
-
-    # Determine which directories to look for
-    if framework:
-        dir_name = FRAMEWORK_TO_DIR.get(framework)
-        dirs_to_check = [dir_name] if dir_name else FRAMEWORK_DIRS
+    # Determine which frameworks to accept (a framework filter excludes .crew/)
+    if framework and framework in FRAMEWORK_TO_DIR:
+        accept: set[str | None] = {framework}
     else:
-        dirs_to_check = FRAMEWORK_DIRS
+        accept = set(DIR_TO_FRAMEWORK.values())
 
-    # Check packages/ directory
-    packages_dir = workspace_root / "packages"
-    if packages_dir.exists():
-        for pkg_dir in packages_dir.iterdir():
-            if not pkg_dir.is_dir():
-                continue
-
-            # Try each framework directory in priority order
-            for dir_name in dirs_to_check:
-                config_dir = pkg_dir / dir_name
-                if config_dir.exists() and (config_dir / "manifest.yaml").exists():
-                    packages[pkg_dir.name] = config_dir
-                    break  # Use first found (highest priority)
+    packages: dict[str, ConfigLocation] = {}
+
+    # Locations are already in priority order, so the first accepted one wins
+    for pkg_name, locations in scan.packages.items():
+        for config_framework, location in locations.items():
+            if config_framework in accept:
+                packages[pkg_name] = location
+                break
 
     # Also check workspace root for standalone projects
-    for dir_name in dirs_to_check:
-        config_dir = workspace_root / dir_name
-        if config_dir.exists() and (config_dir / "manifest.yaml").exists():
+    for config_framework, location in scan.root.items():
+        if config_framework in accept:
             # Use the workspace name or a default
             pkg_name = workspace_root.name or "default"
             if pkg_name not in packages:
-                packages[pkg_name] = config_dir
+                packages[pkg_name] = location
             break
 
     return packages
@@ -107,6 +169,7 @@ def discover_packages(
 
 def discover_all_framework_configs(
     workspace_root: Path | None = None,
+    scan: WorkspaceScan | None = None,
 ) -> dict[str, dict[str | None, Path]]:
     """Discover all framework-specific config directories for all packages.
 
@@ -114,6 +177,8 @@ def discover_all_framework_configs(
 
     Args:
         workspace_root: Root of the workspace. If None, auto-detected.
+        scan: A scan_crew_configs() result of workspace_root to reuse
+              instead of scanning again.
 
     Returns:
         Dict mapping package name to dict of framework -> config_dir.
@@ -122,42 +187,79 @@ def discover_all_framework_configs(
     """
     if workspace_root is None:
         workspace_root = get_workspace_root()
+    if scan is None:
+        scan = scan_crew_configs(workspace_root)
 
     packages: dict[str, dict[str | None, Path]] = {}
 
     # Check packages/ directory
-    packages_dir = workspace_root / "packages"
-    if packages_dir.exists():
-        for pkg_dir in packages_dir.iterdir():
-            if not pkg_dir.is_dir():
-                continue
-
-            pkg_configs: dict[str | None, Path] = {}
-            for dir_name in FRAMEWORK_DIRS:
-                config_dir = pkg_dir / dir_name
-                if config_dir.exists() and (config_dir / "manifest.yaml").exists():
-                    framework = DIR_TO_FRAMEWORK[dir_name]
-                    pkg_configs[framework] = config_dir
-
-            if pkg_configs:
-                packages[pkg_dir.name] = pkg_configs
+    for pkg_name, locations in scan.packages.items():
+        if locations:
+            packages[pkg_name] = {fw: location.config_dir for fw, location in locations.items()}
 
     # Also check workspace root
-    root_configs: dict[str | None, Path] = {}
-    for dir_name in FRAMEWORK_DIRS:
-        config_dir = workspace_root / dir_name
-        if config_dir.exists() and (config_dir / "manifest.yaml").exists():
-            framework = DIR_TO_FRAMEWORK[dir_name]
-            root_configs[framework] = config_dir
-
-    if root_configs:
+    if scan.root:
         pkg_name = workspace_root.name or "default"
         if pkg_name not in packages:
-            packages[pkg_name] = root_configs
+            packages[pkg_name] = {fw: location.config_dir for fw, location in scan.root.items()}
 
     return packages
 
 
+def _load_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, reusing the cached result while the file is unchanged.
+
+    Callers receive their own copy, so mutating the result never leaks
+    into the cache.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        yaml.YAMLError: If the file is not valid YAML.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _config_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
+    with open(key) as f:
+        data = load_yaml(f)
+
+    # Files modified this recently are re-parsed next time
+    if st.st_mtime_ns < time.time_ns() - RACY_WINDOW_NS:
+        _config_cache.put(key, (stamp, copy.deepcopy(data)))
+    else:
+        _config_cache.pop(key)
+    return data
+
+
+def invalidate_config_cache(path: Path | None = None) -> int:
+    """Drop cached parsed YAML files.
+
+    Args:
+        path: A file, or a directory whose files should be dropped
+              (e.g., a .crewai/ directory). If None, clears the whole cache.
+
+    Returns:
+        Number of cache entries removed.
+    """
+    if path is None:
+        removed = len(_config_cache)
+        _config_cache.clear()
+        return removed
+
+    target = os.path.abspath(path)
+    prefix = target.rstrip(os.sep) + os.sep
+    return _config_cache.discard_where(lambda key: key == target or str(key).startswith(prefix))
+
+
+def config_cache_info() -> dict[str, int]:
+    """Return hit/miss statistics for the parsed-config cache."""
+    return _config_cache.info()
+
+
 def load_manifest(crewai_dir: Path) -> dict[str, Any]:
     """Load a package's CrewAI manifest.
 
@@ -167,10 +269,44 @@ def load_manifest(crewai_dir: Path) -> dict[str, Any]:
     Returns:
         Parsed manifest as a dictionary.
     """
-    manifest_path = crewai_dir / "manifest.yaml"
-    with open(manifest_path) as f:
-        result = yaml.safe_load(f)
-        return result if result else {}
+    result = _load_yaml_file(crewai_dir / "manifest.yaml")
+    return result if result else {}
+
+
+def index_crews(packages: Mapping[str, Path]) -> dict[str, list[str]]:
+    """Map crew names to the packages whose manifests define them.
+
+    Only manifests are read (from an up-to-date compiled bundle when there
+    is one, else through the parsed-config cache). Packages whose manifest
+    cannot be read are left out with a warning.
+
+    Args:
+        packages: Package name -> config directory, as from discover_packages().
+
+    Returns:
+        Crew name -> names of the packages defining it, in package order.
+        More than one package means the name is ambiguous.
+    """
+    index: dict[str, list[str]] = {}
+    for pkg_name, config_dir in packages.items():
+        bundle = load_bundle(config_dir)
+        try:
+            manifest = bundle["manifest"] if bundle else load_manifest(config_dir)
+        except (OSError, yaml.YAMLError) as e:
+            logger.warning("Skipping package '%s' in crew index: %s", pkg_name, e)
+            continue
+        crews = manifest.get("crews") if isinstance(manifest, dict) else None
+        for crew_name in crews if isinstance(crews, dict) else {}:
+            index.setdefault(crew_name, []).append(pkg_name)
+    return index
+
+
+def _load_optional_yaml(path: Path) -> Any:
+    """Load a YAML file through the cache, returning {} if it does not exist."""
+    try:
+        return _load_yaml_file(path)
+    except FileNotFoundError:
+        return {}
 
 
 def get_framework_from_config_dir(config_dir: Path) -> str | None:
@@ -186,22 +322,29 @@ def get_framework_from_config_dir(config_dir: Path) -> str | None:
     return DIR_TO_FRAMEWORK.get(dir_name)
 
 
-def get_crew_config(config_dir: Path, crew_name: str) -> dict:
+def get_crew_config(config_dir: Path, crew_name: str) -> CrewConfig:
     """Load a specific crew's configuration.
 
+    Only the manifest is read up front. The agents and tasks YAML and the
+    knowledge paths are loaded on first access to those keys, so callers
+    that only need name/description/framework stay cheap. If the config
+    directory has an up-to-date compiled bundle, everything comes from the
+    bundle and no YAML is parsed.
+
     Args:
         config_dir: Path to the config directory (.crewai/, .strands/, .langgraph/).
         crew_name: Name of the crew to load.
 
     Returns:
-        Dict with agents, tasks, knowledge_paths, and required_framework.
-        The required_framework field indicates which framework MUST be used
-        if the config is in a framework-specific directory.
+        CrewConfig (a dict) with agents, tasks, knowledge_paths, and
+        required_framework. The required_framework field indicates which
+        framework MUST be used if the config is in a framework-specific directory.
 
     Raises:
         ValueError: If crew not found in manifest.
     """
-    manifest = load_manifest(config_dir)
+    bundle = load_bundle(config_dir)
+    manifest = bundle["manifest"] if bundle else load_manifest(config_dir)
     crews = manifest.get("crews", {})
     crew_config = crews.get(crew_name)
 
@@ -209,19 +352,23 @@ def get_crew_config(config_dir: Path, crew_name: str) -> dict:
         available = list(crews.keys())
         raise ValueError(f"Crew '{crew_name}' not found. Available: {available}")
 
-    # Load agents and tasks YAML
-    agents_path = config_dir / crew_config["agents"]
-    tasks_path = config_dir / crew_config["tasks"]
-
-    agents = yaml.safe_load(agents_path.read_text()) if agents_path.exists() else {}
-    tasks = yaml.safe_load(tasks_path.read_text()) if tasks_path.exists() else {}
-
-    # Resolve knowledge paths
-    knowledge_paths = []
-    for kp in crew_config.get("knowledge", []):
-        full_path = config_dir / kp
-        if full_path.exists():
-            knowledge_paths.append(full_path)
+    compiled = bundle["crews"].get(crew_name) if bundle else None
+    if compiled is not None:
+        loaders = {
+            "agents": lambda: compiled["agents"],
+            "tasks": lambda: compiled["tasks"],
+            "knowledge_paths": lambda: [config_dir / kp for kp in compiled["knowledge_paths"]],
+        }
+    else:
+        # Agents and tasks YAML are parsed on first access
+        agents_path = config_dir / crew_config["agents"]
+        tasks_path = config_dir / crew_config["tasks"]
+        knowledge = list(crew_config.get("knowledge", []))
+        loaders = {
+            "agents": lambda: _load_optional_yaml(agents_path),
+            "tasks": lambda: _load_optional_yaml(tasks_path),
+            "knowledge_paths": lambda: _resolve_knowledge_paths(config_dir, knowledge),
+        }
 
     # Determine required framework from directory name
     # If config is in .crewai/, it MUST run on CrewAI, etc.
@@ -244,31 +391,50 @@ def get_crew_config(config_dir: Path, crew_name: str) -> dict:
     # Get LLM config from manifest
     llm_config = manifest.get("llm", crew_config.get("llm", {}))
 
-    return {
-        "name": crew_name,
-        "description": crew_config.get("description", ""),
-        "agents": agents,
-        "tasks": tasks,
-        "knowledge_paths": knowledge_paths,
-        "manifest": manifest,
-        "config_dir": config_dir,
-        # Framework enforcement
-        "required_framework": required_framework,
-        "preferred_framework": manifest_framework,
-        # LLM configuration
-        "llm": llm_config,
-    }
+    return CrewConfig(
+        {
+            "name": crew_name,
+            "description": crew_config.get("description", ""),
+            "manifest": manifest,
+            "config_dir": config_dir,
+            # Framework enforcement
+            "required_framework": required_framework,
+            "preferred_framework": manifest_framework,
+            # LLM configuration
+            "llm": llm_config,
+            # Whether run_crew_auto() may reuse a built crew across runs
+            "reusable": crew_config.get("reusable", True),
+            # Runner-specific multi-agent execution (currently Strands)
+            "multi_agent": crew_config.get("multi_agent", False),
+        },
+        loaders=loaders,
+    )
+
+
+def _resolve_knowledge_paths(config_dir: Path, knowledge: list[str]) -> list[Path]:
+    """Resolve manifest knowledge entries to existing paths."""
+    knowledge_paths = []
+    for kp in knowledge:
+        full_path = config_dir / kp
+        if full_path.exists():
+            knowledge_paths.append(full_path)
+    return knowledge_paths
 
 
 def list_crews(
     package_name: str | None = None,
     framework: str | None = None,
+    workspace_root: Path | None = None,
 ) -> dict[str, list[dict]]:
     """List all available crews, optionally filtered by package or framework.
 
+    Crews come from the workspace scan, which records what each manifest
+    declares, so unchanged manifests are not parsed again.
+
     Args:
         package_name: If provided, only list crews for this package.
         framework: If provided, only list crews that can run on this framework.
+        workspace_root: Root of the workspace. If None, auto-detected.
 
     Returns:
         Dict mapping package name to list of crew info dicts.
@@ -277,24 +443,26 @@ def list_crews(
         - description: Crew description
         - required_framework: Framework required (if in framework-specific dir)
     """
-    packages = discover_packages(framework=framework)
     result = {}
 
-    for pkg_name, config_dir in packages.items():
+    for pkg_name, location in _select_locations(workspace_root, framework, None).items():
         if package_name and pkg_name != package_name:
             continue
 
-        manifest = load_manifest(config_dir)
-        required_framework = get_framework_from_config_dir(config_dir)
+        declared = location.crews
+        if declared is None:
+            # The scan could not read the manifest; load it directly to surface the error
+            declared = load_manifest(location.config_dir).get("crews", {})
+        required_framework = get_framework_from_config_dir(location.config_dir)
 
         crews = []
-        for crew_name, crew_config in manifest.get("crews", {}).items():
+        for crew_name, crew_info in declared.items():
             crews.append(
                 {
                     "name": crew_name,
-                    "description": crew_config.get("description", ""),
+                    "description": crew_info.get("description", ""),
                     "required_framework": required_framework,
-                    "preferred_framework": crew_config.get("preferred_framework"),
+                    "preferred_framework": crew_info.get("preferred_framework"),
                 }
             )
         result[pkg_name] = crews
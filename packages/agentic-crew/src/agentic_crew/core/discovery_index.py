@@ -0,0 +1,293 @@
+"""Persistent discovery index - avoids rescanning packages/ on every CLI call.
+
+The index records, per workspace, which config directories (.crew/,
+.crewai/, ...) exist for each package and whether they contain a
+manifest.yaml, together with the mtimes of the directories whose
+contents determine that answer:
+
+- packages/              -> which packages exist
+- packages/<pkg>/        -> which config directories exist in the package
+- packages/<pkg>/.crew/  -> whether manifest.yaml exists in the config dir
+
+It also records the crews each manifest declares (name, description and
+preferred framework), keyed by the manifest's (mtime_ns, size), so
+listing crews needs no YAML parse while the manifests are unchanged.
+
+Refreshing an entry costs one os.scandir() of the package directory (the
+listing's d_type tells us which config directories exist without a stat
+per candidate) plus one stat per config directory and its manifest.
+On the next scan only the entries whose mtimes changed are refreshed,
+and only the manifests whose stamps changed are re-parsed (a manifest
+can be rewritten in place without its directory's mtime moving, so each
+manifest costs a stat on every scan). Mtimes that fall too close to the time of a scan are not trusted, because
+a directory can change again within the filesystem's timestamp
+granularity without its mtime moving; such entries are rechecked on
+every scan until they settle (the same "racy timestamp" rule git uses).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import stat
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from agentic_crew.utils.cache import RACY_WINDOW_NS, atomic_write, cache_enabled, get_cache_dir
+from agentic_crew.utils.files import load_yaml
+
+INDEX_VERSION = 2
+MANIFEST_NAME = "manifest.yaml"
+
+
+@dataclass(frozen=True)
+class ConfigLocation:
+    """A config directory that contains a manifest.
+
+    Attributes:
+        config_dir: The config directory (.crew/, .crewai/, ...).
+        manifest: Path to its manifest.yaml.
+        crews: Crew name -> {"description", "preferred_framework"} as
+            declared by the manifest, or None if the manifest could not be
+            read.
+    """
+
+    config_dir: Path
+    manifest: Path
+    crews: dict[str, dict[str, Any]] | None = field(default=None, compare=False)
+
+
+@dataclass
+class WorkspaceScan:
+    """Result of a single traversal of a workspace.
+
+    Both mappings are keyed by framework (None for the agnostic .crew/
+    directory) and ordered by directory priority.
+
+    Attributes:
+        packages: Package name -> {framework -> ConfigLocation}.
+        root: Config directories at the workspace root.
+    """
+
+    packages: dict[str, dict[str | None, ConfigLocation]] = field(default_factory=dict)
+    root: dict[str | None, ConfigLocation] = field(default_factory=dict)
+
+
+def get_index_path(workspace_root: Path) -> Path:
+    """Get the index file used for a workspace root."""
+    key = hashlib.sha256(os.path.abspath(workspace_root).encode()).hexdigest()[:16]
+    return get_cache_dir("discovery") / f"{key}.json"
+
+
+def scan_workspace(workspace_root: Path, dir_frameworks: Mapping[str, str | None]) -> WorkspaceScan:
+    """Find config directories in a workspace, consulting the persisted index.
+
+    Args:
+        workspace_root: Root of the workspace.
+        dir_frameworks: Config directory name -> framework, in priority order.
+
+    Returns:
+        WorkspaceScan with config directories that contain a manifest.yaml.
+    """
+    dir_names = list(dir_frameworks)
+    use_index = cache_enabled()
+    index_path = get_index_path(workspace_root)
+    previous = _read_index(index_path, workspace_root, dir_names) if use_index else None
+    # Directory mtimes newer than this are not recorded
+    cutoff_ns = time.time_ns() - RACY_WINDOW_NS
+    dirty = previous is None
+
+    packages_dir = workspace_root / "packages"
+    packages_mtime = _dir_mtime_ns(packages_dir)
+    old_packages: dict[str, Any] = previous["packages"] if previous else {}
+
+    if previous and packages_mtime is not None and previous["packages_mtime_ns"] == packages_mtime:
+        names = list(old_packages)
+    else:
+        names = _list_subdirs(packages_dir)
+        dirty = True
+
+    packages: dict[str, Any] = {}
+    for name in names:
+        pkg_dir = packages_dir / name
+        entry = old_packages.get(name)
+        if entry is None or not _entry_is_fresh(pkg_dir, entry):
+            entry = _scan_holder(pkg_dir, dir_names, cutoff_ns)
+            dirty = True
+        dirty |= _refresh_crews(pkg_dir, entry, cutoff_ns)
+        packages[name] = entry
+
+    root_entry = previous["root"] if previous else None
+    if root_entry is None or not _entry_is_fresh(workspace_root, root_entry):
+        root_entry = _scan_holder(workspace_root, dir_names, cutoff_ns)
+        dirty = True
+    dirty |= _refresh_crews(workspace_root, root_entry, cutoff_ns)
+
+    if use_index and dirty:
+        _write_index(
+            index_path,
+            {
+                "version": INDEX_VERSION,
+                "workspace_root": os.path.abspath(workspace_root),
+                "dir_names": dir_names,
+                "packages_mtime_ns": _trusted(packages_mtime, cutoff_ns),
+                "packages": packages,
+                "root": root_entry,
+            },
+        )
+
+    return WorkspaceScan(
+        packages={name: _locations(packages_dir / name, entry, dir_frameworks) for name, entry in packages.items()},
+        root=_locations(workspace_root, root_entry, dir_frameworks),
+    )
+
+
+def _dir_mtime_ns(path: Path) -> int | None:
+    """Return a directory's mtime in nanoseconds, or None if it is not a directory."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns if stat.S_ISDIR(st.st_mode) else None
+
+
+def _trusted(mtime_ns: int | None, cutoff_ns: int) -> int | None:
+    """Drop mtimes too recent to prove that nothing changed since."""
+    if mtime_ns is None or mtime_ns >= cutoff_ns:
+        return None
+    return mtime_ns
+
+
+def _list_subdirs(directory: Path) -> list[str]:
+    """List subdirectory names, sorted for stable output."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return []
+
+
+def _scan_holder(holder: Path, dir_names: list[str], cutoff_ns: int) -> dict[str, Any]:
+    """Scan a package (or the workspace root) for config directories."""
+    # Stat the holder before its contents so a concurrent change is caught next time
+    entry: dict[str, Any] = {"mtime_ns": _trusted(_dir_mtime_ns(holder), cutoff_ns), "configs": {}}
+    try:
+        with os.scandir(holder) as entries:
+            present = {e.name for e in entries if e.name in dir_names and e.is_dir()}
+    except OSError:
+        return entry
+
+    for dir_name in dir_names:
+        if dir_name not in present:
+            continue
+        config_dir = holder / dir_name
+        entry["configs"][dir_name] = {
+            "mtime_ns": _trusted(_dir_mtime_ns(config_dir), cutoff_ns),
+            "manifest": os.path.exists(config_dir / MANIFEST_NAME),
+        }
+    return entry
+
+
+def _refresh_crews(holder: Path, entry: dict[str, Any], cutoff_ns: int) -> bool:
+    """Re-read the crews of manifests whose stamps changed.
+
+    Returns:
+        True if the entry was updated.
+    """
+    changed = False
+    for dir_name, config in entry.get("configs", {}).items():
+        if not config.get("manifest"):
+            continue
+        manifest = holder / dir_name / MANIFEST_NAME
+        try:
+            st = os.stat(manifest)
+        except OSError:
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+        if config.get("manifest_stamp") == stamp and "crews" in config:
+            continue
+        config["crews"] = _read_crews(manifest)
+        # Manifests modified this recently are re-read next time
+        config["manifest_stamp"] = stamp if _trusted(st.st_mtime_ns, cutoff_ns) is not None else None
+        changed = True
+    return changed
+
+
+def _read_crews(manifest: Path) -> dict[str, dict[str, Any]] | None:
+    """Summarize the crews a manifest declares, or None if it cannot be read."""
+    try:
+        with open(manifest) as f:
+            data = load_yaml(f)
+    except (OSError, yaml.YAMLError):
+        return None
+    crews = data.get("crews") if isinstance(data, dict) else None
+    if not isinstance(crews, dict):
+        return {}
+    summaries = {}
+    for name, crew in crews.items():
+        crew = crew if isinstance(crew, dict) else {}
+        summaries[str(name)] = {
+            "description": crew.get("description", ""),
+            "preferred_framework": crew.get("preferred_framework"),
+        }
+    return summaries
+
+
+def _entry_is_fresh(holder: Path, entry: dict[str, Any]) -> bool:
+    """Check whether a recorded entry still matches the directories on disk."""
+    recorded = entry.get("mtime_ns")
+    if recorded is None or _dir_mtime_ns(holder) != recorded:
+        return False
+    for dir_name, config in entry.get("configs", {}).items():
+        recorded = config.get("mtime_ns")
+        if recorded is None or _dir_mtime_ns(holder / dir_name) != recorded:
+            return False
+    return True
+
+
+def _locations(
+    holder: Path,
+    entry: dict[str, Any],
+    dir_frameworks: Mapping[str, str | None],
+) -> dict[str | None, ConfigLocation]:
+    """Config directories of an entry that contain a manifest, in priority order."""
+    configs = entry.get("configs", {})
+    locations: dict[str | None, ConfigLocation] = {}
+    for dir_name, framework in dir_frameworks.items():
+        config = configs.get(dir_name, {})
+        if config.get("manifest"):
+            config_dir = holder / dir_name
+            locations[framework] = ConfigLocation(config_dir, config_dir / MANIFEST_NAME, config.get("crews"))
+    return locations
+
+
+def _read_index(index_path: Path, workspace_root: Path, dir_names: list[str]) -> dict[str, Any] | None:
+    """Read a persisted index, returning None if missing, corrupt or stale."""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != INDEX_VERSION
+        or data.get("workspace_root") != os.path.abspath(workspace_root)
+        or data.get("dir_names") != dir_names
+        or not isinstance(data.get("packages"), dict)
+    ):
+        return None
+    return data
+
+
+def _write_index(index_path: Path, data: dict[str, Any]) -> None:
+    """Atomically persist the index; failures are ignored (the index is only a cache)."""
+    with contextlib.suppress(OSError):
+        atomic_write(index_path, json.dumps(data), prefix=".discovery-")
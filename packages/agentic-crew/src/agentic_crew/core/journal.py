@@ -0,0 +1,182 @@
+"""Durable journal of a manager workflow run, for resuming failed runs.
+
+ManagerAgent.run() records the workflow arguments and every completed
+delegation in an append-only JSON-lines file per run id. ManagerAgent.resume()
+runs the workflow again with the same arguments, answering each delegation
+already in the journal with its recorded output, so only the delegations
+that had not finished are paid for again.
+
+Delegations are matched by content (crew role, framework and inputs) and by
+how many identical delegations came before them in the run, so replay works
+for hand-written execute_workflow() code as well as run_workflow() DAGs, as
+long as the workflow issues the same delegations given the same outputs.
+
+Record types, one JSON object per line:
+
+    {"type": "start", "run_id", "task", "kwargs", "time"}
+    {"type": "delegation", "key", "role", "output", "time"}
+    {"type": "finish", "output", "time"}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from agentic_crew.utils.cache import get_cache_dir
+
+_RUN_ID = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+@dataclass
+class JournalState:
+    """What a journal says about a run.
+
+    Attributes:
+        task: The workflow task the run started with.
+        kwargs: Extra execute_workflow() arguments.
+        delegations: Delegation key -> recorded output.
+        output: Final workflow output if the run finished, else None.
+    """
+
+    task: Any
+    kwargs: dict[str, Any]
+    delegations: dict[str, str] = field(default_factory=dict)
+    output: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the run completed."""
+        return self.output is not None
+
+
+class WorkflowJournal:
+    """Append-only journal file for one workflow run.
+
+    Attributes:
+        run_id: Identifier of the run.
+        path: Journal file location.
+    """
+
+    def __init__(self, run_id: str, directory: Path | None = None):
+        """Initialize the journal (the file is created by start()).
+
+        Args:
+            run_id: Identifier of the run; letters, digits, "_", "-", ".".
+            directory: Journal directory (default: the "runs" subdirectory
+                of the agentic-crew cache).
+
+        Raises:
+            ValueError: If run_id contains other characters.
+        """
+        if not _RUN_ID.match(run_id):
+            raise ValueError(f"Invalid run id {run_id!r}")
+        self.run_id = run_id
+        self.path = (directory or get_cache_dir("runs")) / f"{run_id}.jsonl"
+        self._lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Whether the run has been started."""
+        return self.path.exists()
+
+    def start(self, task: Any, kwargs: dict[str, Any]) -> None:
+        """Create the journal and record the workflow arguments.
+
+        Raises:
+            FileExistsError: If a journal for this run id already exists.
+            TypeError: If the arguments are not JSON-serializable.
+        """
+        record = {"type": "start", "run_id": self.run_id, "task": task, "kwargs": kwargs, "time": time.time()}
+        try:
+            line = json.dumps(record)
+        except TypeError as e:
+            raise TypeError(f"Workflow arguments must be JSON-serializable to be journaled: {e}") from e
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "x", encoding="utf-8") as f:
+            self._write(f, line)
+
+    def record(self, key: str, role: str, output: str) -> None:
+        """Record a completed delegation."""
+        self._append({"type": "delegation", "key": key, "role": role, "output": output, "time": time.time()})
+
+    def finish(self, output: str) -> None:
+        """Record the final workflow output."""
+        self._append({"type": "finish", "output": output, "time": time.time()})
+
+    def load(self) -> JournalState:
+        """Read the journal.
+
+        A partially written last line (from a crash mid-write) is ignored.
+
+        Raises:
+            FileNotFoundError: If the run was never started.
+            ValueError: If the journal has no start record.
+        """
+        state: JournalState | None = None
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.get("type") == "start":
+                    state = JournalState(task=record["task"], kwargs=record.get("kwargs") or {})
+                elif state is not None and record.get("type") == "delegation":
+                    state.delegations[record["key"]] = record["output"]
+                elif state is not None and record.get("type") == "finish":
+                    state.output = record["output"]
+        if state is None:
+            raise ValueError(f"Journal {self.path} has no start record")
+        return state
+
+    def _append(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record)
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            self._write(f, line)
+
+    @staticmethod
+    def _write(f: Any, line: str) -> None:
+        # Durable before the delegation counts as done
+        f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+class JournalSession:
+    """Matches a run's delegations against a journal while it executes."""
+
+    def __init__(self, journal: WorkflowJournal, replay: dict[str, str] | None = None):
+        self.journal = journal
+        self.replayed = 0
+        self._replay = replay or {}
+        self._seen: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def key(self, role: str, framework: str | None, inputs: dict[str, Any]) -> str:
+        """Claim the key of the next delegation with this content."""
+        canonical = json.dumps([role, framework, inputs], sort_keys=True, default=str)
+        digest = hashlib.sha256(canonical.encode()).hexdigest()
+        with self._lock:
+            occurrence = self._seen[digest]
+            self._seen[digest] += 1
+        return f"{digest}:{occurrence}"
+
+    def replay(self, key: str) -> str | None:
+        """Return the journaled output for a delegation key, if any."""
+        output = self._replay.get(key)
+        if output is not None:
+            with self._lock:
+                self.replayed += 1
+        return output
+
+    def record(self, key: str, role: str, output: str) -> None:
+        """Journal a completed delegation."""
+        self.journal.record(key, role, output)
@@ -37,20 +37,132 @@ Example:
                 "assets": asset_result,
             })
     ```
+
+The same choreography can be declared as a DAG with run_workflow() (see
+agentic_crew.core.workflow), which also enforces concurrency limits and
+reports the critical path.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
-from agentic_crew.core.decomposer import run_crew_auto
-from agentic_crew.core.discovery import discover_packages, get_crew_config
+from agentic_crew.config.llm import DEFAULT_MODEL, resolve_llm
+from agentic_crew.core.decomposer import crew_fingerprint, detect_framework, run_crew_auto, run_crew_auto_async
+from agentic_crew.core.discovery import discover_packages, get_crew_config, index_crews
+from agentic_crew.core.journal import JournalSession, WorkflowJournal
+from agentic_crew.core.process_pool import CrewProcessPool
+from agentic_crew.core.result_store import ResultStore
+from agentic_crew.core.workflow import FAIL_FAST, WorkflowResult, WorkflowStep, run_workflow
+from agentic_crew.runners.base import DeadlineExceeded, remaining_time, use_deadline, use_executor
 
 logger = logging.getLogger(__name__)
 
+# Threads in a manager's executor unless configured otherwise
+DEFAULT_MAX_WORKERS = 8
+
+# Journal of the workflow run the current delegations belong to
+_journal_session: contextvars.ContextVar[JournalSession | None] = contextvars.ContextVar(
+    "journal_session", default=None
+)
+
+
+@dataclass
+class _Recall:
+    """A delegation's lookup in the run journal and the result store."""
+
+    session: JournalSession | None = None
+    journal_key: str = ""
+    store_key: str | None = None
+    output: str | None = None
+    replayed: bool = False
+
+
+@dataclass
+class RoleStats:
+    """Delegation counters for one crew role.
+
+    Attributes:
+        queued: Delegations waiting for a free slot of the role's limit.
+        running: Delegations currently running.
+        completed: Delegations that returned a result.
+        failed: Delegations that raised.
+        cancelled: Delegations cancelled or timed out while queued or running.
+        max_queued: Highest queue depth seen.
+        wait_ms: Total time delegations spent queued.
+    """
+
+    queued: int = 0
+    running: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    max_queued: int = 0
+    wait_ms: int = 0
+
+
+class _MeteredExecutor(ThreadPoolExecutor):
+    """Thread pool that tracks how many jobs wait for a free thread."""
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers, thread_name_prefix="agentic-crew-manager")
+        self._counts_lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.max_queued = 0
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future:
+        with self._counts_lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        def call() -> Any:
+            with self._counts_lock:
+                self.queued -= 1
+                self.active += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._counts_lock:
+                    self.active -= 1
+
+        return super().submit(call)
+
+
+def _finished_output(run: asyncio.Future) -> str | None:
+    """Output of a delegation future if it succeeded, else None."""
+    if run.done() and not run.cancelled() and run.exception() is None:
+        return run.result()
+    return None
+
+
+def _resolved_llms(crew_config: dict[str, Any]) -> list[list[str] | None]:
+    """Provider and model each agent's LLM resolves to in this environment.
+
+    Which provider serves a model depends on the API keys set (see
+    resolve_llm), which the crew fingerprint does not cover.
+    """
+
+    def model(llm: Any) -> str | None:
+        return llm.get("model") if isinstance(llm, dict) else llm
+
+    default = model(crew_config.get("llm")) or DEFAULT_MODEL
+    models = {model(agent.get("llm")) or default for agent in (crew_config.get("agents") or {}).values()}
+    resolved: list[list[str] | None] = []
+    for name in sorted(models or {default}):
+        choice = resolve_llm(name)
+        resolved.append([choice[0].value, choice[1]] if choice else None)
+    return resolved
+
 
 class ManagerAgent:
     """Base class for hierarchical manager agents.
@@ -58,10 +170,42 @@ class ManagerAgent:
     A manager agent orchestrates multiple specialized crews to accomplish
     complex tasks that require coordination between different domains or phases.
 
+    Async delegations run their thread-bound work (crew builds and runners
+    without a native async API) on a thread pool owned by the manager, so
+    a large delegate_parallel() cannot exhaust threads shared with the rest
+    of the application. Per-role limits additionally cap how many crews of
+    one role run at once; delegations beyond a limit wait in a queue whose
+    depth is reported by stats().
+
+    With a result_store, delegations whose crew config, framework and
+    inputs match an earlier one return the stored output without running
+    the crew.
+
+    Async delegations can be bounded by a timeout; the deadline propagates
+    to everything the delegation starts, and a delegation that runs past
+    it is cancelled and raises DeadlineExceeded (see
+    agentic_crew.runners.base.use_deadline).
+
+    With a process_pool, crews run in worker processes instead of the
+    manager's process (see agentic_crew.core.process_pool), so CPU-heavy
+    crews run in parallel and a crashing crew fails only its delegation.
+
+    Crew names are resolved in package_name when given. Otherwise they are
+    looked up in an index of every discovered package's manifest, built on
+    first use; a name defined by several packages must be qualified as
+    "<package>:<crew>".
+
     Attributes:
         crews: Dict mapping crew role names to crew names in packages.
         package_name: Optional package name if all crews are in one package.
         workspace_root: Optional workspace root for crew discovery.
+        max_workers: Size of the manager's thread pool.
+        role_limits: Crew role -> maximum concurrent async delegations.
+        result_store: Optional store used to memoize delegation results.
+        delegation_timeout: Default timeout of an async delegation, in seconds.
+        process_pool: Optional pool of worker processes that run the crews.
+        journal_dir: Directory for run journals (see run() and resume()).
+        last_run_id: Id of the most recent run() or resume().
     """
 
     def __init__(
@@ -69,19 +213,109 @@ class ManagerAgent:
         crews: dict[str, str],
         package_name: str | None = None,
         workspace_root: Path | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        role_limits: dict[str, int] | None = None,
+        result_store: ResultStore | None = None,
+        journal_dir: Path | None = None,
+        delegation_timeout: float | None = None,
+        process_pool: CrewProcessPool | None = None,
     ):
         """Initialize the manager agent.
 
         Args:
-            crews: Dict mapping role names to crew names (e.g., {"design": "game_design"}).
+            crews: Dict mapping role names to crew names (e.g., {"design": "game_design"},
+                or {"design": "games:game_design"} to name the package).
             package_name: Optional package name if all crews are in the same package.
             workspace_root: Optional workspace root for discovering packages.
+            max_workers: Number of threads in the manager's executor.
+            role_limits: Optional crew role -> maximum number of concurrent
+                async delegations to that role.
+            result_store: Optional ResultStore for memoizing delegation
+                results (opt-in; see agentic_crew.core.result_store).
+            journal_dir: Directory for run journals (default: the "runs"
+                subdirectory of the agentic-crew cache).
+            delegation_timeout: Default timeout in seconds of each async
+                delegation (queueing included); None for no timeout.
+            process_pool: Optional CrewProcessPool to run crews in worker
+                processes. The caller owns the pool and closes it.
+
+        Raises:
+            ValueError: If max_workers or a role limit is not positive.
         """
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        for role, limit in (role_limits or {}).items():
+            if limit <= 0:
+                raise ValueError(f"Limit for role '{role}' must be positive, got {limit}")
+
         self.crews = crews
         self.package_name = package_name
         self.workspace_root = workspace_root
+        self.max_workers = max_workers
+        self.role_limits = dict(role_limits or {})
+        self.result_store = result_store
+        self.journal_dir = journal_dir
+        self.delegation_timeout = delegation_timeout
+        self.process_pool = process_pool
+        self.last_run_id: str | None = None
         self._packages_cache: dict[str, Path] | None = None
+        self._crew_index: dict[str, list[str]] | None = None
         self._crew_config_cache: dict[str, dict[str, Any]] = {}
+        self._executor: _MeteredExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._role_stats: dict[str, RoleStats] = {}
+        self._role_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The manager's thread pool, created on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = _MeteredExecutor(self.max_workers)
+            return self._executor
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down the manager's thread pool.
+
+        Args:
+            wait: Wait for running delegations to finish.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __enter__(self) -> ManagerAgent:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Return executor and per-role delegation metrics.
+
+        Returns:
+            Dict with "executor" (max_workers, active, queued, max_queued),
+            "roles" (crew role -> RoleStats fields), with a result store
+            "results" (ResultStore.stats()) and, with a process pool,
+            "processes" (CrewProcessPool.stats()).
+        """
+        executor = self._executor
+        stats: dict[str, Any] = {
+            "executor": {
+                "max_workers": self.max_workers,
+                "active": executor.active if executor else 0,
+                "queued": executor.queued if executor else 0,
+                "max_queued": executor.max_queued if executor else 0,
+            },
+            "roles": {role: asdict(stats) for role, stats in self._role_stats.items()},
+        }
+        if self.result_store is not None:
+            stats["results"] = self.result_store.stats()
+        if self.process_pool is not None:
+            stats["processes"] = self.process_pool.stats()
+        return stats
 
     def _get_packages(self) -> dict[str, Path]:
         """Get discovered packages, using cache if available."""
@@ -105,6 +339,60 @@ class ManagerAgent:
         Returns:
             Crew output as a string.
 
+        Raises:
+            ValueError: If crew_role not found in crews mapping.
+        """
+        crew_config, inputs = self._prepare_delegation(crew_role, inputs)
+        recall = self._recall(crew_role, crew_config, inputs, framework)
+        result = recall.output
+        if result is None and self.process_pool is not None:
+            result = self.process_pool.run(crew_config, inputs, framework)
+        elif result is None:
+            result = run_crew_auto(crew_config, inputs=inputs, framework=framework)
+        self._remember(recall, crew_role, result)
+        return result
+
+    def _recall(
+        self,
+        crew_role: str,
+        crew_config: dict[str, Any],
+        inputs: dict[str, Any],
+        framework: str | None,
+    ) -> _Recall:
+        """Look a delegation up in the current run's journal, then the result store."""
+        recall = _Recall(session=_journal_session.get())
+        if recall.session is not None:
+            recall.journal_key = recall.session.key(crew_role, framework, inputs)
+            recall.output = recall.session.replay(recall.journal_key)
+            if recall.output is not None:
+                recall.replayed = True
+                return recall
+
+        if self.result_store is not None:
+            # Key by the framework that will run: run_crew_auto() lets
+            # required_framework win and detects the framework for "auto"
+            resolved = crew_config.get("required_framework") or framework
+            if resolved is None or resolved == "auto":
+                resolved = detect_framework()
+            fingerprint = crew_fingerprint(crew_config, resolved)
+            recall.store_key = ResultStore.key(fingerprint, inputs, _resolved_llms(crew_config))
+            recall.output = self.result_store.get(recall.store_key)
+        return recall
+
+    def _remember(self, recall: _Recall, crew_role: str, output: str) -> None:
+        """Journal and store a delegation's output where it did not come from."""
+        if recall.session is not None and not recall.replayed:
+            recall.session.record(recall.journal_key, crew_role, output)
+        if self.result_store is not None and recall.store_key is not None and recall.output is None:
+            self.result_store.put(recall.store_key, output)
+
+    def _prepare_delegation(
+        self,
+        crew_role: str,
+        inputs: dict[str, Any] | str,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Resolve a crew role to its config and normalize the inputs.
+
         Raises:
             ValueError: If crew_role not found in crews mapping.
         """
@@ -117,76 +405,177 @@ class ManagerAgent:
         if isinstance(inputs, str):
             inputs = {"task": inputs}
 
+        return self._get_crew_config(crew_name), inputs
+
+    def _get_crew_index(self) -> dict[str, list[str]]:
+        """Get the crew name -> packages index, building it on first use."""
+        if self._crew_index is None:
+            self._crew_index = index_crews(self._get_packages())
+        return self._crew_index
+
+    def _get_crew_config(self, crew_name: str) -> dict[str, Any]:
+        """Get a crew's configuration, caching it for future delegations.
+
+        Raises:
+            ValueError: If the crew or its package is not found, or the
+                crew name is defined by more than one package.
+        """
         # Check crew config cache first for performance
         if crew_name in self._crew_config_cache:
-            cached_config = self._crew_config_cache[crew_name]
-            return run_crew_auto(cached_config, inputs=inputs, framework=framework)
-
-        # Get crew configuration
-        crew_config: dict[str, Any]
-        if self.package_name:
-            # Use specified package
-            packages = self._get_packages()
-            if self.package_name not in packages:
-                raise ValueError(f"Package '{self.package_name}' not found. Available: {list(packages.keys())}")
-            crewai_dir = packages[self.package_name]
-            crew_config = get_crew_config(crewai_dir, crew_name)
-        else:
-            # Auto-discover package containing the crew
-            packages = self._get_packages()
-            found_config: dict[str, Any] | None = None
-            for pkg_dir in packages.values():
-                try:
-                    found_config = get_crew_config(pkg_dir, crew_name)
-                    break
-                except ValueError:
-                    continue
-
-            if found_config is None:
+            return self._crew_config_cache[crew_name]
+
+        packages = self._get_packages()
+        package_name, _, name = crew_name.rpartition(":")
+        package_name = package_name or self.package_name or ""
+        if not package_name:
+            # Auto-discover the package defining the crew
+            owners = self._get_crew_index().get(name, [])
+            if len(owners) > 1:
                 raise ValueError(
-                    f"Crew '{crew_name}' not found in any package. Available packages: {list(packages.keys())}"
+                    f"Crew '{name}' is defined in several packages: {owners}. "
+                    f"Use '<package>:{name}' or set package_name."
                 )
-            crew_config = found_config
+            if not owners:
+                raise ValueError(f"Crew '{name}' not found in any package. Available packages: {list(packages.keys())}")
+            package_name = owners[0]
+        elif package_name not in packages:
+            raise ValueError(f"Package '{package_name}' not found. Available: {list(packages.keys())}")
+
+        crew_config: dict[str, Any] = get_crew_config(packages[package_name], name)
 
         # Cache the config for future calls
         self._crew_config_cache[crew_name] = crew_config
-        return run_crew_auto(crew_config, inputs=inputs, framework=framework)
+        return crew_config
 
     async def delegate_async(
         self,
         crew_role: str,
         inputs: dict[str, Any] | str,
         framework: str | None = None,
+        timeout: float | None = None,
     ) -> str:
         """Delegate a task to a specific crew asynchronously.
 
-        This runs the crew in a thread pool to avoid blocking the event loop.
+        The crew runs on the current event loop through the framework's
+        async API (see BaseRunner.arun), so parallel delegations do not each
+        hold a thread; any thread-bound work uses the manager's executor.
+        If the role has a limit, the delegation waits for a free slot.
 
         Args:
             crew_role: Role name from the crews dict (e.g., "design").
             inputs: Input dict or string to pass to the crew.
             framework: Optional framework override.
+            timeout: Seconds the delegation may take, queueing included
+                (default: delegation_timeout). An enclosing deadline, such
+                as a workflow's, still applies.
 
         Returns:
             Crew output as a string.
+
+        Raises:
+            DeadlineExceeded: If the delegation did not finish in time; the
+                crew run is cancelled.
         """
+        crew_config, inputs = self._prepare_delegation(crew_role, inputs)
+        recall = self._recall(crew_role, crew_config, inputs, framework)
+        if recall.output is not None:
+            self._remember(recall, crew_role, recall.output)
+            return recall.output
+
+        with use_deadline(timeout if timeout is not None else self.delegation_timeout) as budget:
+            try:
+                return await asyncio.wait_for(
+                    self._run_delegation(crew_role, crew_config, inputs, framework, recall), budget
+                )
+            except asyncio.TimeoutError:  # noqa: UP041 (not the builtin before 3.11)
+                if remaining_time() != 0.0:
+                    raise  # Raised by the crew, not by our deadline
+                raise DeadlineExceeded(f"Delegation to '{crew_role}' timed out after {budget:.1f}s") from None
+
+    async def _run_delegation(
+        self,
+        crew_role: str,
+        crew_config: dict[str, Any],
+        inputs: dict[str, Any],
+        framework: str | None,
+        recall: _Recall,
+    ) -> str:
+        """Run a delegation within its role's limit and the manager's executor."""
+        stats = self._role_stats.setdefault(crew_role, RoleStats())
+        semaphore = self._role_semaphore(crew_role)
+
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        queued_at = time.perf_counter()
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        finally:
+            stats.queued -= 1
+            stats.wait_ms += int((time.perf_counter() - queued_at) * 1000)
+
+        stats.running += 1
+        try:
+            if self.process_pool is not None:
+                result = await self.process_pool.arun(crew_config, inputs, framework)
+            else:
+                with use_executor(self.executor):
+                    result = await run_crew_auto_async(crew_config, inputs=inputs, framework=framework)
+        except asyncio.CancelledError:
+            stats.cancelled += 1
+            raise
+        except Exception:
+            stats.failed += 1
+            raise
+        finally:
+            stats.running -= 1
+            if semaphore is not None:
+                semaphore.release()
+        stats.completed += 1
+        self._remember(recall, crew_role, result)
+        return result
+
+    def _role_semaphore(self, crew_role: str) -> asyncio.Semaphore | None:
+        """Get the semaphore enforcing a role's limit on the running loop."""
+        limit = self.role_limits.get(crew_role)
+        if limit is None:
+            return None
+        # Semaphores belong to one event loop; start over on a new loop
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.delegate, crew_role, inputs, framework)
+        if self._semaphore_loop is not loop:
+            self._role_semaphores = {}
+            self._semaphore_loop = loop
+        if crew_role not in self._role_semaphores:
+            self._role_semaphores[crew_role] = asyncio.Semaphore(limit)
+        return self._role_semaphores[crew_role]
 
     async def delegate_parallel(
         self,
         delegations: list[tuple[str, dict[str, Any] | str]],
         framework: str | None = None,
+        timeout: float | None = None,
     ) -> list[str]:
         """Delegate tasks to multiple crews in parallel.
 
+        If one delegation fails, the others are cancelled.
+
         Args:
             delegations: List of (crew_role, inputs) tuples.
             framework: Optional framework override for all crews.
+            timeout: Seconds all delegations together may take; each one
+                is also bounded by delegation_timeout.
 
         Returns:
             List of crew outputs in the same order as delegations.
 
+        Raises:
+            DeadlineExceeded: If the delegations did not all finish in time.
+                Its partial attribute holds the outputs in order, with None
+                for the delegations that were cancelled.
+
         Example:
             ```python
             results = await manager.delegate_parallel([
@@ -196,8 +585,103 @@ class ManagerAgent:
             design_result, assets_result = results
             ```
         """
-        tasks = [self.delegate_async(crew_role, inputs, framework) for crew_role, inputs in delegations]
-        return await asyncio.gather(*tasks)
+        with use_deadline(timeout) as budget:
+            runs = [
+                asyncio.ensure_future(self.delegate_async(crew_role, inputs, framework))
+                for crew_role, inputs in delegations
+            ]
+            try:
+                return list(await asyncio.wait_for(asyncio.gather(*runs), budget))
+            except asyncio.TimeoutError:  # noqa: UP041
+                if remaining_time() != 0.0:
+                    raise
+                partial = [_finished_output(run) for run in runs]
+                raise DeadlineExceeded(
+                    f"{partial.count(None)} of {len(runs)} delegations did not finish within {budget:.1f}s",
+                    partial=partial,
+                ) from None
+            finally:
+                for run in runs:
+                    run.cancel()
+                # Let cancelled delegations release their role slots before returning
+                await asyncio.gather(*runs, return_exceptions=True)
+
+    async def run_workflow(
+        self,
+        steps: list[WorkflowStep],
+        task: dict[str, Any] | str = "",
+        framework: str | None = None,
+        max_parallel: int | None = None,
+        role_limits: dict[str, int] | None = None,
+        on_error: str = FAIL_FAST,
+        timeout: float | None = None,
+        step_timeout: float | None = None,
+    ) -> WorkflowResult:
+        """Run a declarative workflow of delegations as a DAG.
+
+        Each step is delegated as soon as the steps it depends on finish,
+        so independent steps run in parallel without hand-written
+        asyncio.gather choreography. See agentic_crew.core.workflow.
+
+        Args:
+            steps: Workflow steps (crew role, dependencies, input mapper).
+            task: Workflow input given to steps without dependencies.
+            framework: Optional framework override for all crews.
+            max_parallel: Maximum number of concurrent delegations.
+            role_limits: Crew role -> maximum concurrent delegations.
+            on_error: "fail_fast" (raise WorkflowError on the first failure)
+                or "continue" (skip only the failed step's dependents).
+            timeout: Seconds the whole workflow may take.
+            step_timeout: Seconds each step may take (default:
+                delegation_timeout); a step that times out fails.
+
+        Returns:
+            WorkflowResult with outputs, errors and the critical path.
+
+        Raises:
+            ValueError: If a step uses an unknown crew role or the steps
+                do not form a valid DAG.
+            WorkflowError: If a step fails with on_error="fail_fast".
+            DeadlineExceeded: If the workflow did not finish within timeout;
+                its partial attribute holds the WorkflowResult so far.
+
+        Example:
+            ```python
+            result = await manager.run_workflow(
+                [
+                    WorkflowStep("design"),
+                    WorkflowStep("implementation", depends_on=["design"]),
+                    WorkflowStep("assets", depends_on=["design"]),
+                    WorkflowStep("qa", depends_on=["implementation", "assets"]),
+                ],
+                task="Create game concept",
+                role_limits={"assets": 1},
+            )
+            ```
+        """
+        for step in steps:
+            if step.crew_role not in self.crews:
+                raise ValueError(
+                    f"Unknown crew role '{step.crew_role}' in step '{step.name}'. Available: {list(self.crews.keys())}"
+                )
+
+        async def delegate(crew_role: str, inputs: dict[str, Any] | str) -> str:
+            with use_deadline(step_timeout):
+                return await self.delegate_async(crew_role, inputs, framework)
+
+        result = await run_workflow(
+            steps,
+            delegate,
+            task=task,
+            max_parallel=max_parallel,
+            role_limits=role_limits,
+            on_error=on_error,
+            timeout=timeout,
+        )
+        logger.info(
+            "Workflow finished in %d ms; critical path: %s", result.duration_ms, " -> ".join(result.critical_path)
+        )
+        return result
 
     def delegate_sequential(
         self,
@@ -263,6 +747,67 @@ class ManagerAgent:
         logger.info("Auto-approved (base implementation)")
         return True, result
 
+    async def run(self, task: str, run_id: str | None = None, **kwargs: Any) -> str:
+        """Execute the workflow with a journal so a failed run can be resumed.
+
+        Every completed delegation is written to a durable journal keyed by
+        the run id before the workflow continues; see resume().
+
+        Args:
+            task: The main task to accomplish.
+            run_id: Optional run id (generated if omitted; also available
+                as last_run_id).
+            **kwargs: Additional execute_workflow() arguments; must be
+                JSON-serializable.
+
+        Returns:
+            Final result as a string.
+
+        Raises:
+            FileExistsError: If a run with this id was already started.
+            TypeError: If task or kwargs are not JSON-serializable.
+        """
+        run_id = run_id or uuid.uuid4().hex
+        journal = WorkflowJournal(run_id, self.journal_dir)
+        journal.start(task, kwargs)
+        self.last_run_id = run_id
+        return await self._run_journaled(JournalSession(journal), task, kwargs)
+
+    async def resume(self, run_id: str) -> str:
+        """Resume a run started with run().
+
+        The workflow is executed again with the run's original arguments;
+        delegations recorded in the journal return their recorded outputs
+        instead of running, so work continues from the first delegation
+        that had not completed. A run that already finished returns its
+        final output.
+
+        Args:
+            run_id: Id of the run to resume.
+
+        Returns:
+            Final result as a string.
+
+        Raises:
+            FileNotFoundError: If no journal exists for the run id.
+        """
+        journal = WorkflowJournal(run_id, self.journal_dir)
+        state = journal.load()
+        self.last_run_id = run_id
+        if state.output is not None:
+            return state.output
+        return await self._run_journaled(JournalSession(journal, state.delegations), state.task, state.kwargs)
+
+    async def _run_journaled(self, session: JournalSession, task: Any, kwargs: dict[str, Any]) -> str:
+        token = _journal_session.set(session)
+        try:
+            output = await self.execute_workflow(task, **kwargs)
+        finally:
+            _journal_session.reset(token)
+        session.journal.finish(output)
+        logger.info("Run %s finished (%d delegations replayed)", session.journal.run_id, session.replayed)
+        return output
+
     async def execute_workflow(self, task: str, **kwargs: Any) -> str:
         """Execute the manager's workflow.
 
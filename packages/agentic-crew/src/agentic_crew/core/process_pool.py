@@ -0,0 +1,389 @@
+"""Process-pool backend for running crews outside the calling process.
+
+Crew runs do CPU-heavy work in Python (prompt templating, pydantic
+validation, embeddings for memory and knowledge) that contends on the GIL
+when many crews run in threads. A CrewProcessPool runs each crew in one
+of a set of long-lived worker processes instead:
+
+- Workers are started ahead of time and import the installed frameworks
+  before taking work, and keep their built crews (see run_crew_auto), so
+  a delegation does not pay interpreter start-up or rebuild costs.
+- A worker that dies (segfault, OOM kill, os._exit) fails only the
+  delegation it was running, with WorkerCrashedError; it is replaced and
+  the other delegations continue.
+- Requests travel as JSON and outputs as raw UTF-8 bytes over a pipe, so
+  nothing is pickled in either direction.
+
+Example:
+    ```python
+    with CrewProcessPool(max_workers=8) as pool:
+        manager = ManagerAgent(crews={...}, process_pool=pool)
+        await manager.delegate_parallel([...])
+
+        for result in run_crew_batch(config, inputs, concurrency=8, pool=pool):
+            ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import json
+import multiprocessing
+import os
+import queue
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from agentic_crew.runners.base import DeadlineExceeded, remaining_time, use_deadline
+
+# Reply status bytes (followed by the UTF-8 payload)
+_OK = b"0"
+_ERROR = b"1"
+_READY = b"ready"
+
+
+class WorkerCrashedError(RuntimeError):
+    """Raised when the worker process running a crew dies."""
+
+
+class _JobCancelled(RuntimeError):
+    """Raised by _run() for a job cancelled through arun(), which re-raises it as CancelledError."""
+
+
+@dataclass
+class _Worker:
+    """A worker process and the parent's end of its pipe."""
+
+    process: Any
+    conn: Connection
+    ready: bool = False
+
+    def stop(self) -> int | None:
+        """Kill the process if it is still running and return its exit code."""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+        return self.process.exitcode
+
+
+class _Job:
+    """A crew run handed to a worker; cancel() kills the worker running it."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self.worker: _Worker | None = None
+        self._lock = threading.Lock()
+
+    def assign(self, worker: _Worker) -> bool:
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.worker = worker
+            return True
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            if self.worker is not None and self.worker.process.is_alive():
+                self.worker.process.kill()
+
+
+class CrewProcessPool:
+    """Long-lived worker processes that run crews.
+
+    Attributes:
+        max_workers: Number of worker processes.
+        frameworks: Frameworks each worker imports before taking work.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        frameworks: list[str] | None = None,
+        initializer: Callable[[], None] | None = None,
+        start_method: str = "spawn",
+    ):
+        """Initialize the pool (workers start on start() or first use).
+
+        Args:
+            max_workers: Number of worker processes (default: CPU count).
+            frameworks: Frameworks to import in each worker (default: every
+                installed framework).
+            initializer: Optional module-level function each worker calls
+                once after importing the frameworks.
+            start_method: multiprocessing start method. "spawn" (the
+                default) is safe with threads in the parent.
+
+        Raises:
+            ValueError: If max_workers is not positive.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        if max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if frameworks is None:
+            from agentic_crew.core.decomposer import get_available_frameworks
+
+            frameworks = get_available_frameworks()
+
+        self.max_workers = max_workers
+        self.frameworks = list(frameworks)
+        self._initializer = initializer
+        self._context = multiprocessing.get_context(start_method)
+        # None is put by close() to wake threads waiting for a worker
+        self._idle: queue.SimpleQueue[_Worker | None] = queue.SimpleQueue()
+        self._workers: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._threads: ThreadPoolExecutor | None = None
+        self._closed = False
+        self._counts = {"completed": 0, "failed": 0, "crashed": 0, "cancelled": 0}
+
+    def start(self, wait: bool = True) -> None:
+        """Start every worker process.
+
+        Args:
+            wait: Block until every worker has imported its frameworks.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("CrewProcessPool is closed")
+            if self._workers:
+                return
+            for _ in range(self.max_workers):
+                self._spawn()
+            self._threads = ThreadPoolExecutor(self.max_workers, thread_name_prefix="agentic-crew-process")
+        if wait:
+            workers = [self._get_idle() for _ in range(self.max_workers)]
+            for worker in workers:
+                self._await_ready(worker)
+                self._idle.put(worker)
+
+    def run(
+        self, crew_config: dict[str, Any], inputs: dict[str, Any] | None = None, framework: str | None = None
+    ) -> str:
+        """Run a crew in a worker process and wait for its output.
+
+        The current deadline (see agentic_crew.runners.base.use_deadline)
+        applies: the worker runs the crew under it, and a worker still busy
+        when it passes is killed.
+
+        Args:
+            crew_config: Crew configuration; must be JSON-serializable apart
+                from paths.
+            inputs: Crew inputs; must be JSON-serializable.
+            framework: Optional framework override.
+
+        Returns:
+            Crew output as a string.
+
+        Raises:
+            RuntimeError: If the crew raised in the worker (the message
+                names the original exception type).
+            WorkerCrashedError: If the worker process died.
+            DeadlineExceeded: If the deadline passed first, including while
+                waiting for an idle worker.
+            RuntimeError: If the pool is closed, including while waiting
+                for an idle worker.
+        """
+        return self._run(_Job(), crew_config, inputs, framework)
+
+    async def arun(
+        self, crew_config: dict[str, Any], inputs: dict[str, Any] | None = None, framework: str | None = None
+    ) -> str:
+        """Async variant of run(); cancelling it kills the worker running the crew.
+
+        Args:
+            crew_config: Crew configuration.
+            inputs: Crew inputs.
+            framework: Optional framework override.
+
+        Returns:
+            Crew output as a string.
+        """
+        job = _Job()
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        run = functools.partial(self._run, job, crew_config, inputs, framework)
+        try:
+            return await loop.run_in_executor(self._thread_pool(), context.run, run)
+        except _JobCancelled:
+            raise asyncio.CancelledError() from None
+        except asyncio.CancelledError:
+            job.cancel()
+            raise
+
+    def stats(self) -> dict[str, int]:
+        """Return worker and job counters."""
+        with self._lock:
+            return {"workers": len(self._workers), "idle": self._idle.qsize(), **self._counts}
+
+    def close(self) -> None:
+        """Stop every worker process."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+            threads, self._threads = self._threads, None
+        self._idle.put(None)
+        for worker in workers:
+            with contextlib.suppress(OSError):
+                worker.conn.close()
+            worker.process.join(timeout=5)
+            worker.stop()
+        if threads is not None:
+            threads.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> CrewProcessPool:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _run(self, job: _Job, crew_config: dict[str, Any], inputs: dict[str, Any] | None, framework: str | None) -> str:
+        self.start(wait=False)
+        worker = self._get_idle(remaining_time())
+        if not job.assign(worker):
+            self._idle.put(worker)
+            raise _JobCancelled("Crew run was cancelled")
+
+        # Measured once a worker is free, so the worker's deadline is the caller's
+        timeout = remaining_time()
+        if timeout == 0.0:
+            self._idle.put(worker)
+            raise DeadlineExceeded("Crew run timed out waiting for a worker process")
+        try:
+            self._await_ready(worker)
+            worker.conn.send_bytes(_encode_request(crew_config, inputs, framework, timeout))
+            finished = timeout is None or worker.conn.poll(timeout)
+            reply = worker.conn.recv_bytes() if finished else b""
+        except (EOFError, OSError) as e:
+            exitcode = self._replace(worker)
+            if job.cancelled:
+                self._count("cancelled")
+                raise _JobCancelled("Crew run was cancelled") from None
+            self._count("crashed")
+            raise WorkerCrashedError(f"Crew worker process died with exit code {exitcode}") from e
+        if not finished:
+            self._replace(worker)
+            self._count("cancelled")
+            raise DeadlineExceeded(f"Crew run in worker process timed out after {timeout:.1f}s")
+
+        self._idle.put(worker)
+        status, payload = reply[:1], reply[1:].decode("utf-8")
+        if status == _ERROR:
+            self._count("failed")
+            raise RuntimeError(payload)
+        self._count("completed")
+        return payload
+
+    def _get_idle(self, timeout: float | None = None) -> _Worker:
+        """Wait for an idle worker.
+
+        Args:
+            timeout: Seconds to wait at most, or None to wait until one is free.
+
+        Raises:
+            DeadlineExceeded: If no worker became free within timeout.
+            RuntimeError: If the pool is closed before one is available.
+        """
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise DeadlineExceeded("Crew run timed out waiting for a worker process") from None
+        if worker is None:
+            # Pass the wake-up on to the next waiting thread
+            self._idle.put(None)
+            raise RuntimeError("CrewProcessPool is closed")
+        return worker
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        """Threads that wait on workers for arun(), one per worker."""
+        self.start(wait=False)
+        with self._lock:
+            if self._threads is None:
+                raise RuntimeError("CrewProcessPool is closed")
+            return self._threads
+
+    def _spawn(self) -> None:
+        """Start one worker and make it available."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.frameworks, self._initializer),
+            name="agentic-crew-worker",
+            daemon=True,
+        )
+        process.start()
+        # Only the child may hold its end, so the parent sees EOF if it dies
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        self._workers.append(worker)
+        self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> int | None:
+        """Stop a worker and start a fresh one in its place."""
+        exitcode = worker.stop()
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            if not self._closed:
+                self._spawn()
+        return exitcode
+
+    @staticmethod
+    def _await_ready(worker: _Worker) -> None:
+        if not worker.ready:
+            if worker.conn.recv_bytes() != _READY:
+                raise EOFError("Unexpected handshake from crew worker")
+            worker.ready = True
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+
+def _encode_request(
+    crew_config: dict[str, Any], inputs: dict[str, Any] | None, framework: str | None, timeout: float | None
+) -> bytes:
+    request = {"crew_config": dict(crew_config), "inputs": inputs or {}, "framework": framework, "timeout": timeout}
+    return json.dumps(request, default=str).encode("utf-8")
+
+
+def _worker_main(conn: Connection, frameworks: list[str], initializer: Callable[[], None] | None) -> None:
+    """Worker process loop: import frameworks, then run crews until the pipe closes."""
+    from agentic_crew.core.decomposer import get_runner, run_crew_auto
+
+    for framework in frameworks:
+        # Instantiating a runner imports its framework
+        with contextlib.suppress(Exception):
+            get_runner(framework)
+    if initializer is not None:
+        initializer()
+    conn.send_bytes(_READY)
+
+    while True:
+        try:
+            request = json.loads(conn.recv_bytes())
+        except (EOFError, OSError):
+            return
+        crew_config = request["crew_config"]
+        # Paths arrive as strings
+        if crew_config.get("config_dir"):
+            crew_config["config_dir"] = Path(crew_config["config_dir"])
+        crew_config["knowledge_paths"] = [Path(path) for path in crew_config.get("knowledge_paths") or []]
+        try:
+            with use_deadline(request["timeout"]):
+                output = run_crew_auto(crew_config, inputs=request["inputs"], framework=request["framework"])
+        except Exception as e:
+            conn.send_bytes(_ERROR + f"{type(e).__name__}: {e}".encode())
+        else:
+            conn.send_bytes(_OK + str(output).encode("utf-8"))
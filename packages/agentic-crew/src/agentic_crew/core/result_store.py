@@ -0,0 +1,167 @@
+"""Content-addressed store for crew results.
+
+ManagerAgent consults a ResultStore (when given one) before delegating, so
+deterministic pipelines rerun while iterating on later stages do not pay
+for identical earlier delegations again. A result is keyed by the crew's
+config fingerprint (which covers agents, tasks and model settings), the
+framework, the LLM provider and model chosen from the environment, and the
+inputs.
+
+Results are kept in an in-memory LRU and, unless on-disk caching is
+disabled (see agentic_crew.utils.cache), as one JSON file per key under
+the cache directory. Entries older than the store's TTL are ignored and
+removed when read.
+
+Example:
+    ```python
+    store = ResultStore(ttl=3600)
+    manager = ManagerAgent(crews={...}, result_store=store)
+    ...
+    store.stats()  # {"hits": 3, "misses": 1, ...}
+    ```
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from agentic_crew.utils.cache import atomic_write, cache_enabled, get_cache_dir
+from agentic_crew.utils.lru import LRUCache
+
+STORE_VERSION = 1
+
+# Default lifetime of a stored result, in seconds
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class ResultStore:
+    """Two-level (memory, then disk) store of crew outputs with a TTL.
+
+    Attributes:
+        ttl: Seconds a result stays valid, or None to keep results forever.
+        directory: Where results are persisted, or None for memory only.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = DEFAULT_TTL,
+        maxsize: int = 256,
+        directory: Path | None = None,
+        persist: bool = True,
+    ):
+        """Initialize the store.
+
+        Args:
+            ttl: Seconds a result stays valid; None keeps results forever.
+            maxsize: Maximum number of results kept in memory.
+            directory: Directory for persisted results (default: the
+                "results" subdirectory of the agentic-crew cache).
+            persist: Whether to persist results on disk at all.
+        """
+        self.ttl = ttl
+        persist = persist and cache_enabled()
+        self.directory = (directory or get_cache_dir("results")) if persist else None
+        self._memory = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._counts = {"hits": 0, "misses": 0, "disk_hits": 0, "stores": 0}
+
+    @staticmethod
+    def key(crew_fingerprint: str, inputs: Any, llm: Any = None) -> str:
+        """Compute the key of a crew run.
+
+        Args:
+            crew_fingerprint: Fingerprint of the crew config and framework
+                (see decomposer.crew_fingerprint).
+            inputs: Crew inputs; must be JSON-serializable (other values
+                are keyed by their str()).
+            llm: The LLM providers and models the run resolves to outside
+                the config (see config.llm.resolve_llm), if any.
+
+        Returns:
+            Hex digest identifying the run.
+        """
+        canonical = json.dumps([crew_fingerprint, inputs, llm], sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return a stored, unexpired result, or None."""
+        entry = self._memory.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is not None:
+                self._memory.put(key, entry)
+                self._count("disk_hits")
+
+        if entry is not None and self._expired(entry):
+            self._memory.pop(key)
+            self._remove(key)
+            entry = None
+
+        self._count("hits" if entry is not None else "misses")
+        return entry["output"] if entry is not None else None
+
+    def put(self, key: str, output: str) -> None:
+        """Store a result."""
+        entry = {"version": STORE_VERSION, "created": time.time(), "output": output}
+        self._memory.put(key, entry)
+        self._write(key, entry)
+        self._count("stores")
+
+    def clear(self) -> None:
+        """Remove every stored result, in memory and on disk."""
+        self._memory.clear()
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of results in memory.
+
+        ``disk_hits`` counts the hits that were served from disk.
+        """
+        with self._lock:
+            return {**self._counts, "memory_size": len(self._memory)}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def _expired(self, entry: dict[str, Any]) -> bool:
+        return self.ttl is not None and time.time() - entry["created"] > self.ttl
+
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != STORE_VERSION:
+            return None
+        return entry
+
+    def _write(self, key: str, entry: dict[str, Any]) -> None:
+        """Atomically persist an entry; failures are ignored (the store is only a cache)."""
+        path = self._path(key)
+        if path is None:
+            return
+        with contextlib.suppress(OSError):
+            atomic_write(path, json.dumps(entry), prefix=".result-")
+
+    def _remove(self, key: str) -> None:
+        path = self._path(key)
+        if path is not None:
+            with contextlib.suppress(OSError):
+                path.unlink()
@@ -0,0 +1,178 @@
+"""Task dependency graphs built from task ``context`` references.
+
+Runners use the graph to run independent tasks concurrently, so a crew
+finishes in critical-path time instead of the sum of its tasks.
+
+Dependency rules for a crew's tasks (in config order):
+
+    context: [a, b]    depends on tasks a and b only
+    context: []        depends on nothing
+    (no context key)   depends on the previous task, matching the implicit
+                       chaining of a sequential crew
+
+Example:
+    ```python
+    graph = TaskGraph.from_tasks(crew_config["tasks"])
+    graph.levels()          # [["research", "analysis"], ["report"]]
+    graph.critical_path()   # ["research", "report"]
+    ```
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+def task_prompt(task_config: Mapping[str, Any], inputs: Mapping[str, Any], context: Mapping[str, str]) -> str:
+    """Build the prompt for one task of a crew run task by task.
+
+    ``{key}`` placeholders in the description are filled from the crew
+    inputs. Tasks with context get their dependencies' outputs; tasks
+    without get the user's request (``input`` or ``task``).
+
+    Args:
+        task_config: Task configuration with description/expected_output.
+        inputs: Crew inputs.
+        context: Dependency name -> output, in context order.
+
+    Returns:
+        Prompt text.
+    """
+    description = _PLACEHOLDER.sub(
+        lambda match: str(inputs.get(match.group(1), match.group(0))), task_config.get("description", "")
+    )
+    parts = [description]
+    if task_config.get("expected_output"):
+        parts.append(f"Expected output: {task_config['expected_output']}")
+
+    if context:
+        parts.extend(f"## Output of {name}\n{output}" for name, output in context.items())
+    else:
+        request = inputs.get("input", inputs.get("task"))
+        if request:
+            parts.append(f"## Request\n{request}")
+    return "\n\n".join(parts)
+
+
+class TaskGraph:
+    """Directed acyclic graph of named tasks.
+
+    Attributes:
+        dependencies: Task name -> names of the tasks it depends on.
+            Keys are kept in their original order.
+    """
+
+    def __init__(self, dependencies: Mapping[str, list[str] | tuple[str, ...]]):
+        """Initialize and validate the graph.
+
+        Args:
+            dependencies: Task name -> names of the tasks it depends on.
+
+        Raises:
+            ValueError: If a dependency names an unknown task or the
+                dependencies contain a cycle.
+        """
+        self.dependencies: dict[str, tuple[str, ...]] = {name: tuple(deps) for name, deps in dependencies.items()}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                if dep not in self.dependencies:
+                    raise ValueError(f"Task '{name}' depends on unknown task '{dep}'")
+        self._levels = self._compute_levels()
+
+    @classmethod
+    def from_tasks(cls, tasks_config: Mapping[str, Mapping[str, Any]]) -> TaskGraph:
+        """Build the graph from a crew's tasks config using ``context``.
+
+        Args:
+            tasks_config: Task name -> task config, in config order.
+
+        Returns:
+            The task graph.
+
+        Raises:
+            ValueError: If a context entry names an unknown task or the
+                context references form a cycle.
+        """
+        dependencies: dict[str, list[str]] = {}
+        previous: str | None = None
+        for name, task_config in tasks_config.items():
+            if "context" in task_config:
+                dependencies[name] = list(task_config["context"] or [])
+            else:
+                dependencies[name] = [previous] if previous is not None else []
+            previous = name
+        return cls(dependencies)
+
+    def levels(self) -> list[list[str]]:
+        """Group tasks into levels that can run concurrently.
+
+        Every task's dependencies are in earlier levels. Tasks keep their
+        original relative order within a level.
+
+        Returns:
+            List of levels, each a list of task names.
+        """
+        return [list(level) for level in self._levels]
+
+    def order(self) -> list[str]:
+        """Return the tasks in a dependency-respecting order (level by level)."""
+        return [name for level in self._levels for name in level]
+
+    def dependents(self) -> dict[str, list[str]]:
+        """Return task name -> names of the tasks that depend on it."""
+        dependents: dict[str, list[str]] = {name: [] for name in self.dependencies}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        return dependents
+
+    def is_sequential(self) -> bool:
+        """Whether no two tasks can run at the same time."""
+        return all(len(level) == 1 for level in self._levels)
+
+    def critical_path(self, durations: Mapping[str, float] | None = None) -> list[str]:
+        """Return the longest dependency chain.
+
+        Args:
+            durations: Optional task name -> duration. Without it every
+                task counts as one unit.
+
+        Returns:
+            Task names along the critical path, first to last.
+        """
+        finish: dict[str, float] = {}
+        via: dict[str, str | None] = {}
+        for name in self.order():
+            deps = self.dependencies[name]
+            before = max(deps, key=lambda dep: finish[dep], default=None)
+            via[name] = before
+            cost = durations.get(name, 0.0) if durations is not None else 1.0
+            finish[name] = (finish[before] if before is not None else 0.0) + cost
+
+        if not finish:
+            return []
+        path: list[str] = []
+        node: str | None = max(finish, key=lambda name: finish[name])
+        while node is not None:
+            path.append(node)
+            node = via[node]
+        return path[::-1]
+
+    def _compute_levels(self) -> list[list[str]]:
+        """Kahn's algorithm, one level at a time."""
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        levels: list[list[str]] = []
+        done: set[str] = set()
+        while remaining:
+            level = [name for name, deps in remaining.items() if deps <= done]
+            if not level:
+                raise ValueError(f"Task dependencies contain a cycle among: {', '.join(remaining)}")
+            for name in level:
+                del remaining[name]
+            done.update(level)
+            levels.append(level)
+        return levels
@@ -0,0 +1,246 @@
+"""Declarative DAG workflows for ManagerAgent.
+
+A workflow is a list of steps, each delegating to a crew role after the
+steps it depends on. The scheduler starts every step as soon as its
+dependencies finish, within a global parallelism limit and optional
+per-role caps, and reports the critical path of the run.
+
+Example:
+    ```python
+    from agentic_crew.core.workflow import WorkflowStep
+
+    result = await manager.run_workflow(
+        [
+            WorkflowStep("design"),
+            WorkflowStep("implementation", depends_on=["design"]),
+            WorkflowStep("assets", depends_on=["design"]),
+            WorkflowStep(
+                "qa",
+                depends_on=["implementation", "assets"],
+                inputs=lambda r: {"code": r["implementation"], "assets": r["assets"]},
+            ),
+        ],
+        task="Build a platformer level",
+        max_parallel=4,
+    )
+    result.outputs["qa"], result.critical_path
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from agentic_crew.core.task_graph import TaskGraph
+from agentic_crew.runners.base import DeadlineExceeded, remaining_time, use_deadline
+
+# Error policies
+FAIL_FAST = "fail_fast"
+CONTINUE = "continue"
+
+ERROR_POLICIES = (FAIL_FAST, CONTINUE)
+
+InputMapper = Callable[[Mapping[str, str]], "dict[str, Any] | str"]
+
+
+@dataclass
+class WorkflowStep:
+    """One delegation in a workflow.
+
+    Attributes:
+        name: Unique step name, used in depends_on and results.
+        role: Crew role to delegate to; defaults to the step name.
+        depends_on: Names of the steps that must finish first.
+        inputs: Inputs for the crew: a dict or string, or a callable that
+            receives the outputs of the dependencies (step name -> output)
+            and returns them. By default, steps without dependencies get
+            the workflow task and others get {"task": task, <dep>: output}.
+    """
+
+    name: str
+    role: str | None = None
+    depends_on: list[str] = field(default_factory=list)
+    inputs: dict[str, Any] | str | InputMapper | None = None
+
+    @property
+    def crew_role(self) -> str:
+        """The crew role this step delegates to."""
+        return self.role or self.name
+
+
+@dataclass
+class WorkflowResult:
+    """Outcome of a workflow run.
+
+    Attributes:
+        outputs: Step name -> crew output, for steps that succeeded.
+        errors: Step name -> error message, for steps that failed.
+        skipped: Steps not run because a dependency failed (or, with
+            fail-fast, because the workflow stopped).
+        durations_ms: Step name -> run time, for steps that finished.
+        critical_path: Longest chain of finished steps by run time.
+        duration_ms: Wall time of the whole workflow.
+    """
+
+    outputs: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    durations_ms: dict[str, int] = field(default_factory=dict)
+    critical_path: list[str] = field(default_factory=list)
+    duration_ms: int = 0
+
+    @property
+    def success(self) -> bool:
+        """Whether every step ran and succeeded."""
+        return not self.errors and not self.skipped
+
+
+class WorkflowError(RuntimeError):
+    """Raised by fail-fast workflows when a step fails.
+
+    Attributes:
+        step: Name of the step that failed.
+        result: Results of the steps that finished before the failure.
+    """
+
+    def __init__(self, step: str, result: WorkflowResult):
+        super().__init__(f"Workflow step '{step}' failed: {result.errors[step]}")
+        self.step = step
+        self.result = result
+
+
+async def run_workflow(
+    steps: list[WorkflowStep],
+    delegate: Callable[[str, dict[str, Any] | str], Awaitable[str]],
+    task: dict[str, Any] | str = "",
+    max_parallel: int | None = None,
+    role_limits: Mapping[str, int] | None = None,
+    on_error: str = FAIL_FAST,
+    timeout: float | None = None,
+) -> WorkflowResult:
+    """Run workflow steps as a DAG.
+
+    Args:
+        steps: Workflow steps; dependencies must name other steps.
+        delegate: Async callable (crew_role, inputs) -> output.
+        task: Workflow input given to steps without dependencies.
+        max_parallel: Maximum number of steps running at once (unbounded
+            if None).
+        role_limits: Crew role -> maximum concurrent steps for that role.
+        on_error: FAIL_FAST cancels running steps and raises WorkflowError
+            on the first failure; CONTINUE skips the failed step's
+            dependents and runs everything else.
+        timeout: Seconds the whole workflow may take. The deadline also
+            bounds every delegation the steps start (see
+            agentic_crew.runners.base.use_deadline).
+
+    Returns:
+        The workflow result.
+
+    Raises:
+        ValueError: If steps are invalid (duplicate names, unknown
+            dependencies, cycles) or a limit or policy is invalid.
+        WorkflowError: If a step fails under FAIL_FAST.
+        DeadlineExceeded: If the workflow did not finish within timeout;
+            running steps are cancelled and count as skipped, and the
+            exception's partial attribute holds the result so far.
+    """
+    if on_error not in ERROR_POLICIES:
+        raise ValueError(f"on_error must be one of {ERROR_POLICIES}, got {on_error!r}")
+    limits = dict(role_limits or {})
+    for name, limit in [("max_parallel", max_parallel), *limits.items()]:
+        if limit is not None and limit <= 0:
+            raise ValueError(f"Concurrency limit for {name} must be positive, got {limit}")
+
+    by_name: dict[str, WorkflowStep] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate workflow step '{step.name}'")
+        by_name[step.name] = step
+    graph = TaskGraph({step.name: step.depends_on for step in steps})
+
+    slots = asyncio.Semaphore(max_parallel) if max_parallel else None
+    role_slots = {role: asyncio.Semaphore(limit) for role, limit in limits.items()}
+    result = WorkflowResult()
+    failed = asyncio.Event()
+    started = time.perf_counter()
+
+    async def run_step(step: WorkflowStep, dependencies: list[asyncio.Future]) -> None:
+        await asyncio.gather(*dependencies)
+        if any(dep not in result.outputs for dep in step.depends_on) or failed.is_set():
+            result.skipped.append(step.name)
+            return
+
+        inputs = _step_inputs(step, task, {dep: result.outputs[dep] for dep in step.depends_on})
+        async with _limit(role_slots.get(step.crew_role)), _limit(slots):
+            step_started = time.perf_counter()
+            try:
+                output = await delegate(step.crew_role, inputs)
+            except Exception as e:
+                result.durations_ms[step.name] = _elapsed_ms(step_started)
+                result.errors[step.name] = str(e)
+                if on_error == FAIL_FAST:
+                    failed.set()
+                    raise WorkflowError(step.name, result) from e
+                return
+        result.durations_ms[step.name] = _elapsed_ms(step_started)
+        result.outputs[step.name] = output
+
+    runs: dict[str, asyncio.Future] = {}
+    timed_out = False
+    try:
+        with use_deadline(timeout) as budget:
+            # Steps inherit the deadline from the context they start in
+            for name in graph.order():
+                runs[name] = asyncio.ensure_future(
+                    run_step(by_name[name], [runs[dep] for dep in graph.dependencies[name]])
+                )
+            try:
+                await asyncio.wait_for(asyncio.gather(*runs.values()), budget)
+            except asyncio.TimeoutError:  # noqa: UP041 (not the builtin before 3.11)
+                timed_out = remaining_time() == 0.0
+                raise
+    except BaseException:
+        for run in runs.values():
+            run.cancel()
+        await asyncio.gather(*runs.values(), return_exceptions=True)
+        # Steps cancelled mid-run or never started count as skipped
+        finished = set(result.outputs) | set(result.errors) | set(result.skipped)
+        result.skipped.extend(name for name in graph.order() if name not in finished)
+        if timed_out:
+            raise DeadlineExceeded(f"Workflow timed out after {budget:.1f}s", partial=result) from None
+        raise
+    finally:
+        result.duration_ms = _elapsed_ms(started)
+        # Finished steps only depend on succeeded, hence finished, steps
+        finished_graph = TaskGraph(
+            {name: deps for name, deps in graph.dependencies.items() if name in result.durations_ms}
+        )
+        result.critical_path = finished_graph.critical_path(result.durations_ms)
+    return result
+
+
+def _step_inputs(step: WorkflowStep, task: dict[str, Any] | str, outputs: dict[str, str]) -> dict[str, Any] | str:
+    """Resolve a step's inputs from its config and its dependencies' outputs."""
+    if callable(step.inputs):
+        return step.inputs(outputs)
+    if step.inputs is not None:
+        return step.inputs
+    if not outputs:
+        return task
+    base = dict(task) if isinstance(task, dict) else {"task": task}
+    return {**base, **outputs}
+
+
+def _limit(semaphore: asyncio.Semaphore | None) -> Any:
+    """Async context manager for an optional concurrency limit."""
+    return semaphore if semaphore is not None else contextlib.nullcontext()
+
+
+def _elapsed_ms(started: float) -> int:
+    return int((time.perf_counter() - started) * 1000)
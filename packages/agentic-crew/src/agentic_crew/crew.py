@@ -10,9 +10,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
 from crewai import Crew
 
+from agentic_crew.utils.files import load_yaml
+
 
 def get_crewbase_path() -> Path:
     """Get path to crewbase.yaml."""
@@ -37,7 +38,7 @@ class CrewAgents:
         """Lazy load configuration."""
         if self._config is None:
             with open(self.config_path) as f:
-                self._config = yaml.safe_load(f)
+                self._config = load_yaml(f)
         return self._config
 
     @property
@@ -113,7 +114,7 @@ def load_crewbase():
     """Load crewbase.yaml configuration."""
     crewbase_path = Path(__file__).parent.parent.parent / "crewbase.yaml"
     with open(crewbase_path) as f:
-        return yaml.safe_load(f)
+        return load_yaml(f)
 
 
 def kickoff(inputs: dict[str, Any] | None = None):
@@ -14,24 +14,79 @@ Usage:
     # Run a crew
     agentic-crew run otterfall game_builder --input "Create a BiomeComponent"
     agentic-crew run otterfall game_builder --input "..." --json  # JSON output
+    agentic-crew run otterfall game_builder --input "..." --stream  # NDJSON events
 
     # Run with input from file
     agentic-crew run otterfall game_builder --file tasks.md
 
+    # Run a crew over every line of a JSONL file, 8 at a time
+    agentic-crew batch otterfall game_builder --inputs species.jsonl --concurrency 8
+
     # Show crew details
     agentic-crew info otterfall game_builder --json
+
+    # Compile crew configs into bundles for fast cold start
+    agentic-crew compile
+
+    # Serve JSON-RPC requests on stdin/stdout (for long-lived clients)
+    agentic-crew serve --stdio
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
 import json
 import sys
 import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import TextIO
+
+from agentic_crew.core.discovery import (
+    discover_all_framework_configs,
+    discover_packages,
+    get_crew_config,
+    list_crews,
+)
+
+
+def crews_payload(crews_by_package: dict[str, list[dict]]) -> dict:
+    """Build the `list --json` response from list_crews() output."""
+    # Flatten to list for JSON output
+    all_crews = []
+    for pkg_name, crews in crews_by_package.items():
+        for crew in crews:
+            all_crews.append(
+                {
+                    "package": pkg_name,
+                    "name": crew["name"],
+                    "description": crew.get("description", ""),
+                    "required_framework": crew.get("required_framework"),
+                }
+            )
+    return {"crews": all_crews}
+
+
+def crew_info_payload(package: str, crew: str, config: dict) -> dict:
+    """Build the `info --json` response for a loaded crew config."""
+    return {
+        "package": package,
+        "name": crew,
+        "description": config.get("description", ""),
+        "required_framework": config.get("required_framework"),
+        "agents": [{"name": name, "role": cfg.get("role", name)} for name, cfg in config.get("agents", {}).items()],
+        "tasks": [
+            {"name": name, "description": cfg.get("description", "")} for name, cfg in config.get("tasks", {}).items()
+        ],
+        "knowledge_paths": [str(kp) for kp in config.get("knowledge_paths", [])],
+    }
 
-from agentic_crew.core.discovery import discover_packages, get_crew_config, list_crews
-from agentic_crew.core.runner import run_crew
+
+def crew_inputs(input_text: str) -> dict[str, str]:
+    """Map CLI input text to the input keys crews expect."""
+    return {"spec": input_text, "component_spec": input_text, "input": input_text}
 
 
 def cmd_list(args):
@@ -45,19 +100,7 @@ def cmd_list(args):
     )
 
     if use_json:
-        # Flatten to list for JSON output
-        all_crews = []
-        for pkg_name, crews in crews_by_package.items():
-            for crew in crews:
-                all_crews.append(
-                    {
-                        "package": pkg_name,
-                        "name": crew["name"],
-                        "description": crew.get("description", ""),
-                        "required_framework": crew.get("required_framework"),
-                    }
-                )
-        print(json.dumps({"crews": all_crews}, indent=2))
+        print(json.dumps(crews_payload(crews_by_package), indent=2))
         return
 
     if not crews_by_package:
@@ -83,18 +126,42 @@ def cmd_list(args):
             print(f"   • {crew['name']}{framework_info}: {desc}")
 
 
+def _print_event(payload: dict, out: TextIO) -> None:
+    """Write one NDJSON event line for `run --stream`."""
+    out.write(json.dumps(payload, default=str) + "\n")
+    out.flush()
+
+
 def cmd_run(args):
     """Run a specific crew or single-agent task."""
+    if getattr(args, "stream", False):
+        # Keep stdout for NDJSON events: anything else printed while the crew
+        # runs (CrewAI verbose output, config warnings) goes to stderr, as in
+        # server.serve_stdio
+        events_out = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            return _cmd_run(args, emit=functools.partial(_print_event, out=events_out))
+    return _cmd_run(args, emit=None)
+
+
+def _cmd_run(args, emit: Callable[[dict], None] | None):
+    """Run a crew; with emit set, report NDJSON events through it (`--stream`)."""
     use_json = getattr(args, "json", False)
+    use_stream = emit is not None
     start_time = time.time()
 
     # Check if using single-agent runner
     if hasattr(args, "runner") and args.runner:
+        if emit is not None:
+            emit({"type": "error", "error": "--stream is not supported with --runner"})
+            sys.exit(2)
         return _cmd_run_single_agent(args, use_json, start_time)
 
     # Multi-agent crew execution requires package and crew
     if not args.package or not args.crew:
-        if use_json:
+        if emit is not None:
+            emit({"type": "error", "error": "Package and crew are required for multi-agent execution."})
+        elif use_json:
             print(
                 json.dumps(
                     {
@@ -111,9 +178,9 @@ def cmd_run(args):
         sys.exit(2)
 
     # Multi-agent crew execution (existing logic)
-    from agentic_crew.core.decomposer import detect_framework, run_crew_auto
+    from agentic_crew.core.decomposer import detect_framework, run_crew_auto, stream_crew_auto
 
-    if not use_json:
+    if not use_json and not use_stream:
         print("=" * 60)
         print(f"🚀 Running {args.package}/{args.crew}")
         print("=" * 60)
@@ -126,12 +193,20 @@ def cmd_run(args):
     else:
         input_text = ""
 
-    inputs = {"spec": input_text, "component_spec": input_text, "input": input_text}
+    inputs = crew_inputs(input_text)
 
     # Discover package and load config
     packages = discover_packages()
     if args.package not in packages:
-        if use_json:
+        if emit is not None:
+            emit(
+                {
+                    "type": "error",
+                    "error": f"Package '{args.package}' not found",
+                    "available_packages": list(packages.keys()),
+                }
+            )
+        elif use_json:
             print(
                 json.dumps(
                     {
@@ -157,6 +232,15 @@ def cmd_run(args):
         requested = args.framework if args.framework != "auto" else None
         framework_used = required or requested or detect_framework()
 
+        if emit is not None:
+            for event in stream_crew_auto(crew_config, inputs=inputs, framework=requested):
+                payload = event.to_dict()
+                if event.type == "final":
+                    payload["framework_used"] = framework_used
+                    payload["duration_ms"] = int((time.time() - start_time) * 1000)
+                emit(payload)
+            return
+
         if not use_json:
             if required:
                 print(f"📋 Framework: {required} (required by .{required}/ directory)")
@@ -192,7 +276,9 @@ def cmd_run(args):
 
     except (ValueError, RuntimeError) as e:
         duration_ms = int((time.time() - start_time) * 1000)
-        if use_json:
+        if emit is not None:
+            emit({"type": "error", "error": str(e), "duration_ms": duration_ms})
+        elif use_json:
             print(
                 json.dumps(
                     {
@@ -319,6 +405,78 @@ def _cmd_run_single_agent(args, use_json: bool, start_time: float):
         sys.exit(1)
 
 
+def cmd_batch(args):
+    """Run a crew over many inputs, writing one JSON result per line."""
+    from agentic_crew.core.decomposer import run_crew_batch
+    from agentic_crew.core.process_pool import CrewProcessPool
+
+    start_time = time.time()
+    packages = discover_packages()
+    if args.package not in packages:
+        print(f"❌ Package '{args.package}' not found.", file=sys.stderr)
+        print(f"Available: {list(packages.keys())}", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        crew_config = get_crew_config(packages[args.package], args.crew)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(2)
+
+    requested = args.framework if args.framework != "auto" else None
+    succeeded = failed = 0
+    in_file = sys.stdin if args.inputs == "-" else open(args.inputs, encoding="utf-8")  # noqa: SIM115
+    out_file = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout  # noqa: SIM115
+    pool = CrewProcessPool(max_workers=args.processes) if args.processes else None
+    try:
+        results = run_crew_batch(
+            crew_config,
+            _read_batch_inputs(in_file, args.inputs),
+            concurrency=args.concurrency,
+            framework=requested,
+            pool=pool,
+        )
+        for result in results:
+            if result.success:
+                succeeded += 1
+            else:
+                failed += 1
+            # Written as each run finishes so partial results survive interruption
+            out_file.write(json.dumps(result.to_dict(), default=str) + "\n")
+            out_file.flush()
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(2)
+    finally:
+        if pool is not None:
+            pool.close()
+        if in_file is not sys.stdin:
+            in_file.close()
+        if out_file is not sys.stdout:
+            out_file.close()
+
+    duration = time.time() - start_time
+    print(f"{'✅' if not failed else '⚠️'} {succeeded} succeeded, {failed} failed in {duration:.1f}s", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+def _read_batch_inputs(lines, source: str):
+    """Yield crew inputs from JSONL lines (objects, or strings used as --input)."""
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"{source}:{line_number}: invalid JSON ({e})") from e
+        if isinstance(item, str):
+            item = crew_inputs(item)
+        elif not isinstance(item, dict):
+            raise ValueError(f"{source}:{line_number}: expected a JSON object or string")
+        yield item
+
+
 def cmd_build(args):
     """Legacy build command - runs otterfall game_builder."""
     print("=" * 60)
@@ -327,6 +485,8 @@ def cmd_build(args):
     print()
     print(f"Building: {args.spec[:100]}...")
 
+    from agentic_crew.core.runner import run_crew
+
     inputs = {"spec": args.spec, "component_spec": args.spec}
 
     try:
@@ -373,25 +533,7 @@ def cmd_info(args):
         sys.exit(2)
 
     if use_json:
-        print(
-            json.dumps(
-                {
-                    "package": args.package,
-                    "name": args.crew,
-                    "description": config.get("description", ""),
-                    "required_framework": config.get("required_framework"),
-                    "agents": [
-                        {"name": name, "role": cfg.get("role", name)} for name, cfg in config.get("agents", {}).items()
-                    ],
-                    "tasks": [
-                        {"name": name, "description": cfg.get("description", "")}
-                        for name, cfg in config.get("tasks", {}).items()
-                    ],
-                    "knowledge_paths": config.get("knowledge_paths", []),
-                },
-                indent=2,
-            )
-        )
+        print(json.dumps(crew_info_payload(args.package, args.crew, config), indent=2))
         return
 
     print("=" * 60)
@@ -414,6 +556,74 @@ def cmd_info(args):
         print(f"   • {kp}")
 
 
+def cmd_compile(args):
+    """Compile crew config directories into bundles."""
+    import yaml
+
+    from agentic_crew.core.bundle import compile_bundle
+
+    use_json = getattr(args, "json", False)
+    configs = discover_all_framework_configs()
+
+    if args.package:
+        if args.package not in configs:
+            if use_json:
+                print(
+                    json.dumps(
+                        {
+                            "error": f"Package '{args.package}' not found",
+                            "available_packages": list(configs.keys()),
+                        }
+                    )
+                )
+            else:
+                print(f"❌ Package '{args.package}' not found.")
+                print(f"Available: {list(configs.keys())}")
+            sys.exit(2)
+        configs = {args.package: configs[args.package]}
+
+    bundles = []
+    failed = False
+    for pkg_name, config_dirs in configs.items():
+        for config_dir in config_dirs.values():
+            try:
+                summary = compile_bundle(config_dir)
+            except (OSError, ValueError, yaml.YAMLError) as e:
+                failed = True
+                bundles.append({"package": pkg_name, "config_dir": str(config_dir), "error": str(e)})
+                if not use_json:
+                    print(f"❌ {pkg_name} ({config_dir.name}): {e}")
+                continue
+
+            bundles.append(
+                {
+                    "package": pkg_name,
+                    "config_dir": str(config_dir),
+                    "path": str(summary["path"]),
+                    "crews": summary["crews"],
+                    "content_hash": summary["content_hash"],
+                }
+            )
+            if not use_json:
+                crews = ", ".join(summary["crews"]) or "no crews"
+                print(f"✅ {pkg_name} ({config_dir.name}): {crews} [{summary['content_hash'][:12]}]")
+
+    if use_json:
+        print(json.dumps({"bundles": bundles}, indent=2))
+    elif not bundles:
+        print("No packages with crew configuration directories found.")
+
+    if failed:
+        sys.exit(1)
+
+
+def cmd_serve(args):
+    """Serve JSON-RPC requests over stdio."""
+    from agentic_crew.server import serve_stdio
+
+    sys.exit(serve_stdio(max_workers=args.max_workers))
+
+
 def cmd_list_runners(args):
     """List available single-agent CLI runners."""
     from agentic_crew.core.decomposer import (
@@ -516,6 +726,13 @@ Examples:
     # Show crew details
     agentic-crew info otterfall game_builder --json
 
+    # Compile crew configs into bundles for fast cold start
+    agentic-crew compile
+    agentic-crew compile otterfall --json
+
+    # Long-lived JSON-RPC server (list, info, run, cancel) on stdin/stdout
+    agentic-crew serve --stdio
+
 Exit codes:
     0 - Success
     1 - Crew execution failed
@@ -568,6 +785,35 @@ Exit codes:
         help="Auto-approve changes (default: true). Use --no-auto-approve to disable.",
     )
     run_parser.add_argument("--json", action="store_true", help="Output as JSON (for external tools)")
+    run_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Emit progress events as NDJSON while the crew runs (one JSON object per line, ending with 'final')",
+    )
+
+    # Batch command
+    batch_parser = subparsers.add_parser("batch", help="Run a crew over many inputs (JSONL in, JSONL out)")
+    batch_parser.add_argument("package", help="Package name")
+    batch_parser.add_argument("crew", help="Crew name")
+    batch_parser.add_argument(
+        "--inputs",
+        required=True,
+        help="JSONL file with one input per line (an object of crew inputs, or a string); '-' for stdin",
+    )
+    batch_parser.add_argument("--concurrency", "-c", type=int, default=4, help="Maximum number of concurrent runs")
+    batch_parser.add_argument(
+        "--processes",
+        type=int,
+        metavar="N",
+        help="Run the crews in N worker processes instead of threads (for CPU-heavy crews)",
+    )
+    batch_parser.add_argument("--output", "-o", help="Write JSONL results to this file instead of stdout")
+    batch_parser.add_argument(
+        "--framework",
+        choices=["auto", "crewai", "langgraph", "strands"],
+        default="auto",
+        help="Framework to use (auto=detect, or specify)",
+    )
 
     # Info command
     info_parser = subparsers.add_parser("info", help="Show crew details")
@@ -575,6 +821,21 @@ Exit codes:
     info_parser.add_argument("crew", help="Crew name")
     info_parser.add_argument("--json", action="store_true", help="Output as JSON (for external tools)")
 
+    # Compile command
+    compile_parser = subparsers.add_parser("compile", help="Compile crew configs into bundles for fast loading")
+    compile_parser.add_argument("package", nargs="?", help="Package to compile (default: all)")
+    compile_parser.add_argument("--json", action="store_true", help="Output as JSON (for external tools)")
+
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Serve JSON-RPC requests (list, info, run, cancel)")
+    serve_parser.add_argument(
+        "--stdio",
+        action="store_true",
+        required=True,
+        help="Read line-delimited JSON-RPC requests on stdin and answer on stdout",
+    )
+    serve_parser.add_argument("--max-workers", type=int, default=4, help="Maximum number of concurrent crew runs")
+
     # Legacy build command (for backwards compatibility)
     build_parser = subparsers.add_parser("build", help="Build a game component (legacy)")
     build_parser.add_argument("spec", help="Component specification")
@@ -591,8 +852,14 @@ Exit codes:
         cmd_list_runners(args)
     elif args.command == "run":
         cmd_run(args)
+    elif args.command == "batch":
+        cmd_batch(args)
     elif args.command == "info":
         cmd_info(args)
+    elif args.command == "compile":
+        cmd_compile(args)
+    elif args.command == "serve":
+        cmd_serve(args)
     elif args.command == "build":
         cmd_build(args)
     elif args.command == "list-knowledge":
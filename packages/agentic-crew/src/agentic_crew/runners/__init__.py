@@ -26,5 +26,6 @@ Usage:
 from __future__ import annotations
 
 from agentic_crew.core.decomposer import get_cli_runner, get_runner
+from agentic_crew.runners.events import CrewEvent
 
-__all__ = ["get_runner", "get_cli_runner"]
+__all__ = ["get_runner", "get_cli_runner", "CrewEvent"]
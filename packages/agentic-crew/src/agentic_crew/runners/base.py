@@ -21,6 +21,9 @@ To create a new runner for a framework:
    - `build_agent()` - Create framework-specific agent
    - `build_task()` - Create framework-specific task
 
+   Override `arun()` as well if the framework has an async API, and
+   `stream()`/`astream()` if it can report progress while running.
+
 3. **Register in decomposer** (core/decomposer.py):
    - Add to `FRAMEWORK_PRIORITY`
    - Add case to `get_runner()`
@@ -72,9 +75,161 @@ class SimpleRunner(BaseRunner):
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
+import functools
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Executor
 from typing import Any
 
+from agentic_crew.runners.events import FINAL, CrewEvent
+
+# Executor for thread-bound work of async runs (the default arun() and
+# crew builds in run_crew_auto_async). None means asyncio's default
+# executor; owners of a bounded pool, such as ManagerAgent, set it with
+# use_executor().
+run_executor: contextvars.ContextVar[Executor | None] = contextvars.ContextVar("run_executor", default=None)
+
+# Deadline (in time.monotonic() seconds) of the crew work started in this
+# context; see use_deadline() and remaining_time().
+run_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("run_deadline", default=None)
+
+# Set when the async caller of thread-bound work was cancelled; see
+# run_in_executor() and cancellation_requested().
+run_cancelled: contextvars.ContextVar[threading.Event | None] = contextvars.ContextVar("run_cancelled", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when crew work runs past its deadline.
+
+    Attributes:
+        partial: Results of the work that finished in time, if the caller
+            collects any (a list for ManagerAgent.delegate_parallel(), a
+            WorkflowResult for workflows), else None.
+    """
+
+    def __init__(self, message: str, partial: Any = None):
+        super().__init__(message)
+        self.partial = partial
+
+
+@contextlib.contextmanager
+def use_executor(executor: Executor | None) -> Iterator[None]:
+    """Run async crew work started in this context on the given executor."""
+    token = run_executor.set(executor)
+    try:
+        yield
+    finally:
+        run_executor.reset(token)
+
+
+@contextlib.contextmanager
+def use_cancellation(cancelled: threading.Event) -> Iterator[None]:
+    """Stop crew work started in this context once cancelled is set.
+
+    For callers that run crews synchronously and cancel them from another
+    thread; see cancellation_requested().
+    """
+    token = run_cancelled.set(cancelled)
+    try:
+        yield
+    finally:
+        run_cancelled.reset(token)
+
+
+@contextlib.contextmanager
+def use_deadline(timeout: float | None) -> Iterator[float | None]:
+    """Bound crew work started in this context to timeout seconds from now.
+
+    Deadlines nest: an inner deadline can only shorten the one already in
+    effect, so a per-delegation timeout never outlives its workflow's.
+
+    Args:
+        timeout: Seconds from now, or None to keep the current deadline.
+
+    Yields:
+        Seconds left until the effective deadline, or None if there is none.
+    """
+    deadline = run_deadline.get()
+    if timeout is not None:
+        ours = time.monotonic() + timeout
+        deadline = ours if deadline is None else min(deadline, ours)
+    token = run_deadline.set(deadline)
+    try:
+        yield remaining_time()
+    finally:
+        run_deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the current deadline (at least 0), or None."""
+    deadline = run_deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def cancellation_requested() -> bool:
+    """Whether thread-bound crew work should stop early.
+
+    True once the deadline has passed or the async caller that started the
+    work (through run_in_executor()) was cancelled. Long-running runners
+    poll this between steps, since threads cannot be interrupted.
+    """
+    cancelled = run_cancelled.get()
+    return (cancelled is not None and cancelled.is_set()) or remaining_time() == 0.0
+
+
+def stop_if_cancelled() -> None:
+    """Raise if cancellation_requested(); runners call this between steps.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed.
+        asyncio.CancelledError: If the async caller was cancelled.
+    """
+    cancellation_checker()()
+
+
+def cancellation_checker() -> Callable[[], None]:
+    """Return stop_if_cancelled() bound to the current context.
+
+    Framework callbacks may run in threads that do not see this context's
+    variables (CrewAI runs async tasks in plain threads), so they call the
+    returned function instead.
+    """
+    deadline = run_deadline.get()
+    cancelled = run_cancelled.get()
+
+    def check() -> None:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise DeadlineExceeded("Crew run stopped: deadline passed")
+        if cancelled is not None and cancelled.is_set():
+            raise asyncio.CancelledError()
+
+    return check
+
+
+async def run_in_executor(func: Any, *args: Any) -> Any:
+    """Call func in the current run executor, keeping context variables.
+
+    If the caller is cancelled before func starts, it never runs. If func
+    is already running, its thread cannot be interrupted; it is told to
+    stop through cancellation_requested() instead.
+    """
+    cancelled = threading.Event()
+    context = contextvars.copy_context()
+    context.run(run_cancelled.set, cancelled)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(run_executor.get(), functools.partial(context.run, func, *args))
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
+
 
 class BaseRunner(ABC):
     """Abstract base class for framework runners.
@@ -85,6 +240,9 @@ class BaseRunner(ABC):
     Attributes:
         framework_name: String identifier for this framework (e.g., "crewai",
             "langgraph", "strands"). Used for logging and framework selection.
+        reusable_crews: Whether a crew returned by build_crew() may be cached
+            and run again by run_crew_auto(). Runners whose crews keep state
+            between runs (e.g., conversation history) set this to False.
 
     Example:
         Basic runner usage with auto-detection:
@@ -120,6 +278,7 @@ class BaseRunner(ABC):
     """
 
     framework_name: str = "base"
+    reusable_crews: bool = True
 
     @abstractmethod
     def build_crew(self, crew_config: dict[str, Any]) -> Any:
@@ -145,7 +304,11 @@ class BaseRunner(ABC):
                     - description (str): What to do
                     - expected_output (str): What output looks like
                     - agent (str): Name of agent to execute this task
-                    - context (list[str], optional): Names of prior tasks
+                    - context (list[str], optional): Names of tasks this
+                      task depends on; ``[]`` marks it independent. Without
+                      the key it depends on the previous task. Runners may
+                      run independent tasks concurrently (see
+                      agentic_crew.core.task_graph).
                 - knowledge_paths (list[Path], optional): Directories with
                   knowledge files (.md, .txt, etc.)
                 - process (str, optional): "sequential" or "hierarchical"
@@ -223,6 +386,66 @@ class BaseRunner(ABC):
         """
         pass
 
+    async def arun(self, crew: Any, inputs: dict[str, Any]) -> str:
+        """Execute the crew with inputs without blocking the event loop.
+
+        Runners override this with the framework's native async API
+        (LangGraph ainvoke, Strands invoke_async).
+        The default implementation runs run() in a worker thread of the
+        current run executor (see use_executor()).
+
+        Args:
+            crew: Framework-specific crew object from build_crew().
+            inputs: Input dict to pass to the crew.
+
+        Returns:
+            Crew output as a string.
+
+        Example:
+            ```python
+            results = await asyncio.gather(
+                runner.arun(crew, {"topic": "caching"}),
+                runner.arun(other_crew, {"topic": "indexing"}),
+            )
+            ```
+        """
+        return await run_in_executor(self.run, crew, inputs)
+
+    def stream(self, crew: Any, inputs: dict[str, Any]) -> Iterator[CrewEvent]:
+        """Execute the crew, yielding progress events as it runs.
+
+        Runners override this to report task starts, token deltas, tool
+        calls and task results (see agentic_crew.runners.events). The
+        default implementation only yields the final output.
+
+        Args:
+            crew: Framework-specific crew object from build_crew().
+            inputs: Input dict to pass to the crew.
+
+        Yields:
+            CrewEvent objects; the last one has type "final".
+
+        Example:
+            ```python
+            for event in runner.stream(crew, {"topic": "caching"}):
+                if event.type == "token":
+                    print(event.delta, end="")
+            ```
+        """
+        yield CrewEvent(FINAL, output=self.run(crew, inputs))
+
+    async def astream(self, crew: Any, inputs: dict[str, Any]) -> AsyncIterator[CrewEvent]:
+        """Async variant of stream().
+
+        Args:
+            crew: Framework-specific crew object from build_crew().
+            inputs: Input dict to pass to the crew.
+
+        Yields:
+            CrewEvent objects; the last one has type "final".
+        """
+        yield CrewEvent(FINAL, output=await self.arun(crew, inputs))
+
     def build_and_run(
         self,
         crew_config: dict[str, Any],
@@ -10,10 +10,31 @@ This is the default and most full-featured runner. CrewAI provides:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Callable, Iterator
 from pathlib import Path
 from typing import Any
 
-from agentic_crew.runners.base import BaseRunner
+from agentic_crew.core.task_graph import TaskGraph
+from agentic_crew.runners.base import BaseRunner, DeadlineExceeded, cancellation_checker, run_in_executor
+from agentic_crew.runners.events import (
+    FINAL,
+    TASK_FINISHED,
+    TASK_STARTED,
+    TOOL_CALL,
+    USAGE_KEYS,
+    CrewEvent,
+    iterate_async,
+)
+
+# Reported usage key -> CrewAI UsageMetrics attribute (CrewAI does not count cache writes)
+_USAGE_METRICS = {
+    "input_tokens": "prompt_tokens",
+    "output_tokens": "completion_tokens",
+    "total_tokens": "total_tokens",
+    "cache_read_tokens": "cached_prompt_tokens",
+}
 
 
 class CrewAIRunner(BaseRunner):
@@ -48,21 +69,35 @@ class CrewAIRunner(BaseRunner):
             agent_tools = self._resolve_tools(agent_cfg.get("tools", []))
             agents[agent_name] = self.build_agent(agent_cfg, tools=agent_tools)
 
-        # Build tasks, tracking them for context dependencies
+        # Determine process type
+        process_type = crew_config.get("process", "sequential")
+        process = Process.hierarchical if process_type == "hierarchical" else Process.sequential
+
+        # Order tasks by their context dependencies; independent tasks run
+        # concurrently via async_execution in sequential crews
         tasks_config = crew_config.get("tasks", {})
+        graph = TaskGraph.from_tasks(tasks_config)
+        async_tasks = self._plan_async_tasks(graph, tasks_config) if process == Process.sequential else set()
+
+        # Build tasks, tracking them for context dependencies
         tasks = []
         tasks_by_name: dict[str, Any] = {}
-        for task_name, task_cfg in tasks_config.items():
+        for task_name in graph.order():
+            task_cfg = tasks_config[task_name]
             agent_name = task_cfg.get("agent")
             if not agent_name or agent_name not in agents:
                 raise ValueError(f"Task '{task_name}' has invalid agent: {agent_name}")
 
-            # Build context from referenced tasks
-            context_tasks = []
-            for ctx_name in task_cfg.get("context", []):
-                if ctx_name in tasks_by_name:
-                    context_tasks.append(tasks_by_name[ctx_name])
+            # Build context from referenced tasks (already built: graph order).
+            # A declared empty context stays empty: CrewAI would otherwise
+            # give the task every earlier task's output.
+            context_tasks = None
+            if "context" in task_cfg:
+                context_tasks = [tasks_by_name[ctx_name] for ctx_name in task_cfg["context"] or []]
 
+            task_cfg = {"name": task_name, **task_cfg}
+            if task_name in async_tasks:
+                task_cfg["async_execution"] = True
             task = self.build_task(task_cfg, agents[agent_name], context=context_tasks)
             tasks.append(task)
             tasks_by_name[task_name] = task
@@ -70,10 +105,6 @@ class CrewAIRunner(BaseRunner):
         # Load knowledge sources
         knowledge_sources = self._load_knowledge(crew_config.get("knowledge_paths", []))
 
-        # Determine process type
-        process_type = crew_config.get("process", "sequential")
-        process = Process.hierarchical if process_type == "hierarchical" else Process.sequential
-
         return Crew(
             agents=list(agents.values()),
             tasks=tasks,
@@ -93,8 +124,151 @@ class CrewAIRunner(BaseRunner):
 
         Returns:
             Crew output as string.
+
+        Raises:
+            DeadlineExceeded: If the deadline passed during the run.
+            asyncio.CancelledError: If the async caller that started the run
+                (see arun()) was cancelled.
+        """
+        with self._cancellation_callbacks(crew):
+            try:
+                result = crew.kickoff(inputs=inputs)
+            except _RunStopped as stopped:
+                raise stopped.error from None
+        return self._output_text(result)
+
+    async def arun(self, crew: Any, inputs: dict[str, Any]) -> str:
+        """Execute the CrewAI crew in a thread of the current run executor.
+
+        CrewAI's kickoff_async() only wraps kickoff() in asyncio.to_thread(),
+        which would use the event loop's default executor and bypass a
+        ManagerAgent's bounded pool (see use_executor()), so run() is called
+        through run_in_executor() instead. If this coroutine is cancelled,
+        the crew stops at its next agent step or task.
+
+        Args:
+            crew: CrewAI Crew object.
+            inputs: Inputs for the crew.
+
+        Returns:
+            Crew output as string.
+        """
+        return await run_in_executor(self.run, crew, inputs)
+
+    def stream(self, crew: Any, inputs: dict[str, Any]) -> Iterator[CrewEvent]:
+        """Execute the CrewAI crew, yielding task and tool call events.
+
+        Drives astream() on a private event loop; use astream() from
+        async code.
+
+        Args:
+            crew: CrewAI Crew object.
+            inputs: Inputs for the crew.
+
+        Yields:
+            CrewEvent objects ending with the final output.
+        """
+        yield from iterate_async(self.astream(crew, inputs))
+
+    async def astream(self, crew: Any, inputs: dict[str, Any]) -> AsyncIterator[CrewEvent]:
+        """Execute the CrewAI crew, yielding events from its callbacks.
+
+        Tool calls come from the crew's step_callback and task results from
+        its task_callback; a task is reported as started when the previous
+        one finishes. Existing callbacks keep being called.
+
+        Args:
+            crew: CrewAI Crew object.
+            inputs: Inputs for the crew.
+
+        Yields:
+            CrewEvent objects ending with the final output and the crew's
+            token usage (reported as a single "crew" entry).
         """
-        result = crew.kickoff(inputs=inputs)
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue[CrewEvent] = asyncio.Queue()
+
+        def emit(event: CrewEvent) -> None:
+            # Callbacks run in CrewAI's worker thread
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        tasks = list(getattr(crew, "tasks", None) or [])
+        with self._stream_callbacks(crew, tasks, emit):
+            if tasks:
+                yield CrewEvent(TASK_STARTED, task=_task_name(tasks[0]))
+            run = asyncio.ensure_future(self.arun(crew, inputs))
+            try:
+                while not run.done() or not events.empty():
+                    getter = asyncio.ensure_future(events.get())
+                    await asyncio.wait({getter, run}, return_when=asyncio.FIRST_COMPLETED)
+                    if getter.done():
+                        yield getter.result()
+                    else:
+                        getter.cancel()
+            finally:
+                run.cancel()
+        yield CrewEvent(FINAL, output=run.result(), usage=_crew_usage(crew))
+
+    @contextlib.contextmanager
+    def _stream_callbacks(self, crew: Any, tasks: list, emit: Callable[[CrewEvent], None]) -> Iterator[None]:
+        """Temporarily install crew callbacks that emit CrewEvents."""
+        step_callback, task_callback = crew.step_callback, crew.task_callback
+        next_tasks = iter(tasks[1:])
+
+        def on_step(step: Any) -> None:
+            # AgentAction has a tool; AgentFinish does not
+            if getattr(step, "tool", None):
+                emit(CrewEvent(TOOL_CALL, tool=step.tool, tool_input=getattr(step, "tool_input", None)))
+            if step_callback:
+                step_callback(step)
+
+        def on_task(output: Any) -> None:
+            emit(CrewEvent(TASK_FINISHED, task=_task_name(output), output=self._output_text(output)))
+            next_task = next(next_tasks, None)
+            if next_task is not None:
+                emit(CrewEvent(TASK_STARTED, task=_task_name(next_task)))
+            if task_callback:
+                task_callback(output)
+
+        crew.step_callback, crew.task_callback = on_step, on_task
+        try:
+            yield
+        finally:
+            crew.step_callback, crew.task_callback = step_callback, task_callback
+
+    @contextlib.contextmanager
+    def _cancellation_callbacks(self, crew: Any) -> Iterator[None]:
+        """Temporarily install crew callbacks that stop the run once cancelled.
+
+        Checked at every agent step and task; see cancellation_requested().
+        """
+        step_callback, task_callback = crew.step_callback, crew.task_callback
+        check = cancellation_checker()
+
+        def stop_if_cancelled() -> None:
+            try:
+                check()
+            except (DeadlineExceeded, asyncio.CancelledError) as e:
+                raise _RunStopped(e) from e
+
+        def on_step(step: Any) -> None:
+            stop_if_cancelled()
+            if step_callback:
+                step_callback(step)
+
+        def on_task(output: Any) -> None:
+            if task_callback:
+                task_callback(output)
+            stop_if_cancelled()
+
+        crew.step_callback, crew.task_callback = on_step, on_task
+        try:
+            yield
+        finally:
+            crew.step_callback, crew.task_callback = step_callback, task_callback
+
+    def _output_text(self, result: Any) -> str:
+        """Normalize a CrewOutput to its raw text."""
         return result.raw if hasattr(result, "raw") else str(result)
 
     def build_agent(self, agent_config: dict[str, Any], tools: list | None = None) -> Any:
@@ -130,7 +304,9 @@ class CrewAIRunner(BaseRunner):
         Args:
             task_config: Task configuration.
             agent: Agent to assign to the task.
-            context: Optional list of tasks this task depends on.
+            context: Tasks this task depends on. None leaves CrewAI's
+                default (the outputs of all earlier tasks); an empty list
+                gives the task no context.
 
         Returns:
             CrewAI Task object.
@@ -143,12 +319,55 @@ class CrewAIRunner(BaseRunner):
             "agent": agent,
         }
 
+        # Name tasks so task callbacks and streamed events can identify them
+        if task_config.get("name"):
+            task_kwargs["name"] = task_config["name"]
+
+        if task_config.get("async_execution"):
+            task_kwargs["async_execution"] = True
+
         # Add context if provided (for task chaining)
-        if context:
+        if context is not None:
             task_kwargs["context"] = context
 
         return Task(**task_kwargs)
 
+    def _plan_async_tasks(self, graph: TaskGraph, tasks_config: dict[str, Any]) -> set[str]:
+        """Choose which tasks run with async_execution in a sequential crew.
+
+        CrewAI starts each async task and moves on to the next task; a sync
+        task first waits for every pending async task and only then runs.
+        All tasks of a graph level therefore run async together, and the
+        first task of the next level is the sync barrier that waits for
+        them (CrewAI also rejects async tasks whose context holds async
+        tasks without a sync task in between). The crew ends with a sync
+        task, since CrewAI allows at most one trailing async task.
+
+        Crews that set async_execution on any task keep their own settings.
+
+        Args:
+            graph: The crew's task graph.
+            tasks_config: Task configs by name.
+
+        Returns:
+            Names of the tasks to run asynchronously.
+        """
+        if any("async_execution" in task_cfg for task_cfg in tasks_config.values()):
+            return set()
+
+        async_tasks: set[str] = set()
+        levels = graph.levels()
+        previous_async = False
+        for index, level in enumerate(levels):
+            candidates = level[1:] if previous_async else level
+            if index == len(levels) - 1:
+                candidates = candidates[:-1]
+            if len(level) == 1:
+                candidates = []
+            async_tasks.update(candidates)
+            previous_async = bool(candidates)
+        return async_tasks
+
     def _resolve_tools(self, tool_names: list[str]) -> list:
         """Resolve tool names to actual tool instances.
 
@@ -191,3 +410,29 @@ class CrewAIRunner(BaseRunner):
                         print(f"Warning: Could not load knowledge file {file_path}: {e}")
 
         return sources
+
+
+class _RunStopped(BaseException):
+    """Carries a cancellation out of CrewAI callbacks.
+
+    A BaseException, so CrewAI's task retries (which catch Exception) do not
+    restart a task that was told to stop.
+    """
+
+    def __init__(self, error: BaseException):
+        super().__init__(str(error))
+        self.error = error
+
+
+def _task_name(task: Any) -> str:
+    """Name of a CrewAI Task or TaskOutput, falling back to its description."""
+    return getattr(task, "name", None) or getattr(task, "description", "")
+
+
+def _crew_usage(crew: Any) -> dict[str, dict[str, int]] | None:
+    """Token usage of a crew's last kickoff from its usage_metrics, if reported."""
+    metrics = getattr(crew, "usage_metrics", None)
+    values = {key: getattr(metrics, attr, None) for key, attr in _USAGE_METRICS.items()}
+    if not all(isinstance(value, int) for value in values.values()):
+        return None
+    return {"crew": {key: values.get(key) or 0 for key in USAGE_KEYS}}
@@ -0,0 +1,121 @@
+"""Normalized events emitted while a crew runs.
+
+BaseRunner.stream() and astream() yield CrewEvent objects with the same
+shape for every framework, so UIs and the CLI (`agentic-crew run
+--stream`) can show progress without knowing which framework ran the crew.
+
+Event types:
+
+    task_started    task
+    token           task?, delta          (model output as it is generated)
+    tool_call       task?, tool, tool_input
+    task_finished   task, output?
+    final           output, usage?        (always the last event)
+
+Frameworks report different levels of detail; a runner only emits the
+events its framework exposes, but every stream ends with a final event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, TypeVar
+
+TASK_STARTED = "task_started"
+TOKEN = "token"
+TOOL_CALL = "tool_call"
+TASK_FINISHED = "task_finished"
+FINAL = "final"
+
+# Reported by callers (e.g., the CLI) when a run fails mid-stream
+ERROR = "error"
+
+# Counters in each entry of a FINAL event's usage; cache_read_tokens are
+# input tokens served from the prompt cache, cache_write_tokens those
+# written to it
+USAGE_KEYS = ("input_tokens", "output_tokens", "total_tokens", "cache_read_tokens", "cache_write_tokens")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CrewEvent:
+    """A single event from a running crew.
+
+    Attributes:
+        type: One of TASK_STARTED, TOKEN, TOOL_CALL, TASK_FINISHED, FINAL.
+        task: Name of the task (or graph node) the event belongs to.
+        delta: Newly generated text for TOKEN events.
+        tool: Tool name for TOOL_CALL events.
+        tool_input: Tool arguments for TOOL_CALL events.
+        output: Task output for TASK_FINISHED, crew output for FINAL.
+        usage: Token usage for FINAL events from runners that report it,
+            as agent (or task) name -> counts for each of USAGE_KEYS.
+    """
+
+    type: str
+    task: str | None = None
+    delta: str | None = None
+    tool: str | None = None
+    tool_input: Any = None
+    output: str | None = None
+    usage: dict[str, dict[str, int]] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the event as a JSON-ready dict without unset fields."""
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+def iterate_async(agen: AsyncIterator[T]) -> Iterator[T]:
+    """Iterate an async iterator from synchronous code.
+
+    Drives the iterator on a private event loop, so it must not be called
+    from a thread that is already running one.
+
+    Args:
+        agen: Async iterator to consume.
+
+    Yields:
+        Items produced by the async iterator.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(agen, "aclose", None)
+        if aclose is not None:
+            loop.run_until_complete(aclose())
+        loop.close()
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    asyncio.run() refuses to start inside a thread that is already running
+    an event loop (e.g. a sync call made from async code or a notebook), so
+    in that case the coroutine runs on a private loop in a worker thread,
+    with the caller's context variables (deadline, cancellation, executor).
+    The calling thread blocks until it finishes.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agentic-crew-loop") as pool:
+        return pool.submit(context.run, asyncio.run, coro).result()
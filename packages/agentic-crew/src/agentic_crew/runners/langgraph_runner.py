@@ -9,9 +9,19 @@ LangGraph excels at:
 
 from __future__ import annotations
 
+import operator
+import os
+from collections.abc import AsyncIterator, Iterator, Mapping
 from typing import Any
 
-from agentic_crew.runners.base import BaseRunner
+from agentic_crew.config.llm import cacheable_prompt
+from agentic_crew.core.task_graph import TaskGraph, task_prompt
+from agentic_crew.runners.base import BaseRunner, stop_if_cancelled
+from agentic_crew.runners.events import FINAL, TASK_FINISHED, TASK_STARTED, TOKEN, TOOL_CALL, USAGE_KEYS, CrewEvent
+
+# Stream modes used by stream()/astream(): model tokens, per-node updates
+# (for task boundaries and tool calls) and full state (for the final output)
+STREAM_MODES = ["messages", "updates", "values"]
 
 
 class LangGraphRunner(BaseRunner):
@@ -29,32 +39,72 @@ class LangGraphRunner(BaseRunner):
     def build_crew(self, crew_config: dict[str, Any]) -> Any:
         """Build a LangGraph workflow from configuration.
 
-        Converts crew format to a LangGraph StateGraph with agents as nodes
-        and tasks as edges.
+        Each task becomes a graph node run by its agent, with edges taken
+        from task ``context`` (see TaskGraph), so independent tasks fan out
+        and run in the same superstep and joins wait for all their
+        dependencies. Crews without tasks become a single ReAct agent.
+
+        Compiled graphs hold no per-run state, so run_crew_auto() shares
+        them between runs through its built-crew cache.
 
         Args:
             crew_config: Universal crew configuration.
 
         Returns:
             Compiled LangGraph StateGraph.
-        """
-        from langgraph.prebuilt import create_react_agent
-
-        # For simple crews, create a ReAct agent
-        # More complex crews could be converted to full StateGraphs
 
+        Raises:
+            ValueError: If a task references an unknown agent or the task
+                context is invalid.
+        """
         # Get LLM from config (respects the framework's configuration)
         llm_config = crew_config.get("llm", {})
         model = llm_config.get("model") if isinstance(llm_config, dict) else llm_config
-        llm = self.get_llm(model)
 
-        # Build tools from task descriptions
-        tools = self._build_tools_from_tasks(crew_config)
-
-        # Create agent
-        agent = create_react_agent(llm, tools)
-
-        return agent
+        tasks_config = crew_config.get("tasks", {})
+        if not tasks_config:
+            from langgraph.prebuilt import create_react_agent
+
+            tools = self._build_tools_from_tasks(crew_config)
+            return create_react_agent(self.get_llm(model), tools)
+
+        from langchain_core.runnables import RunnableLambda
+        from langgraph.graph import END, START, StateGraph
+
+        task_graph = TaskGraph.from_tasks(tasks_config)
+        agents_config = crew_config.get("agents", {})
+        agents: dict[str, Any] = {}
+        builder = StateGraph(_crew_state())
+
+        for task_name in task_graph.order():
+            task_cfg = tasks_config[task_name]
+            agent_name = task_cfg.get("agent")
+            if agent_name not in agents_config:
+                raise ValueError(f"Task '{task_name}' has invalid agent: {agent_name}")
+            if agent_name not in agents:
+                agent_cfg = agents_config[agent_name]
+                agents[agent_name] = self.build_agent({**agent_cfg, "llm": agent_cfg.get("llm") or model})
+
+            node = _TaskNode(
+                name=task_name,
+                task=self.build_task(task_cfg, agents[agent_name]),
+                system_prompt=_agent_prompt(agents_config[agent_name]),
+                dependencies=task_graph.dependencies[task_name],
+            )
+            builder.add_node(task_name, RunnableLambda(node.invoke, afunc=node.ainvoke, name=task_name))
+
+            deps = list(task_graph.dependencies[task_name])
+            if not deps:
+                builder.add_edge(START, task_name)
+            else:
+                # A list of sources waits for all of them (fan-in)
+                builder.add_edge(deps if len(deps) > 1 else deps[0], task_name)
+
+        for task_name, dependents in task_graph.dependents().items():
+            if not dependents:
+                builder.add_edge(task_name, END)
+
+        return builder.compile()
 
     def run(self, crew: Any, inputs: dict[str, Any]) -> str:
         """Execute the LangGraph workflow.
@@ -66,12 +116,65 @@ class LangGraphRunner(BaseRunner):
         Returns:
             Workflow output as string.
         """
-        # Convert inputs to messages format
-        user_message = inputs.get("input", inputs.get("task", str(inputs)))
+        result = crew.invoke(self._graph_input(inputs), config=_run_config(inputs))
+        return self._output_text(result)
 
-        result = crew.invoke({"messages": [("user", user_message)]})
+    async def arun(self, crew: Any, inputs: dict[str, Any]) -> str:
+        """Execute the LangGraph workflow with ainvoke.
+
+        Args:
+            crew: Compiled LangGraph.
+            inputs: Inputs for the workflow.
+
+        Returns:
+            Workflow output as string.
+        """
+        result = await crew.ainvoke(self._graph_input(inputs), config=_run_config(inputs))
+        return self._output_text(result)
+
+    def stream(self, crew: Any, inputs: dict[str, Any]) -> Iterator[CrewEvent]:
+        """Execute the LangGraph workflow, yielding events as nodes run.
+
+        Graph nodes are reported as tasks.
+
+        Args:
+            crew: Compiled LangGraph.
+            inputs: Inputs for the workflow.
 
-        # Extract final message
+        Yields:
+            CrewEvent objects ending with the final output and, when the
+            model reports it, token usage per task.
+        """
+        translator = _StreamTranslator()
+        for mode, chunk in crew.stream(self._graph_input(inputs), config=_run_config(inputs), stream_mode=STREAM_MODES):
+            yield from translator.translate(mode, chunk)
+        yield CrewEvent(FINAL, output=self._output_text(translator.state), usage=_state_usage(translator.state))
+
+    async def astream(self, crew: Any, inputs: dict[str, Any]) -> AsyncIterator[CrewEvent]:
+        """Async variant of stream() using the graph's astream.
+
+        Args:
+            crew: Compiled LangGraph.
+            inputs: Inputs for the workflow.
+
+        Yields:
+            CrewEvent objects ending with the final output.
+        """
+        translator = _StreamTranslator()
+        async for mode, chunk in crew.astream(
+            self._graph_input(inputs), config=_run_config(inputs), stream_mode=STREAM_MODES
+        ):
+            for event in translator.translate(mode, chunk):
+                yield event
+        yield CrewEvent(FINAL, output=self._output_text(translator.state), usage=_state_usage(translator.state))
+
+    def _graph_input(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        """Convert crew inputs to the messages format."""
+        user_message = inputs.get("input", inputs.get("task", str(inputs)))
+        return {"messages": [("user", user_message)]}
+
+    def _output_text(self, result: Any) -> str:
+        """Extract the final message from a workflow result."""
         messages = result.get("messages", [])
         if messages:
             final = messages[-1]
@@ -86,13 +189,17 @@ class LangGraphRunner(BaseRunner):
             model: Optional model name override.
 
         Returns:
-            LangChain ChatAnthropic LLM.
+            LangChain ChatAnthropic LLM, shared with other agents and runs
+            using the same model (see agentic_crew.config.llm.pooled_llm).
         """
         from langchain_anthropic import ChatAnthropic
 
-        # Default to Claude 3.5 Sonnet if no model specified
-        default_model = "claude-haiku-4-5-20251001"
-        return ChatAnthropic(model=model or default_model)
+        from agentic_crew.config.llm import pooled_llm
+
+        # Default to Claude Haiku 4.5 if no model specified
+        model = model or "claude-haiku-4-5-20251001"
+        key = ("langchain-anthropic", model, None, None, os.getenv("ANTHROPIC_API_KEY"))
+        return pooled_llm(key, lambda: ChatAnthropic(model=model))
 
     def build_agent(self, agent_config: dict[str, Any], tools: list | None = None) -> Any:
         """Build a LangGraph-compatible agent.
@@ -113,8 +220,7 @@ class LangGraphRunner(BaseRunner):
     def build_task(self, task_config: dict[str, Any], agent: Any) -> Any:
         """Build a task representation for LangGraph.
 
-        In LangGraph, tasks are typically represented as graph nodes or
-        prompts to agents. Returns a dict for now.
+        build_crew() turns the returned dict into the task's graph node.
 
         Args:
             task_config: Task configuration.
@@ -143,3 +249,170 @@ class LangGraphRunner(BaseRunner):
         # For now, return empty - tools should be provided separately
         # A more sophisticated implementation would create tools from task definitions
         return []
+
+
+class _TaskNode:
+    """Graph node that runs one task with its agent.
+
+    The node sees the crew inputs (via the run config) and the outputs of
+    the tasks it depends on, and adds its own output to the graph state.
+    A run whose deadline has passed or whose caller was cancelled stops
+    before its next task (see stop_if_cancelled()).
+    """
+
+    def __init__(self, name: str, task: dict[str, Any], system_prompt: str, dependencies: tuple[str, ...]):
+        self.name = name
+        self.task = task
+        self.system_prompt = system_prompt
+        self.dependencies = dependencies
+
+    def invoke(self, state: dict[str, Any], config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run the task synchronously."""
+        stop_if_cancelled()
+        result = self.task["agent"].invoke({"messages": self.messages(state, config)})
+        return self._update(result)
+
+    async def ainvoke(self, state: dict[str, Any], config: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Run the task on the event loop."""
+        stop_if_cancelled()
+        result = await self.task["agent"].ainvoke({"messages": self.messages(state, config)})
+        return self._update(result)
+
+    def messages(self, state: dict[str, Any], config: dict[str, Any] | None) -> list[tuple[str, Any]]:
+        """Build the agent conversation for this task.
+
+        The system prompt is the stable prefix of every model call the
+        agent makes, so it is marked for prompt caching.
+        """
+        inputs = ((config or {}).get("configurable") or {}).get("inputs") or {}
+        outputs = state.get("outputs") or {}
+        context = {dep: outputs.get(dep, "") for dep in self.dependencies}
+        return [("system", cacheable_prompt(self.system_prompt)), ("user", task_prompt(self.task, inputs, context))]
+
+    def _update(self, result: Any) -> dict[str, Any]:
+        from langchain_core.messages import AIMessage
+
+        messages = result.get("messages", []) if isinstance(result, dict) else []
+        text = _content_text(messages[-1]) if messages else str(result)
+        # Keep the task's token usage (over all its model calls) on its output message
+        usage = _messages_usage(messages)
+        extra = {"usage_metadata": usage} if usage else {}
+        return {"outputs": {self.name: text}, "messages": [AIMessage(content=text, name=self.name, **extra)]}
+
+
+def _crew_state() -> Any:
+    """State schema for task graphs: the shared conversation plus task outputs."""
+    from typing import Annotated, TypedDict
+
+    from langgraph.graph.message import add_messages
+
+    # Functional form so the annotations stay real objects for LangGraph;
+    # concurrent nodes merge their outputs with dict union
+    return TypedDict(
+        "CrewState",
+        {"messages": Annotated[list, add_messages], "outputs": Annotated[dict, operator.or_]},
+    )
+
+
+def _agent_prompt(agent_config: dict[str, Any]) -> str:
+    """System prompt for an agent from its role, goal and backstory."""
+    parts = [f"You are a {agent_config.get('role', 'helpful assistant')}."]
+    if agent_config.get("goal"):
+        parts.append(f"Goal: {agent_config['goal']}")
+    if agent_config.get("backstory"):
+        parts.append(f"Background: {agent_config['backstory']}")
+    return "\n\n".join(parts)
+
+
+def _messages_usage(messages: list[Any]) -> dict[str, Any] | None:
+    """Sum the LangChain usage_metadata of messages, including cache details."""
+    totals: dict[str, Any] = {}
+    for message in messages:
+        usage = getattr(message, "usage_metadata", None)
+        if not isinstance(usage, Mapping):
+            continue
+        for key in ("input_tokens", "output_tokens", "total_tokens"):
+            totals[key] = totals.get(key, 0) + int(usage.get(key) or 0)
+        details = usage.get("input_token_details")
+        if isinstance(details, Mapping):
+            summed = totals.setdefault("input_token_details", {})
+            for key in ("cache_read", "cache_creation"):
+                summed[key] = summed.get(key, 0) + int(details.get(key) or 0)
+    return totals or None
+
+
+def _state_usage(state: dict[str, Any]) -> dict[str, dict[str, int]] | None:
+    """Token usage per task (or "agent" for ReAct crews) from a final graph state."""
+    usage: dict[str, dict[str, int]] = {}
+    for message in state.get("messages", []) if isinstance(state, dict) else []:
+        metadata = _messages_usage([message])
+        if metadata is None:
+            continue
+        details = metadata.get("input_token_details") or {}
+        totals = usage.setdefault(getattr(message, "name", None) or "agent", dict.fromkeys(USAGE_KEYS, 0))
+        totals["input_tokens"] += metadata["input_tokens"]
+        totals["output_tokens"] += metadata["output_tokens"]
+        totals["total_tokens"] += metadata["total_tokens"]
+        totals["cache_read_tokens"] += details.get("cache_read", 0)
+        totals["cache_write_tokens"] += details.get("cache_creation", 0)
+    return usage or None
+
+
+def _run_config(inputs: dict[str, Any]) -> dict[str, Any]:
+    """Run config that makes the crew inputs available to task nodes."""
+    return {"configurable": {"inputs": inputs}}
+
+
+class _StreamTranslator:
+    """Translate LangGraph stream chunks into CrewEvents."""
+
+    def __init__(self):
+        self.state: dict[str, Any] = {}
+        self._active: str | None = None
+
+    def translate(self, mode: str, chunk: Any) -> list[CrewEvent]:
+        """Return the events for one (mode, chunk) pair from a graph stream."""
+        if mode == "values":
+            self.state = chunk
+            return []
+
+        events: list[CrewEvent] = []
+        if mode == "messages":
+            message, metadata = chunk
+            node = metadata.get("langgraph_node")
+            events.extend(self._start(node))
+            # Tool results are also reported here; only model output is a token
+            delta = _content_text(message) if getattr(message, "type", "") in ("ai", "AIMessageChunk") else ""
+            if delta:
+                events.append(CrewEvent(TOKEN, task=node, delta=delta))
+        elif mode == "updates":
+            for node, update in chunk.items():
+                events.extend(self._start(node))
+                messages = update.get("messages", []) if isinstance(update, dict) else []
+                for message in messages:
+                    for call in getattr(message, "tool_calls", None) or []:
+                        events.append(
+                            CrewEvent(TOOL_CALL, task=node, tool=call.get("name"), tool_input=call.get("args"))
+                        )
+                output = _content_text(messages[-1]) if messages else None
+                events.append(CrewEvent(TASK_FINISHED, task=node, output=output or None))
+                self._active = None
+        return events
+
+    def _start(self, node: str | None) -> list[CrewEvent]:
+        if node is None or node == self._active:
+            return []
+        self._active = node
+        return [CrewEvent(TASK_STARTED, task=node)]
+
+
+def _content_text(message: Any) -> str:
+    """Get the text of a LangChain message whose content may be a block list."""
+    content = getattr(message, "content", "")
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+        if not isinstance(block, dict) or block.get("type") == "text"
+    )
@@ -20,6 +20,7 @@ Benefits:
 
 from __future__ import annotations
 
+import asyncio
 import os
 import shlex
 import subprocess
@@ -27,9 +28,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from agentic_crew.runners.base import DeadlineExceeded, remaining_time
 from agentic_crew.runners.single_agent_runner import SingleAgentRunner
+from agentic_crew.utils.files import load_yaml
 
 
 @dataclass
@@ -150,7 +151,7 @@ class LocalCLIRunner(SingleAgentRunner):
 
         # Load and parse YAML
         with open(profiles_file) as f:
-            data = yaml.safe_load(f)
+            data = load_yaml(f)
 
         profiles = {}
         for name, config_dict in data.get("profiles", {}).items():
@@ -199,6 +200,10 @@ class LocalCLIRunner(SingleAgentRunner):
     ) -> str:
         """Execute a task using the configured CLI tool.
 
+        The command is stopped after the profile's timeout or at the
+        current deadline (see agentic_crew.runners.base.use_deadline),
+        whichever comes first.
+
         Args:
             task: The task to execute (e.g., "Add error handling").
             working_dir: Optional working directory for execution.
@@ -211,12 +216,107 @@ class LocalCLIRunner(SingleAgentRunner):
             Tool output as a string.
 
         Raises:
-            RuntimeError: If tool execution fails or required env vars missing.
-            subprocess.TimeoutExpired: If execution exceeds timeout.
+            RuntimeError: If tool execution fails, times out or required
+                env vars are missing.
+            DeadlineExceeded: If the deadline passed before the command
+                finished.
         """
         # Accept but don't use kwargs (reserved for future extensibility)
         _ = kwargs
 
+        cmd = self._prepare_command(task, working_dir, auto_approve, structured_output, model)
+        timeout, at_deadline = self._timeout(cmd)
+
+        # Execute
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=working_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=os.environ.copy(),  # Pass through environment
+                check=True,
+            )
+
+            return result.stdout
+
+        except subprocess.CalledProcessError as e:
+            raise self._failure(e.cmd, e.returncode, e.stdout, e.stderr) from e
+        except subprocess.TimeoutExpired as e:
+            raise self._timed_out(cmd, timeout, at_deadline) from e
+
+    async def arun(
+        self,
+        task: str,
+        working_dir: str | None = None,
+        auto_approve: bool = True,
+        structured_output: bool = False,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Async variant of run() that kills the command when cancelled.
+
+        Unlike run() in a worker thread, cancelling this coroutine (for
+        example by a ManagerAgent delegation timeout) stops the tool's
+        process instead of leaving it running.
+
+        Args:
+            task: The task to execute.
+            working_dir: Optional working directory for execution.
+            auto_approve: Whether to auto-approve changes (if supported).
+            structured_output: Whether to request JSON output (if supported).
+            model: Optional model override.
+            **kwargs: Additional tool-specific arguments.
+
+        Returns:
+            Tool output as a string.
+
+        Raises:
+            RuntimeError: If tool execution fails, times out or required
+                env vars are missing.
+            DeadlineExceeded: If the deadline passed before the command
+                finished.
+        """
+        _ = kwargs
+
+        cmd = self._prepare_command(task, working_dir, auto_approve, structured_output, model)
+        timeout, at_deadline = self._timeout(cmd)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=working_dir,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=os.environ.copy(),
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError as e:  # noqa: UP041 (not the builtin before 3.11)
+            raise self._timed_out(cmd, timeout, at_deadline) from e
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        output = stdout.decode(errors="replace")
+        if process.returncode != 0:
+            raise self._failure(cmd, process.returncode, output, stderr.decode(errors="replace"))
+        return output
+
+    def _prepare_command(
+        self,
+        task: str,
+        working_dir: str | None,
+        auto_approve: bool,
+        structured_output: bool,
+        model: str | None,
+    ) -> list[str]:
+        """Check the required environment variables and build the command.
+
+        Raises:
+            RuntimeError: If required env vars are missing.
+        """
         # Check required environment variables
         missing_vars = []
         for var in self.config.auth_env:
@@ -230,8 +330,7 @@ class LocalCLIRunner(SingleAgentRunner):
                 f"Set these before running: {', '.join(missing_vars)}"
             )
 
-        # Build command
-        cmd = self._build_command(
+        return self._build_command(
             task=task,
             working_dir=working_dir,
             auto_approve=auto_approve,
@@ -239,29 +338,29 @@ class LocalCLIRunner(SingleAgentRunner):
             model=model or self.model,
         )
 
-        # Execute
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=working_dir,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-                env=os.environ.copy(),  # Pass through environment
-                check=True,
-            )
+    def _timeout(self, cmd: list[str]) -> tuple[float, bool]:
+        """Return the command's timeout and whether the deadline sets it.
 
-            return result.stdout
+        Raises:
+            DeadlineExceeded: If the deadline has already passed.
+        """
+        remaining = remaining_time()
+        if remaining is None or remaining >= self.config.timeout:
+            return self.config.timeout, False
+        if remaining == 0.0:
+            raise DeadlineExceeded(f"Deadline passed before the command started\nCommand: {' '.join(cmd)}")
+        return remaining, True
+
+    @staticmethod
+    def _failure(cmd: list[str], returncode: int, stdout: str, stderr: str) -> RuntimeError:
+        return RuntimeError(
+            f"Command failed with exit code {returncode}\nCommand: {' '.join(cmd)}\nstdout: {stdout}\nstderr: {stderr}"
+        )
 
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(
-                f"Command failed with exit code {e.returncode}\n"
-                f"Command: {' '.join(e.cmd)}\n"
-                f"stdout: {e.stdout}\n"
-                f"stderr: {e.stderr}"
-            ) from e
-        except subprocess.TimeoutExpired as e:
-            raise RuntimeError(f"Command timed out after {self.config.timeout}s\nCommand: {' '.join(cmd)}") from e
+    @staticmethod
+    def _timed_out(cmd: list[str], timeout: float, at_deadline: bool) -> RuntimeError | DeadlineExceeded:
+        message = f"Command timed out after {timeout:g}s\nCommand: {' '.join(cmd)}"
+        return DeadlineExceeded(message) if at_deadline else RuntimeError(message)
 
     def _build_command(
         self,
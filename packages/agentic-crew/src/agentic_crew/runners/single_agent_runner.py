@@ -16,9 +16,12 @@ Unlike multi-agent crews, single-agent runners:
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from typing import Any
 
+from agentic_crew.runners.base import run_in_executor
+
 
 class SingleAgentRunner(ABC):
     """Base class for single-agent runners.
@@ -52,6 +55,27 @@ class SingleAgentRunner(ABC):
         """
         pass
 
+    async def arun(
+        self,
+        task: str,
+        working_dir: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Execute a single task without blocking the event loop.
+
+        The default implementation runs run() in a worker thread of the
+        current run executor (see agentic_crew.runners.base.use_executor).
+
+        Args:
+            task: The task to execute.
+            working_dir: Optional working directory for execution.
+            **kwargs: Additional runner-specific parameters.
+
+        Returns:
+            Task output as a string.
+        """
+        return await run_in_executor(functools.partial(self.run, task, working_dir, **kwargs))
+
     def is_available(self) -> bool:
         """Check if this runner is available (dependencies installed, etc.).
 
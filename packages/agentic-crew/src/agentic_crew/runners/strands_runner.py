@@ -5,13 +5,77 @@ Strands is lightweight and AWS-native, good for:
 - AWS Bedrock integration
 - Minimal dependencies
 - Plain Python function tools
+
+By default a crew runs as one agent whose system prompt summarizes every
+agent and task. Crews that set ``multi_agent: true`` in their manifest get
+one agent per configured agent instead, and their tasks run in dependency
+order with independent tasks running concurrently (see StrandsCrew).
 """
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from dataclasses import dataclass, field
 from typing import Any
 
-from agentic_crew.runners.base import BaseRunner
+from agentic_crew.config.llm import prompt_cache_enabled
+from agentic_crew.core.task_graph import TaskGraph, task_prompt
+from agentic_crew.runners.base import BaseRunner, stop_if_cancelled
+from agentic_crew.runners.events import (
+    FINAL,
+    TASK_FINISHED,
+    TASK_STARTED,
+    TOKEN,
+    TOOL_CALL,
+    CrewEvent,
+    iterate_async,
+    run_coroutine,
+)
+
+# Reported usage key (see USAGE_KEYS) -> Strands accumulated_usage key
+_USAGE_KEYS = {
+    "input_tokens": "inputTokens",
+    "output_tokens": "outputTokens",
+    "total_tokens": "totalTokens",
+    "cache_read_tokens": "cacheReadInputTokens",
+    "cache_write_tokens": "cacheWriteInputTokens",
+}
+
+# Bedrock model id prefixes of models with prompt caching, matched with or
+# without a cross-region inference profile prefix such as "us."
+_PROMPT_CACHE_MODELS = (
+    "anthropic.claude-3-5-haiku",
+    "anthropic.claude-3-7-sonnet",
+    "anthropic.claude-sonnet-4",
+    "anthropic.claude-opus-4",
+    "anthropic.claude-haiku-4",
+    "amazon.nova-",
+)
+
+
+@dataclass
+class StrandsCrew:
+    """A multi-agent Strands crew.
+
+    Each task is sent to its own agent, with the outputs of its context
+    tasks in the prompt. A Strands agent handles one request at a time, so
+    tasks of the same agent run one after another while tasks of different
+    agents run concurrently.
+
+    Attributes:
+        agents: Agent name -> Strands Agent.
+        tasks: Task name -> task dict from build_task, in config order.
+        task_agents: Task name -> agent name.
+        graph: Dependencies between the tasks.
+        usage: Token usage of the most recent run, per agent name.
+    """
+
+    agents: dict[str, Any]
+    tasks: dict[str, dict[str, Any]]
+    task_agents: dict[str, str]
+    graph: TaskGraph
+    usage: dict[str, dict[str, int]] = field(default_factory=dict)
 
 
 class StrandsRunner(BaseRunner):
@@ -19,6 +83,9 @@ class StrandsRunner(BaseRunner):
 
     framework_name = "strands"
 
+    # A Strands Agent keeps its conversation history between calls
+    reusable_crews = False
+
     def __init__(self):
         """Initialize Strands runner."""
         try:
@@ -29,15 +96,23 @@ class StrandsRunner(BaseRunner):
     def build_crew(self, crew_config: dict[str, Any]) -> Any:
         """Build a Strands agent from configuration.
 
-        Strands uses a single-agent model, so we combine crew tasks
-        into a system prompt for one capable agent.
+        By default crew tasks are combined into a system prompt for one
+        capable agent. Crews with ``multi_agent`` set build a StrandsCrew
+        instead.
 
         Args:
             crew_config: Universal crew configuration.
 
         Returns:
-            Strands Agent object.
+            Strands Agent object, or a StrandsCrew for multi-agent crews.
+
+        Raises:
+            ValueError: If a multi-agent crew's task references an unknown
+                agent or the task context is invalid.
         """
+        if crew_config.get("multi_agent") and crew_config.get("tasks"):
+            return self._build_multi_agent_crew(crew_config)
+
         from strands import Agent
 
         # Build system prompt from crew description and agent backstories
@@ -50,17 +125,40 @@ class StrandsRunner(BaseRunner):
         llm_config = crew_config.get("llm", {})
         model_provider = self._get_model_provider(llm_config)
 
-        agent_kwargs = {
+        agent_kwargs: dict[str, Any] = {
             "system_prompt": system_prompt,
             "tools": tools,
         }
 
         # Add model provider if configured
-        if model_provider:
-            agent_kwargs["model_id"] = model_provider
+        model = self._model(model_provider)
+        if model:
+            agent_kwargs["model"] = model
 
         return Agent(**agent_kwargs)
 
+    def _build_multi_agent_crew(self, crew_config: dict[str, Any]) -> StrandsCrew:
+        """Build one agent per configured agent and bind tasks to them."""
+        tasks_config = crew_config["tasks"]
+        graph = TaskGraph.from_tasks(tasks_config)
+        agents_config = crew_config.get("agents", {})
+        default_model = self._get_model_provider(crew_config.get("llm", {}))
+
+        agents: dict[str, Any] = {}
+        tasks: dict[str, dict[str, Any]] = {}
+        task_agents: dict[str, str] = {}
+        for task_name, task_cfg in tasks_config.items():
+            agent_name = task_cfg.get("agent")
+            if agent_name not in agents_config:
+                raise ValueError(f"Task '{task_name}' has invalid agent: {agent_name}")
+            if agent_name not in agents:
+                agent_cfg = agents_config[agent_name]
+                agents[agent_name] = self.build_agent({**agent_cfg, "llm": agent_cfg.get("llm") or default_model})
+            tasks[task_name] = self.build_task(task_cfg, agents[agent_name])
+            task_agents[task_name] = agent_name
+
+        return StrandsCrew(agents=agents, tasks=tasks, task_agents=task_agents, graph=graph)
+
     def _get_model_provider(self, llm_config: dict | str | None) -> str | None:
         """Get Strands-compatible model provider from LLM config.
 
@@ -79,6 +177,34 @@ class StrandsRunner(BaseRunner):
         # Extract model from config dict
         return llm_config.get("model")
 
+    def _model(self, model_id: str | None) -> Any:
+        """Get the model for an agent, with prompt caching when supported.
+
+        A Strands agent re-sends its system prompt and tool specs on every
+        model call, so a configured Bedrock model known to support prompt
+        caching (see _PROMPT_CACHE_MODELS) is set up to cache both. Any
+        other model, Strands' default (None), a Strands without Bedrock
+        support or disabled caching leave the model id as is.
+
+        Args:
+            model_id: Bedrock model id, or None for Strands' default model.
+
+        Returns:
+            A BedrockModel, the model id, or None.
+        """
+        if not model_id or not prompt_cache_enabled():
+            return model_id
+        if not (
+            model_id.startswith(_PROMPT_CACHE_MODELS) or model_id.partition(".")[2].startswith(_PROMPT_CACHE_MODELS)
+        ):
+            return model_id
+        try:
+            from strands.models import BedrockModel
+        except ImportError:
+            return model_id
+
+        return BedrockModel(model_id=model_id, cache_prompt="default", cache_tools="default")
+
     def run(self, crew: Any, inputs: dict[str, Any]) -> str:
         """Execute the Strands agent.
 
@@ -89,13 +215,157 @@ class StrandsRunner(BaseRunner):
         Returns:
             Agent output as string.
         """
-        # Convert inputs to prompt
-        prompt = inputs.get("input", inputs.get("task", str(inputs)))
+        if isinstance(crew, StrandsCrew):
+            # Tasks are orchestrated with asyncio, as in stream()
+            return run_coroutine(self._run_tasks(crew, inputs))
 
-        result = crew(prompt)
+        result = crew(self._prompt(inputs))
 
         return str(result)
 
+    async def arun(self, crew: Any, inputs: dict[str, Any]) -> str:
+        """Execute the Strands agent with invoke_async.
+
+        Args:
+            crew: Strands Agent object.
+            inputs: Inputs for the agent.
+
+        Returns:
+            Agent output as string.
+        """
+        if isinstance(crew, StrandsCrew):
+            return await self._run_tasks(crew, inputs)
+
+        result = await crew.invoke_async(self._prompt(inputs))
+        return str(result)
+
+    def stream(self, crew: Any, inputs: dict[str, Any]) -> Iterator[CrewEvent]:
+        """Execute the Strands agent, yielding token and tool call events.
+
+        Strands only streams asynchronously, so this drives astream() on a
+        private event loop; use astream() from async code.
+
+        Args:
+            crew: Strands Agent object.
+            inputs: Inputs for the agent.
+
+        Yields:
+            CrewEvent objects ending with the final output.
+        """
+        yield from iterate_async(self.astream(crew, inputs))
+
+    async def astream(self, crew: Any, inputs: dict[str, Any]) -> AsyncIterator[CrewEvent]:
+        """Execute the Strands agent with stream_async.
+
+        Args:
+            crew: Strands Agent object.
+            inputs: Inputs for the agent.
+
+        Yields:
+            CrewEvent objects ending with the final output and token usage,
+            including prompt cache reads and writes (reported as a single
+            "crew" entry, or per agent for multi-agent crews). Multi-agent
+            crews also report task boundaries.
+        """
+        if isinstance(crew, StrandsCrew):
+            async for event in self._astream_tasks(crew, inputs):
+                yield event
+            return
+
+        text: list[str] = []
+        result: Any = None
+        before = _agent_usage(crew)
+        async for event in crew.stream_async(self._prompt(inputs)):
+            if event.get("data"):
+                text.append(event["data"])
+            elif "result" in event:
+                result = event["result"]
+            for crew_event in _agent_events(event):
+                yield crew_event
+        output = str(result) if result is not None else "".join(text)
+        yield CrewEvent(FINAL, output=output, usage=_run_usage(crew, before))
+
+    async def _astream_tasks(self, crew: StrandsCrew, inputs: dict[str, Any]) -> AsyncIterator[CrewEvent]:
+        """Stream a multi-agent run: events from all running tasks as they happen."""
+        queue: asyncio.Queue[CrewEvent | None] = asyncio.Queue()
+        run = asyncio.ensure_future(self._run_tasks(crew, inputs, emit=queue.put_nowait))
+        run.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+            output = await run
+        finally:
+            run.cancel()
+        yield CrewEvent(FINAL, output=output, usage=crew.usage)
+
+    async def _run_tasks(
+        self,
+        crew: StrandsCrew,
+        inputs: dict[str, Any],
+        emit: Callable[[CrewEvent], None] | None = None,
+    ) -> str:
+        """Run a multi-agent crew's tasks, each as soon as its context is done.
+
+        No task starts after the deadline has passed or the caller was
+        cancelled (see stop_if_cancelled()).
+
+        Args:
+            crew: Multi-agent crew.
+            inputs: Crew inputs.
+            emit: Optional callback for events; when set, agents are
+                streamed so tokens and tool calls are reported.
+
+        Returns:
+            Output of the crew's last task.
+        """
+        locks = {name: asyncio.Lock() for name in crew.agents}
+        outputs: dict[str, str] = {}
+        usage: dict[str, dict[str, int]] = {}
+
+        async def run_task(task_name: str, dependencies: list[asyncio.Future]) -> None:
+            await asyncio.gather(*dependencies)
+            agent_name = crew.task_agents[task_name]
+            agent = crew.agents[agent_name]
+            context = {dep: outputs[dep] for dep in crew.graph.dependencies[task_name]}
+            prompt = task_prompt(crew.tasks[task_name], inputs, context)
+
+            async with locks[agent_name]:
+                # Threads running run() cannot be interrupted; stop here instead
+                stop_if_cancelled()
+                before = _agent_usage(agent)
+                if emit is None:
+                    output = str(await agent.invoke_async(prompt))
+                else:
+                    emit(CrewEvent(TASK_STARTED, task=task_name))
+                    output = await _stream_agent(agent, prompt, task_name, emit)
+                after = _agent_usage(agent)
+
+            totals = usage.setdefault(agent_name, dict.fromkeys(_USAGE_KEYS, 0))
+            for key in _USAGE_KEYS:
+                totals[key] += after[key] - before[key]
+            outputs[task_name] = output
+            if emit is not None:
+                emit(CrewEvent(TASK_FINISHED, task=task_name, output=output))
+
+        runs: dict[str, asyncio.Future] = {}
+        for task_name in crew.graph.order():
+            dependencies = [runs[dep] for dep in crew.graph.dependencies[task_name]]
+            runs[task_name] = asyncio.ensure_future(run_task(task_name, dependencies))
+        try:
+            await asyncio.gather(*runs.values())
+        except BaseException:
+            for run in runs.values():
+                run.cancel()
+            await asyncio.gather(*runs.values(), return_exceptions=True)
+            raise
+
+        crew.usage = usage
+        return outputs[list(crew.tasks)[-1]]
+
+    def _prompt(self, inputs: dict[str, Any]) -> str:
+        """Convert crew inputs to a prompt."""
+        return inputs.get("input", inputs.get("task", str(inputs)))
+
     def build_agent(self, agent_config: dict[str, Any], tools: list | None = None) -> Any:
         """Build a Strands agent.
 
@@ -114,10 +384,15 @@ class StrandsRunner(BaseRunner):
             f"Background: {agent_config.get('backstory', '')}"
         )
 
-        return Agent(
-            system_prompt=system_prompt,
-            tools=tools or [],
-        )
+        agent_kwargs: dict[str, Any] = {
+            "system_prompt": system_prompt,
+            "tools": tools or [],
+        }
+        model = self._model(self._get_model_provider(agent_config.get("llm")))
+        if model:
+            agent_kwargs["model"] = model
+
+        return Agent(**agent_kwargs)
 
     def build_task(self, task_config: dict[str, Any], agent: Any) -> Any:
         """Build a task for Strands.
@@ -194,3 +469,49 @@ class StrandsRunner(BaseRunner):
         # For now, return empty - tools should be provided separately
         # Could be enhanced to auto-discover tools from task definitions
         return []
+
+
+def _agent_events(event: Mapping[str, Any], task: str | None = None) -> list[CrewEvent]:
+    """Translate one Strands stream_async event into CrewEvents."""
+    if event.get("data"):
+        return [CrewEvent(TOKEN, task=task, delta=event["data"])]
+    events = []
+    if "message" in event:
+        # Completed messages carry whole tool calls; partial ones are streamed as current_tool_use
+        for block in event["message"].get("content", []):
+            tool_use = block.get("toolUse") if isinstance(block, dict) else None
+            if tool_use:
+                events.append(
+                    CrewEvent(TOOL_CALL, task=task, tool=tool_use.get("name"), tool_input=tool_use.get("input"))
+                )
+    return events
+
+
+async def _stream_agent(agent: Any, prompt: str, task: str, emit: Callable[[CrewEvent], None]) -> str:
+    """Run one task prompt through an agent's stream_async, emitting its events."""
+    text: list[str] = []
+    result: Any = None
+    async for event in agent.stream_async(prompt):
+        if event.get("data"):
+            text.append(event["data"])
+        elif "result" in event:
+            result = event["result"]
+        for crew_event in _agent_events(event, task):
+            emit(crew_event)
+    return str(result) if result is not None else "".join(text)
+
+
+def _run_usage(agent: Any, before: dict[str, int]) -> dict[str, dict[str, int]] | None:
+    """Token usage of a single-agent run since before, or None without metrics."""
+    if not isinstance(getattr(getattr(agent, "event_loop_metrics", None), "accumulated_usage", None), Mapping):
+        return None
+    after = _agent_usage(agent)
+    return {"crew": {key: after[key] - before[key] for key in _USAGE_KEYS}}
+
+
+def _agent_usage(agent: Any) -> dict[str, int]:
+    """Read an agent's cumulative token usage from its event loop metrics."""
+    usage = getattr(getattr(agent, "event_loop_metrics", None), "accumulated_usage", None)
+    if not isinstance(usage, Mapping):
+        usage = {}
+    return {key: int(usage.get(source) or 0) for key, source in _USAGE_KEYS.items()}
@@ -0,0 +1,292 @@
+"""Long-lived JSON-RPC server for agentic-crew over stdio.
+
+`agentic-crew serve --stdio` reads one JSON-RPC 2.0 request per line on
+stdin and writes one response per line on stdout. Because the process
+stays alive, discovery caches, parsed configs and imported frameworks are
+reused across requests instead of being rebuilt by a fresh CLI process
+for every call.
+
+Methods (results use the same JSON shapes as the `--json` CLI output):
+
+    list    {"package"?: str, "framework"?: str}        -> {"crews": [...]}
+    info    {"package": str, "crew": str}               -> crew details
+    run     {"package": str, "crew": str, "input"?: str, "framework"?: str}
+                                                        -> {"success": ..., "output": ..., ...}
+    cancel  {"id": <id of a pending run request>}       -> {"cancelled": bool}
+
+Runs execute on a thread pool so list/info/cancel are answered while
+crews are running. Cancelling a queued run prevents it from starting;
+cancelling a running one answers its request immediately with a
+RequestCancelled error, stops the crew at its next step or task (see
+agentic_crew.runners.base.cancellation_requested) and discards its result.
+
+On startup the server sends a `ready` notification. It exits when stdin
+is closed, after in-flight runs finish.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TextIO
+
+from agentic_crew import __version__
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+APPLICATION_ERROR = -32000
+REQUEST_CANCELLED = -32800
+
+
+class RPCError(Exception):
+    """Error reported to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str, data: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class StdioServer:
+    """Line-delimited JSON-RPC server.
+
+    Attributes:
+        max_workers: Maximum number of crews run concurrently.
+    """
+
+    def __init__(self, stdin: TextIO, stdout: TextIO, max_workers: int = 4):
+        """Initialize the server.
+
+        Args:
+            stdin: Stream of requests, one JSON object per line.
+            stdout: Stream for responses; nothing else may write to it.
+            max_workers: Maximum number of crews run concurrently.
+        """
+        self.max_workers = max_workers
+        self._stdin = stdin
+        self._stdout = stdout
+        self._write_lock = threading.Lock()
+        self._runs_lock = threading.Lock()
+        self._runs: dict[Any, Future] = {}
+        # Request id -> cancellation token of its run (see use_cancellation)
+        self._run_tokens: dict[Any, threading.Event] = {}
+        self._cancelled: set[Any] = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agentic-crew-run")
+
+    def serve(self) -> int:
+        """Serve requests until stdin is closed.
+
+        Returns:
+            Process exit code.
+        """
+        self._send({"jsonrpc": "2.0", "method": "ready", "params": {"version": __version__}})
+        try:
+            for line in self._stdin:
+                if line.strip():
+                    self.handle_line(line)
+        finally:
+            self._executor.shutdown(wait=True)
+        return 0
+
+    def handle_line(self, line: str) -> None:
+        """Handle one request line."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            self._send_error(None, RPCError(PARSE_ERROR, f"Parse error: {e}"))
+            return
+
+        request_id = request.get("id") if isinstance(request, dict) else None
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            self._send_error(request_id, RPCError(INVALID_REQUEST, "Invalid request"))
+            return
+
+        method = request["method"]
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            self._send_error(request_id, RPCError(INVALID_PARAMS, "params must be an object"))
+            return
+
+        if method == "run":
+            self._start_run(request_id, params)
+            return
+
+        handler = {"list": self._list, "info": self._info, "cancel": self._cancel}.get(method)
+        try:
+            if handler is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+            result = handler(params)
+        except RPCError as e:
+            self._send_error(request_id, e)
+        except Exception as e:
+            self._send_error(request_id, RPCError(APPLICATION_ERROR, str(e)))
+        else:
+            self._send_result(request_id, result)
+
+    # Methods ------------------------------------------------------------------
+
+    def _list(self, params: dict[str, Any]) -> dict[str, Any]:
+        from agentic_crew import main
+
+        crews_by_package = main.list_crews(params.get("package"), framework=params.get("framework"))
+        return main.crews_payload(crews_by_package)
+
+    def _info(self, params: dict[str, Any]) -> dict[str, Any]:
+        from agentic_crew import main
+
+        package, crew = _require(params, "package"), _require(params, "crew")
+        config_dir = _find_package(package)
+        try:
+            config = main.get_crew_config(config_dir, crew)
+        except ValueError as e:
+            raise RPCError(APPLICATION_ERROR, str(e)) from e
+        return main.crew_info_payload(package, crew, config)
+
+    def _cancel(self, params: dict[str, Any]) -> dict[str, bool]:
+        target = params.get("id")
+        with self._runs_lock:
+            future = self._runs.get(target)
+            if future is None or target in self._cancelled:
+                return {"cancelled": False}
+            self._cancelled.add(target)
+            self._run_tokens[target].set()
+        future.cancel()
+        self._send_error(target, RPCError(REQUEST_CANCELLED, "Run cancelled"))
+        return {"cancelled": True}
+
+    def _start_run(self, request_id: Any, params: dict[str, Any]) -> None:
+        try:
+            _require(params, "package")
+            _require(params, "crew")
+        except RPCError as e:
+            self._send_error(request_id, e)
+            return
+
+        with self._runs_lock:
+            if request_id is not None and request_id in self._runs:
+                self._send_error(request_id, RPCError(INVALID_REQUEST, f"Run {request_id!r} is already pending"))
+                return
+            token = threading.Event()
+            future = self._executor.submit(self._run, params, token)
+            if request_id is not None:
+                self._runs[request_id] = future
+                self._run_tokens[request_id] = token
+        future.add_done_callback(lambda f: self._finish_run(request_id, f))
+
+    def _run(self, params: dict[str, Any], cancelled: threading.Event) -> dict[str, Any]:
+        from agentic_crew import main
+        from agentic_crew.core.decomposer import detect_framework, run_crew_auto
+        from agentic_crew.runners.base import use_cancellation
+
+        start_time = time.time()
+        try:
+            config_dir = _find_package(params["package"])
+        except RPCError as e:
+            return {
+                "success": False,
+                "error": e.message,
+                **(e.data or {}),
+                "duration_ms": int((time.time() - start_time) * 1000),
+            }
+
+        try:
+            crew_config = main.get_crew_config(config_dir, params["crew"])
+            framework = params.get("framework") or "auto"
+            requested = framework if framework != "auto" else None
+            framework_used = crew_config.get("required_framework") or requested or detect_framework()
+            with use_cancellation(cancelled):
+                result = run_crew_auto(
+                    crew_config, inputs=main.crew_inputs(params.get("input", "")), framework=requested
+                )
+        except (ValueError, RuntimeError) as e:
+            return {"success": False, "error": str(e), "duration_ms": int((time.time() - start_time) * 1000)}
+
+        return {
+            "success": True,
+            "output": result,
+            "framework_used": framework_used,
+            "duration_ms": int((time.time() - start_time) * 1000),
+        }
+
+    def _finish_run(self, request_id: Any, future: Future) -> None:
+        with self._runs_lock:
+            self._runs.pop(request_id, None)
+            self._run_tokens.pop(request_id, None)
+            if request_id in self._cancelled:
+                # Already answered by cancel
+                self._cancelled.discard(request_id)
+                return
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            self._send_error(request_id, RPCError(APPLICATION_ERROR, str(e)))
+            return
+        self._send_result(request_id, result)
+
+    # Transport ----------------------------------------------------------------
+
+    def _send_result(self, request_id: Any, result: Any) -> None:
+        if request_id is not None:
+            self._send({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    def _send_error(self, request_id: Any, error: RPCError) -> None:
+        payload: dict[str, Any] = {"code": error.code, "message": error.message}
+        if error.data is not None:
+            payload["data"] = error.data
+        self._send({"jsonrpc": "2.0", "id": request_id, "error": payload})
+
+    def _send(self, message: dict[str, Any]) -> None:
+        line = json.dumps(message, default=str)
+        with self._write_lock:
+            self._stdout.write(line + "\n")
+            self._stdout.flush()
+
+
+def _require(params: dict[str, Any], name: str) -> str:
+    value = params.get(name)
+    if not isinstance(value, str) or not value:
+        raise RPCError(INVALID_PARAMS, f"Missing required parameter: {name}")
+    return value
+
+
+def _find_package(package: str) -> Path:
+    from agentic_crew import main
+
+    packages = main.discover_packages()
+    if package not in packages:
+        raise RPCError(
+            APPLICATION_ERROR,
+            f"Package '{package}' not found",
+            {"available_packages": list(packages.keys())},
+        )
+    return packages[package]
+
+
+def serve_stdio(max_workers: int = 4) -> int:
+    """Serve JSON-RPC on the process's stdin/stdout.
+
+    Anything crews print while running goes to stderr, keeping stdout
+    reserved for protocol messages.
+
+    Args:
+        max_workers: Maximum number of crews run concurrently.
+
+    Returns:
+        Process exit code.
+    """
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+    try:
+        return StdioServer(sys.stdin, protocol_out, max_workers=max_workers).serve()
+    finally:
+        sys.stdout = protocol_out
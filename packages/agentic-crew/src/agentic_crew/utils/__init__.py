@@ -1,3 +1,4 @@
-from .files import load_config
+from .cache import cache_enabled, get_cache_dir
+from .files import load_config, load_yaml
 
-__all__ = ["load_config"]
+__all__ = ["cache_enabled", "get_cache_dir", "load_config", "load_yaml"]
@@ -0,0 +1,78 @@
+"""Location and switches for agentic-crew's on-disk caches.
+
+Caches are a pure optimization: every cache user must fall back to the
+uncached code path when the cache directory is unavailable or disabled.
+
+Environment variables:
+    AGENTIC_CREW_CACHE_DIR: Override the cache directory.
+    AGENTIC_CREW_NO_CACHE: Set to any non-empty value other than "0" to
+        disable all on-disk caches.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIR_ENV = "AGENTIC_CREW_CACHE_DIR"
+NO_CACHE_ENV = "AGENTIC_CREW_NO_CACHE"
+
+# Files and directories modified this recently are not trusted by caches
+# validated by mtime: a second write within the filesystem's timestamp
+# granularity could leave mtime (and size) unchanged
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def cache_enabled() -> bool:
+    """Return True unless on-disk caching is disabled via the environment."""
+    value = os.environ.get(NO_CACHE_ENV, "")
+    return value in ("", "0")
+
+
+def get_cache_dir(subdir: str | None = None) -> Path:
+    """Get the cache directory, honouring AGENTIC_CREW_CACHE_DIR and XDG_CACHE_HOME.
+
+    The directory is not created; callers create it when they first write.
+
+    Args:
+        subdir: Optional subdirectory for a specific cache (e.g., "discovery").
+
+    Returns:
+        Path to the cache directory.
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        base = Path(override)
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME")
+        base = (Path(xdg) if xdg else Path.home() / ".cache") / "agentic-crew"
+    return base / subdir if subdir else base
+
+
+def atomic_write(path: Path, data: bytes | str, prefix: str) -> None:
+    """Write a file atomically, so readers never see a partial file.
+
+    The data is written to a temporary file next to path (created with
+    the given name prefix), which then replaces path. Missing parent
+    directories are created.
+
+    Args:
+        path: File to write.
+        data: Contents; str is encoded as UTF-8.
+        prefix: Name prefix of the temporary file (e.g., ".result-").
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=prefix, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data.encode("utf-8") if isinstance(data, str) else data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
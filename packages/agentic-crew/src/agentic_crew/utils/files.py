@@ -1,9 +1,37 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import IO, Any
 
 import yaml
 
+# libyaml's C loader parses several times faster than the pure-Python one;
+# PyYAML wheels without libyaml only provide SafeLoader
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+LIBYAML_AVAILABLE = SafeLoader is not yaml.SafeLoader
+
+
+def load_yaml(stream: str | bytes | IO[Any]) -> Any:
+    """Parse YAML with the fastest available safe loader.
+
+    All agentic-crew config loading goes through this function. Results
+    are identical to yaml.safe_load().
+
+    Args:
+        stream: YAML text, bytes, or an open file.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
 
 def load_config(path: Path | str) -> dict:
     """Loads a YAML configuration file.
@@ -15,4 +43,4 @@ def load_config(path: Path | str) -> dict:
         A dictionary containing the configuration.
     """
     with open(path) as f:
-        return yaml.safe_load(f)
+        return load_yaml(f)
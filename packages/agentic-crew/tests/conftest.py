@@ -26,6 +26,28 @@ def mock_llm_env() -> Generator[None, Any, None]:
         yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point agentic-crew's on-disk caches at a per-test directory."""
+    cache_dir = tmp_path_factory.mktemp("agentic-crew-cache")
+    monkeypatch.setenv("AGENTIC_CREW_CACHE_DIR", str(cache_dir))
+    monkeypatch.delenv("AGENTIC_CREW_NO_CACHE", raising=False)
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_built_crews() -> Generator[None, Any, None]:
+    """Keep built crews and LLM clients (often mocks) from leaking between tests."""
+    from agentic_crew.config.llm import close_llm_pool
+    from agentic_crew.core.decomposer import clear_crew_cache
+
+    clear_crew_cache()
+    close_llm_pool()
+    yield
+    clear_crew_cache()
+    close_llm_pool()
+
+
 @pytest.fixture
 def temp_workspace(tmp_path: Path) -> Path:
     """Create a temporary workspace with package structure."""
@@ -0,0 +1,191 @@
+"""Tests for batch execution (run_crew_batch and `agentic-crew batch`)."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from agentic_crew.core.decomposer import BatchResult, run_crew_batch
+
+CONFIG = {"name": "c", "agents": {}, "tasks": {}}
+
+
+@pytest.fixture
+def runner():
+    """A mocked runner whose crews echo their input."""
+    with patch("agentic_crew.core.decomposer.get_runner") as mock_get_runner:
+        runner = mock_get_runner.return_value
+        runner.reusable_crews = True
+        runner.build_crew.side_effect = lambda config: object()
+
+        def run(crew, inputs):
+            if inputs.get("fail"):
+                raise RuntimeError(f"bad input {inputs['n']}")
+            return f"out {inputs['n']}"
+
+        runner.run.side_effect = run
+        yield runner
+
+
+class TestRunCrewBatch:
+    """Tests for run_crew_batch."""
+
+    def test_results_and_per_item_errors(self, runner) -> None:
+        """Every input produces a result; failures are reported, not raised."""
+        inputs = [{"n": 0}, {"n": 1, "fail": True}, {"n": 2}]
+
+        results = sorted(run_crew_batch(CONFIG, inputs, concurrency=2, framework="crewai"), key=lambda r: r.index)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].output == "out 0"
+        assert results[1].error == "bad input 1"
+        assert results[1].to_dict().keys() == {"index", "success", "error", "duration_ms"}
+
+    def test_builds_once_per_worker(self, runner) -> None:
+        """Crews are built per worker, not per input."""
+        list(run_crew_batch(CONFIG, [{"n": i} for i in range(20)], concurrency=3, framework="crewai"))
+
+        assert runner.build_crew.call_count <= 3
+        assert runner.run.call_count == 20
+
+    @pytest.mark.parametrize("runner_reusable, config", [(False, CONFIG), (True, {**CONFIG, "reusable": False})])
+    def test_stateful_crews_are_built_per_input(self, runner, runner_reusable, config) -> None:
+        """Non-reusable runners and crews get a fresh crew for every input."""
+        runner.reusable_crews = runner_reusable
+        crews = []
+        runner.run.side_effect = lambda crew, inputs: crews.append(crew) or "ok"
+
+        list(run_crew_batch(config, [{"n": i} for i in range(6)], concurrency=2, framework="crewai"))
+
+        assert runner.build_crew.call_count == 6
+        assert len({id(crew) for crew in crews}) == 6
+
+    def test_concurrency_is_bounded(self, runner) -> None:
+        """No more than `concurrency` crews run at the same time."""
+        lock = threading.Lock()
+        active = peak = 0
+
+        def run(crew, inputs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return "ok"
+
+        runner.run.side_effect = run
+        list(run_crew_batch(CONFIG, [{"n": i} for i in range(12)], concurrency=3, framework="crewai"))
+
+        assert 1 < peak <= 3
+
+    def test_completion_order(self, runner) -> None:
+        """Fast runs are yielded before slow ones that started earlier."""
+
+        def run(crew, inputs):
+            time.sleep(0.2 if inputs["n"] == 0 else 0)
+            return str(inputs["n"])
+
+        runner.run.side_effect = run
+        results = list(run_crew_batch(CONFIG, [{"n": 0}, {"n": 1}], concurrency=2, framework="crewai"))
+
+        assert [r.index for r in results] == [1, 0]
+
+    def test_closing_early_stops_consuming_inputs(self, runner) -> None:
+        """Inputs are read lazily and closing the generator stops new runs."""
+        consumed = []
+
+        def run(crew, inputs):
+            time.sleep(0.01)
+            return "ok"
+
+        runner.run.side_effect = run
+
+        def inputs():
+            for i in range(1000):
+                consumed.append(i)
+                yield {"n": i}
+
+        batch = run_crew_batch(CONFIG, inputs(), concurrency=2, framework="crewai")
+        assert isinstance(next(batch), BatchResult)
+        batch.close()
+
+        assert len(consumed) < 1000
+
+    def test_input_errors_abort_the_batch(self, runner) -> None:
+        """Errors raised by the inputs iterable propagate to the caller."""
+
+        def inputs():
+            yield {"n": 0}
+            raise ValueError("bad line")
+
+        with pytest.raises(ValueError, match="bad line"):
+            list(run_crew_batch(CONFIG, inputs(), concurrency=1, framework="crewai"))
+
+    def test_rejects_zero_concurrency(self) -> None:
+        """concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency"):
+            list(run_crew_batch(CONFIG, [], concurrency=0))
+
+
+class TestBatchCommand:
+    """Tests for `agentic-crew batch`."""
+
+    def _main(self, temp_workspace: Path, *argv: str) -> None:
+        from agentic_crew.core.discovery import discover_packages
+        from agentic_crew.main import main
+
+        with (
+            patch("sys.argv", ["agentic-crew", "batch", "otterfall", "test_crew", *argv]),
+            patch("agentic_crew.main.discover_packages", return_value=discover_packages(temp_workspace)),
+            patch("agentic_crew.core.decomposer.is_framework_available", return_value=True),
+        ):
+            main()
+
+    def test_writes_jsonl_results(self, temp_workspace: Path, tmp_path: Path) -> None:
+        """Each input line produces one result line; strings become --input."""
+        inputs = tmp_path / "inputs.jsonl"
+        inputs.write_text('{"species": "otter"}\n\n"beaver"\n')
+        output = tmp_path / "out.jsonl"
+
+        with patch("agentic_crew.core.decomposer.get_runner") as mock_get_runner:
+            mock_get_runner.return_value.run.side_effect = lambda crew, inputs: json.dumps(inputs, sort_keys=True)
+            self._main(temp_workspace, "--inputs", str(inputs), "--output", str(output), "-c", "2")
+
+        lines = sorted((json.loads(line) for line in output.read_text().splitlines()), key=lambda r: r["index"])
+        assert [line["success"] for line in lines] == [True, True]
+        assert json.loads(lines[0]["output"]) == {"species": "otter"}
+        assert json.loads(lines[1]["output"])["input"] == "beaver"
+
+    def test_failed_items_exit_1(self, temp_workspace: Path, tmp_path: Path, capsys) -> None:
+        """A batch with failed items still writes every result, then exits 1."""
+        inputs = tmp_path / "inputs.jsonl"
+        inputs.write_text('{"n": 1}\n{"n": 2}\n')
+
+        with (
+            patch("agentic_crew.core.decomposer.get_runner") as mock_get_runner,
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            mock_get_runner.return_value.run.side_effect = RuntimeError("boom")
+            self._main(temp_workspace, "--inputs", str(inputs))
+
+        assert exc_info.value.code == 1
+        out = capsys.readouterr()
+        assert [json.loads(line)["error"] for line in out.out.splitlines()] == ["boom", "boom"]
+        assert "0 succeeded, 2 failed" in out.err
+
+    def test_invalid_json_exits_2(self, temp_workspace: Path, tmp_path: Path, capsys) -> None:
+        """Malformed input lines are a usage error pointing at the line."""
+        inputs = tmp_path / "inputs.jsonl"
+        inputs.write_text("{nope\n")
+
+        with patch("agentic_crew.core.decomposer.get_runner"), pytest.raises(SystemExit) as exc_info:
+            self._main(temp_workspace, "--inputs", str(inputs))
+
+        assert exc_info.value.code == 2
+        assert "inputs.jsonl:1: invalid JSON" in capsys.readouterr().err
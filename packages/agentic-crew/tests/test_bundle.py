@@ -0,0 +1,167 @@
+"""Tests for compiled crew bundles."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from agentic_crew.core import bundle
+from agentic_crew.core.bundle import compile_bundle, get_bundle_path, load_bundle
+from agentic_crew.core.discovery import get_crew_config, invalidate_config_cache
+
+
+def _age(path: Path, seconds: int = 3600) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def config_dir(temp_workspace: Path) -> Path:
+    """The test workspace's .crewai/ directory with settled mtimes."""
+    config_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+    (config_dir / "knowledge").mkdir()
+    manifest = config_dir / "manifest.yaml"
+    manifest.write_text(manifest.read_text() + "    knowledge:\n      - knowledge\n      - missing\n")
+    for dirpath, _dirnames, filenames in os.walk(config_dir):
+        for name in filenames:
+            _age(Path(dirpath) / name)
+    invalidate_config_cache()
+    return config_dir
+
+
+class TestCompileBundle:
+    """Tests for compile_bundle and load_bundle."""
+
+    def test_roundtrip(self, config_dir: Path) -> None:
+        """A compiled bundle holds the resolved manifest, agents, tasks and knowledge."""
+        summary = compile_bundle(config_dir)
+
+        assert summary["path"] == get_bundle_path(config_dir)
+        assert summary["crews"] == ["test_crew"]
+        data = load_bundle(config_dir)
+        assert data is not None
+        assert data["content_hash"] == summary["content_hash"]
+        crew = data["crews"]["test_crew"]
+        assert crew["agents"]["test_agent"]["role"] == "Test Agent"
+        assert crew["tasks"]["test_task"]["agent"] == "test_agent"
+        assert crew["knowledge_paths"] == ["knowledge"]
+
+    def test_missing_bundle(self, config_dir: Path) -> None:
+        """Without a bundle, load_bundle returns None."""
+        assert load_bundle(config_dir) is None
+
+    def test_edited_source_makes_bundle_stale(self, config_dir: Path) -> None:
+        """Changing an agents file invalidates the bundle."""
+        compile_bundle(config_dir)
+
+        (config_dir / "crews" / "test_crew" / "agents.yaml").write_text("other:\n  role: Other\n")
+
+        assert load_bundle(config_dir) is None
+
+    def test_touched_source_with_same_content_is_fresh(self, config_dir: Path) -> None:
+        """A new mtime alone falls back to the content hash, which still matches."""
+        compile_bundle(config_dir)
+
+        os.utime(config_dir / "manifest.yaml")
+
+        assert load_bundle(config_dir) is not None
+
+    def test_knowledge_appearing_makes_bundle_stale(self, config_dir: Path) -> None:
+        """Creating a knowledge path that was missing invalidates the bundle."""
+        compile_bundle(config_dir)
+
+        (config_dir / "missing").mkdir()
+
+        assert load_bundle(config_dir) is None
+
+    def test_corrupt_bundle_is_ignored(self, config_dir: Path) -> None:
+        """A bundle whose payload does not match its digest is rejected."""
+        compile_bundle(config_dir)
+        path = get_bundle_path(config_dir)
+        blob = bytearray(path.read_bytes())
+        blob[-1] ^= 0xFF
+        path.write_bytes(bytes(blob))
+
+        assert load_bundle(config_dir) is None
+
+    def test_other_version_is_ignored(self, config_dir: Path) -> None:
+        """Bundles written by another format version are not read."""
+        compile_bundle(config_dir)
+
+        with patch.object(bundle, "BUNDLE_VERSION", bundle.BUNDLE_VERSION + 1):
+            assert load_bundle(config_dir) is None
+
+    def test_unstorable_values_raise_value_error(self, config_dir: Path) -> None:
+        """YAML values marshal cannot store produce a clear error."""
+        (config_dir / "manifest.yaml").write_text("crews: {}\nreleased: 2024-01-01\n")
+
+        with pytest.raises(ValueError, match="Cannot compile"):
+            compile_bundle(config_dir)
+
+
+class TestGetCrewConfigWithBundle:
+    """get_crew_config prefers an up-to-date bundle."""
+
+    def test_uses_bundle_without_parsing_yaml(self, config_dir: Path) -> None:
+        """With a fresh bundle no YAML is parsed."""
+        compile_bundle(config_dir)
+
+        with patch("agentic_crew.core.discovery.load_yaml") as mock_load:
+            config = get_crew_config(config_dir, "test_crew")
+            config.load_all()
+
+        mock_load.assert_not_called()
+        assert config["agents"]["test_agent"]["role"] == "Test Agent"
+        assert config["knowledge_paths"] == [config_dir / "knowledge"]
+        assert config["required_framework"] == "crewai"
+
+    def test_matches_yaml_result(self, config_dir: Path) -> None:
+        """Bundle and YAML sources produce identical configs."""
+        from_yaml = get_crew_config(config_dir, "test_crew").copy()
+        compile_bundle(config_dir)
+
+        assert get_crew_config(config_dir, "test_crew").copy() == from_yaml
+
+    def test_stale_bundle_falls_back_to_yaml(self, config_dir: Path) -> None:
+        """Edits made after compiling are picked up from YAML."""
+        compile_bundle(config_dir)
+        (config_dir / "crews" / "test_crew" / "agents.yaml").write_text("other:\n  role: Other\n")
+
+        assert get_crew_config(config_dir, "test_crew")["agents"] == {"other": {"role": "Other"}}
+
+
+class TestCompileCommand:
+    """Tests for `agentic-crew compile`."""
+
+    def test_compile_json(self, config_dir: Path, capsys) -> None:
+        """compile --json reports one bundle per config directory."""
+        from agentic_crew.main import main
+
+        with (
+            patch("sys.argv", ["agentic-crew", "compile", "--json"]),
+            patch(
+                "agentic_crew.main.discover_all_framework_configs", return_value={"otterfall": {"crewai": config_dir}}
+            ),
+        ):
+            main()
+
+        data = json.loads(capsys.readouterr().out)
+        assert data["bundles"][0]["package"] == "otterfall"
+        assert data["bundles"][0]["crews"] == ["test_crew"]
+        assert get_bundle_path(config_dir).exists()
+
+    def test_compile_unknown_package_exits_2(self) -> None:
+        """Compiling a package that does not exist is a configuration error."""
+        from agentic_crew.main import main
+
+        with (
+            patch("sys.argv", ["agentic-crew", "compile", "nope"]),
+            patch("agentic_crew.main.discover_all_framework_configs", return_value={}),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+        assert exc_info.value.code == 2
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -131,3 +136,57 @@ class TestListRunnersCommand:
         captured = capsys.readouterr()
         # Should show some output (either runners or header)
         assert len(captured.out) > 0
+
+
+class TestImportBudget:
+    """`agentic-crew list --json` must stay cheap to start."""
+
+    # Cumulative import time allowed for agentic_crew and everything it pulls in
+    IMPORT_BUDGET_MS = 400
+
+    # Modules `list` has no use for; each one costs tens of milliseconds or more
+    FORBIDDEN_MODULES = {
+        "asyncio",
+        "agentic_crew.core.manager",
+        "agentic_crew.core.decomposer",
+        "agentic_crew.core.runner",
+        "agentic_crew.core.loader",
+        "crewai",
+        "langgraph",
+        "strands",
+    }
+
+    @staticmethod
+    def _importtime(tmp_path: Path) -> list[tuple[int, str]]:
+        """Run `list --json` under -X importtime; return (cumulative_us, name) for top-level imports."""
+        code = "import sys; sys.argv = ['agentic-crew', 'list', '--json']; from agentic_crew.main import main; main()"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            env=os.environ.copy(),
+            check=True,
+        )
+        json.loads(result.stdout)
+
+        entries = []
+        started = False
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            # Imports made during interpreter startup are not ours
+            started = started or name.strip().startswith("agentic_crew")
+            if started:
+                entries.append((int(cumulative_us), name[1:]))
+        return entries
+
+    def test_list_json_import_budget(self, tmp_path: Path) -> None:
+        """Importing for `list --json` stays within the budget and skips heavy modules."""
+        entries = self._importtime(tmp_path)
+
+        imported = {name.strip() for _us, name in entries}
+        assert not imported & self.FORBIDDEN_MODULES
+        total_ms = sum(us for us, name in entries if not name.startswith(" ")) / 1000
+        assert total_ms < self.IMPORT_BUDGET_MS, f"list --json imports took {total_ms:.0f} ms"
@@ -0,0 +1,120 @@
+"""Tests for the lazy CrewConfig mapping."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agentic_crew.core.crew_config import CrewConfig
+
+
+def _config(agents_loader: MagicMock | None = None) -> CrewConfig:
+    return CrewConfig(
+        {"name": "demo", "description": "Demo crew"},
+        loaders={"agents": agents_loader or MagicMock(return_value={"a": {"role": "A"}})},
+    )
+
+
+class TestCrewConfig:
+    """Tests for lazy loading and dict compatibility."""
+
+    def test_cheap_fields_do_not_trigger_loaders(self) -> None:
+        """Reading eager fields never runs a loader."""
+        loader = MagicMock(return_value={})
+        config = _config(loader)
+
+        assert config["name"] == "demo"
+        assert config.get("description") == "Demo crew"
+        assert "agents" in config
+        assert len(config) == 3
+        loader.assert_not_called()
+        assert not config.is_loaded("agents")
+
+    def test_loader_runs_once_on_first_access(self) -> None:
+        """A lazy field is loaded on first access and then kept."""
+        loader = MagicMock(return_value={"a": {"role": "A"}})
+        config = _config(loader)
+
+        assert config["agents"] == {"a": {"role": "A"}}
+        assert config.get("agents") == {"a": {"role": "A"}}
+        loader.assert_called_once()
+        assert config.is_loaded("agents")
+
+    def test_missing_key_raises_and_get_defaults(self) -> None:
+        """Unknown keys behave like a plain dict."""
+        config = _config()
+
+        with pytest.raises(KeyError):
+            config["unknown"]
+        assert config.get("unknown", "fallback") == "fallback"
+
+    def test_failed_load_is_retried(self) -> None:
+        """A loader that raises is kept so the next access retries it."""
+        loader = MagicMock(side_effect=[OSError("busy"), {"ok": {}}])
+        config = _config(loader)
+
+        with pytest.raises(OSError):
+            config["agents"]
+        assert config["agents"] == {"ok": {}}
+
+    def test_whole_mapping_operations_load_everything(self) -> None:
+        """Iteration, equality and conversion see every field."""
+        config = _config()
+
+        assert isinstance(config, dict)
+        assert set(config) == {"name", "description", "agents"}
+        assert dict(config)["agents"] == {"a": {"role": "A"}}
+        assert config == {"name": "demo", "description": "Demo crew", "agents": {"a": {"role": "A"}}}
+        assert {**_config()}["agents"] == {"a": {"role": "A"}}
+
+    def test_assignment_replaces_pending_loader(self) -> None:
+        """Setting a lazy key discards its loader."""
+        loader = MagicMock()
+        config = _config(loader)
+
+        config["agents"] = {}
+        del config["name"]
+
+        assert config["agents"] == {}
+        assert "name" not in config
+        loader.assert_not_called()
+
+    def test_copy_and_pickle_produce_plain_dicts(self) -> None:
+        """Copies drop the loader closures."""
+        config = _config()
+
+        for clone in (config.copy(), copy.deepcopy(config), pickle.loads(pickle.dumps(config))):
+            assert type(clone) is dict
+            assert clone["agents"] == {"a": {"role": "A"}}
+
+
+class TestGetCrewConfigLaziness:
+    """get_crew_config defers agents/tasks parsing."""
+
+    def test_agents_and_tasks_parsed_on_access(self, temp_workspace: Path) -> None:
+        """Only the manifest is parsed until agents or tasks are read."""
+        from agentic_crew.core.discovery import get_crew_config, invalidate_config_cache
+
+        invalidate_config_cache()
+        crewai_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+
+        with patch("agentic_crew.core.discovery._load_optional_yaml", return_value={}) as mock_load:
+            config = get_crew_config(crewai_dir, "test_crew")
+            assert config["required_framework"] == "crewai"
+            mock_load.assert_not_called()
+
+            config.get("agents")
+            assert mock_load.call_count == 1
+
+    def test_loaded_values_match_files(self, temp_workspace: Path) -> None:
+        """Lazily loaded fields contain the YAML contents."""
+        from agentic_crew.core.discovery import get_crew_config
+
+        config = get_crew_config(temp_workspace / "packages" / "otterfall" / ".crewai", "test_crew")
+
+        assert config["agents"]["test_agent"]["role"] == "Test Agent"
+        assert config["tasks"]["test_task"]["agent"] == "test_agent"
+        assert config["knowledge_paths"] == []
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from agentic_crew.core.decomposer import (
+    _detection_path,
     _framework_cache,
+    _get_built_crew,
     _get_install_command,
+    crew_cache_info,
+    crew_fingerprint,
+    decompose_crew,
     detect_framework,
     get_available_frameworks,
     is_framework_available,
+    run_crew_auto,
+    run_crew_auto_async,
 )
 
 
@@ -32,26 +43,42 @@ class TestIsFrameworkAvailable:
         assert "unsupported_thing" in _framework_cache
         assert _framework_cache["unsupported_thing"] is False
 
-    def test_import_failure_returns_false(self) -> None:
-        """When importlib.import_module raises ImportError, return False."""
-        with patch("agentic_crew.core.decomposer.importlib.import_module", side_effect=ImportError("nope")):
+    def test_missing_framework_returns_false(self) -> None:
+        """When find_spec finds nothing, return False."""
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec", return_value=None):
             result = is_framework_available("crewai")
         assert result is False
 
-    def test_successful_import_returns_true_and_caches(self) -> None:
-        """A successful import should cache True."""
-        with patch("agentic_crew.core.decomposer.importlib.import_module"):
+    def test_find_spec_error_returns_false(self) -> None:
+        """A broken parent package or spec lookup error counts as unavailable."""
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec", side_effect=ValueError("bad spec")):
+            result = is_framework_available("crewai")
+        assert result is False
+
+    def test_found_framework_returns_true_and_caches(self) -> None:
+        """A located framework should cache True."""
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec"):
             result = is_framework_available("crewai")
         assert result is True
         assert _framework_cache["crewai"] is True
 
-    def test_cache_hit_does_not_reimport(self) -> None:
-        """Once cached, no re-import should occur."""
+    def test_detection_does_not_import(self) -> None:
+        """Availability checks never import the framework."""
+        with (
+            patch("agentic_crew.core.decomposer.importlib.util.find_spec") as mock_find,
+            patch("importlib.import_module") as mock_import,
+        ):
+            is_framework_available("crewai")
+        mock_find.assert_called()
+        mock_import.assert_not_called()
+
+    def test_cache_hit_does_not_search_again(self) -> None:
+        """Once cached, no new lookup should occur."""
         _framework_cache["strands"] = True
-        with patch("agentic_crew.core.decomposer.importlib.import_module") as mock_import:
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec") as mock_find:
             result = is_framework_available("strands")
         assert result is True
-        mock_import.assert_not_called()
+        mock_find.assert_not_called()
 
     def test_empty_string_framework_returns_false(self) -> None:
         """Empty string framework name should return False."""
@@ -59,6 +86,61 @@ class TestIsFrameworkAvailable:
         assert result is False
 
 
+class TestPersistedDetection:
+    """Detection results are shared across processes via the cache directory."""
+
+    @pytest.fixture(autouse=True)
+    def settled_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Use a single sys.path entry whose mtime is old enough to trust."""
+        site_packages = tmp_path / "site-packages"
+        site_packages.mkdir()
+        past = time.time() - 3600
+        os.utime(site_packages, (past, past))
+        monkeypatch.setattr(sys, "path", [str(site_packages)])
+        _framework_cache.clear()
+        return site_packages
+
+    def test_results_are_persisted(self) -> None:
+        """A second process reuses the stored results without searching."""
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec", return_value=None):
+            is_framework_available("crewai")
+        assert _detection_path().exists()
+
+        _framework_cache.clear()
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec") as mock_find:
+            assert is_framework_available("langgraph") is False
+        mock_find.assert_not_called()
+
+    def test_changed_site_packages_invalidates(self, settled_path: Path) -> None:
+        """Installing a package (changing a sys.path dir) triggers a new search."""
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec", return_value=None):
+            assert is_framework_available("crewai") is False
+
+        (settled_path / "crewai").mkdir()
+        _framework_cache.clear()
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec") as mock_find:
+            assert is_framework_available("crewai") is True
+        mock_find.assert_called()
+
+    def test_recently_modified_path_is_not_persisted(self, settled_path: Path) -> None:
+        """Results are not stored while a sys.path dir may still be changing."""
+        os.utime(settled_path)
+
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec", return_value=None):
+            is_framework_available("crewai")
+
+        assert not _detection_path().exists()
+
+    def test_no_cache_env_disables_persistence(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """AGENTIC_CREW_NO_CACHE keeps detection in-process only."""
+        monkeypatch.setenv("AGENTIC_CREW_NO_CACHE", "1")
+
+        with patch("agentic_crew.core.decomposer.importlib.util.find_spec", return_value=None):
+            is_framework_available("crewai")
+
+        assert not _detection_path().exists()
+
+
 class TestDetectFramework:
     """Edge cases for detect_framework."""
 
@@ -173,3 +255,110 @@ class TestGetInstallCommand:
         """Unknown framework name should return as-is."""
         result = _get_install_command("unknown_framework")
         assert result == "unknown_framework"
+
+
+class TestBuiltCrewCache:
+    """run_crew_auto reuses built crews by config fingerprint."""
+
+    CONFIG = {"name": "c", "agents": {"a": {"role": "A"}}, "tasks": {"t": {"agent": "a"}}, "llm": {}}
+
+    @pytest.fixture
+    def runner(self):
+        with patch("agentic_crew.core.decomposer.get_runner") as mock_get_runner:
+            runner = mock_get_runner.return_value
+            runner.reusable_crews = True
+            runner.build_crew.side_effect = lambda config: object()
+            runner.run.return_value = "ok"
+            yield runner
+
+    def test_identical_config_builds_once(self, runner) -> None:
+        """A second run with an equal config reuses the built crew."""
+        assert run_crew_auto(dict(self.CONFIG), framework="crewai") == "ok"
+        assert run_crew_auto(dict(self.CONFIG), framework="crewai") == "ok"
+
+        assert runner.build_crew.call_count == 1
+        crews = [c.args[0] for c in runner.run.call_args_list]
+        assert crews[0] is crews[1]
+        assert crew_cache_info()["hits"] == 1
+
+    def test_changed_config_or_framework_rebuilds(self, runner) -> None:
+        """Different agents or a different framework produce a new crew."""
+        run_crew_auto(dict(self.CONFIG), framework="crewai")
+        run_crew_auto({**self.CONFIG, "llm": {"model": "other"}}, framework="crewai")
+        run_crew_auto(dict(self.CONFIG), framework="langgraph")
+
+        assert runner.build_crew.call_count == 3
+
+    def test_manifest_is_not_fingerprinted(self) -> None:
+        """Edits to other crews in the manifest keep the fingerprint."""
+        a = crew_fingerprint({**self.CONFIG, "manifest": {"crews": {"x": {}}}}, "crewai")
+        b = crew_fingerprint({**self.CONFIG, "manifest": {"crews": {"y": {}}}}, "crewai")
+
+        assert a == b
+
+    @pytest.mark.parametrize(
+        ("config_extra", "kwargs", "reusable_crews"),
+        [
+            ({}, {"cache": False}, True),
+            ({"reusable": False}, {}, True),
+            ({}, {}, False),
+        ],
+    )
+    def test_opt_outs_rebuild_every_run(self, runner, config_extra, kwargs, reusable_crews) -> None:
+        """cache=False, reusable: false and non-reusable runners never cache."""
+        runner.reusable_crews = reusable_crews
+        for _ in range(2):
+            run_crew_auto({**self.CONFIG, **config_extra}, framework="crewai", **kwargs)
+
+        assert runner.build_crew.call_count == 2
+
+    def test_busy_crew_is_not_shared(self, runner) -> None:
+        """A caller arriving while the cached crew runs gets its own crew."""
+        run_crew_auto(dict(self.CONFIG), framework="crewai")
+        entry = _get_built_crew(dict(self.CONFIG), "crewai", cache=True)
+
+        with entry.lock:
+            run_crew_auto(dict(self.CONFIG), framework="crewai")
+
+        assert runner.build_crew.call_count == 2
+        assert runner.run.call_args.args[0] is not entry.crew
+
+    def test_decompose_crew_returns_private_crews(self, runner) -> None:
+        """decompose_crew never hands out the crew run_crew_auto caches unless asked."""
+        run_crew_auto(dict(self.CONFIG), framework="crewai")
+        cached = runner.run.call_args.args[0]
+
+        assert decompose_crew(dict(self.CONFIG), framework="crewai") is not cached
+        assert decompose_crew(dict(self.CONFIG), framework="crewai", cache=True) is cached
+        assert runner.build_crew.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_run_uses_arun_and_shares_cache(self, runner) -> None:
+        """run_crew_auto_async awaits runner.arun and reuses the same built crews."""
+        runner.arun = AsyncMock(return_value="async ok")
+        run_crew_auto(dict(self.CONFIG), framework="crewai")
+
+        assert await run_crew_auto_async(dict(self.CONFIG), inputs={"x": 1}, framework="crewai") == "async ok"
+
+        assert runner.build_crew.call_count == 1
+        crew = runner.run.call_args.args[0]
+        runner.arun.assert_awaited_once_with(crew, {"x": 1})
+
+    @pytest.mark.asyncio
+    async def test_cancelled_async_run_retires_the_crew(self, runner) -> None:
+        """A crew whose run was cancelled is not handed to the next caller."""
+        import asyncio
+
+        async def hang(crew, inputs):
+            await asyncio.sleep(10)
+
+        runner.arun = hang
+        run = asyncio.ensure_future(run_crew_auto_async(dict(self.CONFIG), framework="crewai"))
+        await asyncio.sleep(0.01)
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        run_crew_auto(dict(self.CONFIG), framework="crewai")
+        assert runner.build_crew.call_count == 2
+        assert crew_cache_info()["size"] == 1
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -86,26 +88,20 @@ class TestDiscovery:
         """Test that list_crews returns crew definitions from manifest."""
         from agentic_crew.core.discovery import list_crews
 
-        with patch(
-            "agentic_crew.core.discovery.discover_packages",
-            return_value={"otterfall": temp_workspace / "packages" / "otterfall" / ".crewai"},
-        ):
-            crews_by_package = list_crews()
+        crews_by_package = list_crews(workspace_root=temp_workspace)
 
         assert "otterfall" in crews_by_package
         crews = crews_by_package["otterfall"]
         assert len(crews) == 1
         assert crews[0]["name"] == "test_crew"
+        assert crews[0]["description"] == "A test crew"
+        assert crews[0]["required_framework"] == "crewai"
 
     def test_list_crews_filters_by_package_name(self, temp_workspace: Path) -> None:
         """Test that list_crews can filter to a specific package."""
         from agentic_crew.core.discovery import list_crews
 
-        with patch(
-            "agentic_crew.core.discovery.discover_packages",
-            return_value={"otterfall": temp_workspace / "packages" / "otterfall" / ".crewai"},
-        ):
-            crews_by_package = list_crews(package_name="otterfall")
+        crews_by_package = list_crews(package_name="otterfall", workspace_root=temp_workspace)
 
         assert "otterfall" in crews_by_package
         assert len(crews_by_package) == 1
@@ -114,14 +110,56 @@ class TestDiscovery:
         """Test that list_crews returns empty for non-existent package."""
         from agentic_crew.core.discovery import list_crews
 
-        with patch(
-            "agentic_crew.core.discovery.discover_packages",
-            return_value={"otterfall": temp_workspace / "packages" / "otterfall" / ".crewai"},
-        ):
-            crews_by_package = list_crews(package_name="nonexistent")
+        crews_by_package = list_crews(package_name="nonexistent", workspace_root=temp_workspace)
 
         assert crews_by_package == {}
 
+    def test_list_crews_uses_one_scan_without_loading_manifests(self, temp_workspace: Path) -> None:
+        """list_crews is served from a single workspace scan, not per-package manifest loads."""
+        from agentic_crew.core import discovery
+
+        with (
+            patch.object(discovery, "scan_crew_configs", wraps=discovery.scan_crew_configs) as scan,
+            patch.object(discovery, "load_manifest") as load_manifest,
+        ):
+            crews_by_package = discovery.list_crews(workspace_root=temp_workspace)
+
+        assert scan.call_count == 1
+        load_manifest.assert_not_called()
+        assert [crew["name"] for crew in crews_by_package["otterfall"]] == ["test_crew"]
+
+    def test_list_crews_surfaces_unreadable_manifest(self, tmp_path: Path) -> None:
+        """A manifest the scan could not parse still raises from list_crews."""
+        import yaml
+        from agentic_crew.core.discovery import list_crews
+
+        config_dir = tmp_path / "packages" / "broken" / ".crew"
+        config_dir.mkdir(parents=True)
+        (config_dir / "manifest.yaml").write_text("crews: [unclosed")
+
+        with pytest.raises(yaml.YAMLError):
+            list_crews(workspace_root=tmp_path)
+
+    def test_index_crews_maps_names_to_packages(self, temp_workspace: Path, tmp_path: Path) -> None:
+        """index_crews lists every package defining a crew, skipping broken manifests."""
+        from agentic_crew.core.discovery import index_crews
+
+        other = tmp_path / "other" / ".crewai"
+        other.mkdir(parents=True)
+        (other / "manifest.yaml").write_text("name: other\ncrews:\n  test_crew: {}\n  solo: {}\n")
+        broken = tmp_path / "broken" / ".crewai"
+        broken.mkdir(parents=True)
+
+        index = index_crews(
+            {
+                "otterfall": temp_workspace / "packages" / "otterfall" / ".crewai",
+                "broken": broken,
+                "other": other,
+            }
+        )
+
+        assert index == {"test_crew": ["otterfall", "other"], "solo": ["other"]}
+
     def test_load_manifest_parses_yaml(self, temp_workspace: Path) -> None:
         """Test that load_manifest parses YAML correctly."""
         from agentic_crew.core.discovery import load_manifest
@@ -460,3 +498,94 @@ class TestDecomposer:
 
         result = _get_install_command("langgraph")
         assert "langgraph" in result
+
+
+class TestConfigCache:
+    """Tests for the mtime-validated parsed-config cache."""
+
+    @staticmethod
+    def _age(path: Path) -> None:
+        past = time.time() - 3600
+        os.utime(path, (past, past))
+
+    def test_unchanged_manifest_is_not_reparsed(self, temp_workspace: Path) -> None:
+        """A second load of an unchanged manifest skips YAML parsing."""
+        from agentic_crew.core.discovery import load_manifest
+
+        crewai_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+        self._age(crewai_dir / "manifest.yaml")
+        load_manifest(crewai_dir)
+
+        with patch("agentic_crew.core.discovery.load_yaml") as mock_load:
+            manifest = load_manifest(crewai_dir)
+
+        mock_load.assert_not_called()
+        assert manifest["name"] == "otterfall"
+
+    def test_modified_manifest_is_reparsed(self, temp_workspace: Path) -> None:
+        """Changing the file invalidates its cache entry."""
+        from agentic_crew.core.discovery import load_manifest
+
+        crewai_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+        manifest_path = crewai_dir / "manifest.yaml"
+        self._age(manifest_path)
+        load_manifest(crewai_dir)
+
+        manifest_path.write_text("name: renamed\ncrews: {}\n")
+        self._age(manifest_path)
+
+        assert load_manifest(crewai_dir)["name"] == "renamed"
+
+    def test_recently_modified_file_is_not_cached(self, temp_workspace: Path) -> None:
+        """Files inside the racy window are parsed every time."""
+        from agentic_crew.core.discovery import load_manifest
+
+        crewai_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+        load_manifest(crewai_dir)
+
+        with patch("agentic_crew.core.discovery.load_yaml", return_value={"name": "fresh"}) as mock_load:
+            manifest = load_manifest(crewai_dir)
+
+        mock_load.assert_called_once()
+        assert manifest["name"] == "fresh"
+
+    def test_results_are_isolated_copies(self, temp_workspace: Path) -> None:
+        """Mutating a returned config does not affect later lookups."""
+        from agentic_crew.core.discovery import get_crew_config
+
+        crewai_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+        for path in crewai_dir.rglob("*.yaml"):
+            self._age(path)
+
+        first = get_crew_config(crewai_dir, "test_crew")
+        first["agents"]["test_agent"]["role"] = "Mutated"
+        second = get_crew_config(crewai_dir, "test_crew")
+
+        assert second["agents"]["test_agent"]["role"] == "Test Agent"
+
+    def test_invalidate_config_cache_by_directory(self, temp_workspace: Path) -> None:
+        """Invalidating a config dir drops every cached file beneath it."""
+        from agentic_crew.core.discovery import get_crew_config, invalidate_config_cache
+
+        crewai_dir = temp_workspace / "packages" / "otterfall" / ".crewai"
+        for path in crewai_dir.rglob("*.yaml"):
+            self._age(path)
+        get_crew_config(crewai_dir, "test_crew").load_all()
+
+        assert invalidate_config_cache(crewai_dir) == 3
+        assert invalidate_config_cache(crewai_dir) == 0
+
+    def test_cache_is_bounded(self, tmp_path: Path) -> None:
+        """The least recently used files are evicted beyond the size limit."""
+        from agentic_crew.core import discovery
+
+        with patch.object(discovery, "_config_cache", discovery.LRUCache(2)):
+            for name in ("a", "b", "c"):
+                config_dir = tmp_path / name
+                config_dir.mkdir()
+                (config_dir / "manifest.yaml").write_text(f"name: {name}\n")
+                self._age(config_dir / "manifest.yaml")
+                discovery.load_manifest(config_dir)
+
+            assert discovery.config_cache_info()["size"] == 2
+            assert str(tmp_path / "a" / "manifest.yaml") not in discovery._config_cache
@@ -0,0 +1,196 @@
+"""Tests for the persistent discovery index."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from agentic_crew.core import discovery_index
+from agentic_crew.core.discovery import DIR_TO_FRAMEWORK, discover_all_framework_configs, discover_packages
+from agentic_crew.core.discovery_index import get_index_path, scan_workspace
+
+
+def _make_package(root: Path, name: str, dir_name: str = ".crew") -> Path:
+    config_dir = root / "packages" / name / dir_name
+    config_dir.mkdir(parents=True)
+    (config_dir / "manifest.yaml").write_text(f"name: {name}\ncrews: {{}}")
+    return config_dir
+
+
+def _age_tree(root: Path, seconds: int = 3600) -> None:
+    """Move every directory and file mtime into the past so the index trusts it."""
+    past = time.time() - seconds
+    for dirpath, _dirnames, filenames in os.walk(root):
+        os.utime(dirpath, (past, past))
+        for filename in filenames:
+            os.utime(os.path.join(dirpath, filename), (past, past))
+
+
+class TestScanWorkspace:
+    """Tests for scan_workspace and index persistence."""
+
+    def test_writes_index_file(self, tmp_path: Path) -> None:
+        """A scan persists the index under the cache directory."""
+        _make_package(tmp_path, "alpha")
+
+        scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        index_path = get_index_path(tmp_path)
+        data = json.loads(index_path.read_text())
+        assert data["version"] == discovery_index.INDEX_VERSION
+        assert "alpha" in data["packages"]
+
+    def test_warm_scan_skips_unchanged_packages(self, tmp_path: Path) -> None:
+        """Packages whose directories did not change are not rescanned."""
+        _make_package(tmp_path, "alpha")
+        _make_package(tmp_path, "beta", ".crewai")
+        _age_tree(tmp_path)
+        scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        with patch.object(discovery_index, "_scan_holder", wraps=discovery_index._scan_holder) as spy:
+            scan = scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        assert spy.call_count == 0
+        assert scan.packages["alpha"][None].config_dir == tmp_path / "packages" / "alpha" / ".crew"
+        assert scan.packages["beta"]["crewai"].manifest == tmp_path / "packages" / "beta" / ".crewai" / "manifest.yaml"
+
+    def test_only_changed_package_is_rescanned(self, tmp_path: Path) -> None:
+        """Adding a config dir to one package only refreshes that package."""
+        _make_package(tmp_path, "alpha")
+        _make_package(tmp_path, "beta")
+        _age_tree(tmp_path)
+        scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        strands_dir = tmp_path / "packages" / "beta" / ".strands"
+        strands_dir.mkdir()
+        (strands_dir / "manifest.yaml").write_text("crews: {}")
+
+        with patch.object(discovery_index, "_scan_holder", wraps=discovery_index._scan_holder) as spy:
+            configs = discover_all_framework_configs(workspace_root=tmp_path)
+
+        scanned = [call.args[0] for call in spy.call_args_list]
+        assert tmp_path / "packages" / "beta" in scanned
+        assert tmp_path / "packages" / "alpha" not in scanned
+        assert "strands" in configs["beta"]
+
+    def test_new_package_is_discovered(self, tmp_path: Path) -> None:
+        """A package added after the index was written is found."""
+        _make_package(tmp_path, "alpha")
+        _age_tree(tmp_path)
+        discover_packages(workspace_root=tmp_path)
+
+        _make_package(tmp_path, "gamma")
+
+        assert set(discover_packages(workspace_root=tmp_path)) == {"alpha", "gamma"}
+
+    def test_manifest_added_to_existing_config_dir(self, tmp_path: Path) -> None:
+        """Creating manifest.yaml inside an indexed config dir is detected."""
+        config_dir = tmp_path / "packages" / "alpha" / ".crew"
+        config_dir.mkdir(parents=True)
+        _age_tree(tmp_path)
+        assert discover_packages(workspace_root=tmp_path) == {}
+
+        (config_dir / "manifest.yaml").write_text("crews: {}")
+
+        assert discover_packages(workspace_root=tmp_path) == {"alpha": config_dir}
+
+    def test_recent_mtimes_are_not_trusted(self, tmp_path: Path) -> None:
+        """Directories modified within the racy window are always rechecked."""
+        _make_package(tmp_path, "alpha")
+        scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        data = json.loads(get_index_path(tmp_path).read_text())
+        assert data["packages_mtime_ns"] is None
+        assert data["packages"]["alpha"]["mtime_ns"] is None
+
+    def test_records_crews_declared_by_manifests(self, tmp_path: Path) -> None:
+        """The scan carries each manifest's crews and persists them in the index."""
+        config_dir = _make_package(tmp_path, "alpha")
+        (config_dir / "manifest.yaml").write_text(
+            "crews:\n  review:\n    description: Reviews code\n    preferred_framework: strands\n"
+        )
+
+        scan = scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        expected = {"review": {"description": "Reviews code", "preferred_framework": "strands"}}
+        assert scan.packages["alpha"][None].crews == expected
+        data = json.loads(get_index_path(tmp_path).read_text())
+        assert data["packages"]["alpha"]["configs"][".crew"]["crews"] == expected
+
+    def test_unchanged_manifests_are_not_parsed_again(self, tmp_path: Path) -> None:
+        """A warm scan reuses recorded crews and re-reads a manifest rewritten in place."""
+        config_dir = _make_package(tmp_path, "alpha")
+        _make_package(tmp_path, "beta")
+        _age_tree(tmp_path)
+        scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        with patch.object(discovery_index, "_read_crews", wraps=discovery_index._read_crews) as spy:
+            scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+        assert spy.call_count == 0
+
+        # Rewriting the file does not move its directory's mtime
+        manifest = config_dir / "manifest.yaml"
+        manifest.write_text("crews:\n  added: {}\n")
+        past = time.time() - 60
+        os.utime(manifest, (past, past))
+        with patch.object(discovery_index, "_read_crews", wraps=discovery_index._read_crews) as spy:
+            scan = scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        assert [call.args[0] for call in spy.call_args_list] == [manifest]
+        assert list(scan.packages["alpha"][None].crews) == ["added"]
+
+    def test_corrupt_index_is_ignored(self, tmp_path: Path) -> None:
+        """An unreadable index falls back to a full scan."""
+        _make_package(tmp_path, "alpha")
+        index_path = get_index_path(tmp_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text("{not json")
+
+        assert "alpha" in discover_packages(workspace_root=tmp_path)
+
+    def test_no_cache_env_disables_index(self, tmp_path: Path, monkeypatch) -> None:
+        """AGENTIC_CREW_NO_CACHE skips reading and writing the index."""
+        monkeypatch.setenv("AGENTIC_CREW_NO_CACHE", "1")
+        _make_package(tmp_path, "alpha")
+
+        assert "alpha" in discover_packages(workspace_root=tmp_path)
+        assert not get_index_path(tmp_path).exists()
+
+
+class TestScanCost:
+    """Filesystem call budget of a scan (see benchmarks/bench_discovery.py)."""
+
+    @staticmethod
+    def _count_stats(fn) -> int:
+        real_stat = os.stat
+        with patch("os.stat", side_effect=real_stat) as mock_stat:
+            fn()
+        return mock_stat.call_count
+
+    def test_warm_scan_stats_once_per_directory(self, tmp_path: Path) -> None:
+        """A warm scan stats each package, config dir and manifest once, never candidates."""
+        for i in range(20):
+            _make_package(tmp_path, f"pkg{i:02d}")
+        for i in range(20, 40):
+            (tmp_path / "packages" / f"pkg{i:02d}").mkdir(parents=True)
+        _age_tree(tmp_path)
+        scan_workspace(tmp_path, DIR_TO_FRAMEWORK)
+
+        stats = self._count_stats(lambda: scan_workspace(tmp_path, DIR_TO_FRAMEWORK))
+
+        # packages/ + 40 package dirs + 20 config dirs + 20 manifests + workspace root
+        assert stats == 1 + 40 + 20 + 20 + 1
+
+    def test_cold_scan_does_not_probe_missing_config_dirs(self, tmp_path: Path, monkeypatch) -> None:
+        """Without an index, packages lacking config dirs cost one stat, not one per framework."""
+        monkeypatch.setenv("AGENTIC_CREW_NO_CACHE", "1")
+        for i in range(30):
+            (tmp_path / "packages" / f"pkg{i:02d}").mkdir(parents=True)
+
+        stats = self._count_stats(lambda: scan_workspace(tmp_path, DIR_TO_FRAMEWORK))
+
+        # packages/ + 30 package dirs + workspace root
+        assert stats == 1 + 30 + 1
@@ -0,0 +1,128 @@
+"""Tests for workflow run journals and ManagerAgent.run/resume."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from agentic_crew.core.journal import JournalSession, WorkflowJournal
+from agentic_crew.core.manager import ManagerAgent
+
+
+class TestWorkflowJournal:
+    """Tests for the journal file."""
+
+    def test_round_trip(self, tmp_path):
+        """start/record/finish are read back by load."""
+        journal = WorkflowJournal("run-1", tmp_path)
+        journal.start("make a game", {"mode": "fast"})
+        journal.record("k:0", "design", "Design")
+
+        state = journal.load()
+        assert state.task == "make a game"
+        assert state.kwargs == {"mode": "fast"}
+        assert state.delegations == {"k:0": "Design"}
+        assert not state.finished
+
+        journal.finish("Done")
+        assert journal.load().output == "Done"
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """A crash mid-write does not make the journal unreadable."""
+        journal = WorkflowJournal("run-1", tmp_path)
+        journal.start("t", {})
+        journal.record("k:0", "design", "Design")
+        with open(journal.path, "a", encoding="utf-8") as f:
+            f.write('{"type": "delegation", "key": "k:1"')
+
+        assert journal.load().delegations == {"k:0": "Design"}
+
+    def test_invalid_runs(self, tmp_path):
+        """Run ids are validated, and a run can only be started once."""
+        with pytest.raises(ValueError, match="Invalid run id"):
+            WorkflowJournal("../escape", tmp_path)
+
+        journal = WorkflowJournal("run-1", tmp_path)
+        with pytest.raises(TypeError, match="JSON-serializable"):
+            journal.start("t", {"callback": print})
+        journal.start("t", {})
+        with pytest.raises(FileExistsError):
+            journal.start("t", {})
+
+    def test_session_keys_count_repeats(self, tmp_path):
+        """Identical delegations in one run get distinct, reproducible keys."""
+        journal = WorkflowJournal("run-1", tmp_path)
+        first, second = JournalSession(journal), JournalSession(journal)
+
+        keys = [first.key("design", None, {"task": "t"}) for _ in range(2)]
+
+        assert keys[0] != keys[1]
+        assert second.key("design", None, {"task": "t"}) == keys[0]
+
+
+class _FlakyManager(ManagerAgent):
+    """Manager whose workflow fails after two delegations on its first run."""
+
+    attempts = 0
+
+    async def execute_workflow(self, task: str, **kwargs) -> str:
+        design = await self.delegate_async("design", task)
+        code = self.delegate("code", {"design": design})
+        self.attempts += 1
+        if self.attempts == 1:
+            raise RuntimeError("review crashed")
+        review = await self.delegate_async("review", {"code": code})
+        return f"{review} ({kwargs['mode']})"
+
+
+class TestManagerResume:
+    """Tests for journaled runs."""
+
+    def _manager(self, tmp_path) -> _FlakyManager:
+        manager = _FlakyManager(crews={"design": "d", "code": "c", "review": "r"}, journal_dir=tmp_path)
+        manager._crew_config_cache = {name: {"name": name, "agents": {}, "tasks": {}} for name in "dcr"}
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_completed_delegations(self, tmp_path):
+        """Only delegations missing from the journal run on resume."""
+        manager = self._manager(tmp_path)
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto", return_value="Code"),
+            patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=["Design", "Review"]),
+            pytest.raises(RuntimeError, match="review crashed"),
+        ):
+            await manager.run("make a game", run_id="run-1", mode="fast")
+        assert manager.last_run_id == "run-1"
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto") as mock_run,
+            patch("agentic_crew.core.manager.run_crew_auto_async", return_value="Review") as mock_run_async,
+        ):
+            assert await manager.resume("run-1") == "Review (fast)"
+
+        mock_run.assert_not_called()
+        assert [call.args[0]["name"] for call in mock_run_async.call_args_list] == ["r"]
+
+    @pytest.mark.asyncio
+    async def test_finished_run_returns_recorded_output(self, tmp_path):
+        """Resuming a finished run does not delegate at all."""
+        manager = self._manager(tmp_path)
+        manager.attempts = 1
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto", return_value="Code"),
+            patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=["Design", "Review"]),
+        ):
+            assert await manager.run("make a game", mode="fast") == "Review (fast)"
+
+        with patch("agentic_crew.core.manager.run_crew_auto_async") as mock_run_async:
+            assert await manager.resume(manager.last_run_id) == "Review (fast)"
+        mock_run_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_run(self, tmp_path):
+        """Resuming a run that never started raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await self._manager(tmp_path).resume("missing")
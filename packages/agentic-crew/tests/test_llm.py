@@ -0,0 +1,107 @@
+"""Tests for LLM configuration and the shared LLM client pool."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agentic_crew.config import llm
+
+
+@pytest.fixture
+def mock_llm_class():
+    """Replace crewai.LLM with a mock that returns a new client per call."""
+    with patch.object(llm, "LLM", side_effect=lambda **kwargs: MagicMock(**{"kwargs": kwargs})) as mock:
+        yield mock
+
+
+class TestLLMPool:
+    """Tests for pooled LLM clients."""
+
+    def test_same_settings_share_a_client(self, mock_llm_class) -> None:
+        """Agents asking for the same model and temperature get one client."""
+        first = llm.get_llm("claude-sonnet-4-20250514", temperature=0.2)
+        second = llm.get_llm("claude-sonnet-4-20250514", temperature=0.2)
+
+        assert first is second
+        mock_llm_class.assert_called_once_with(
+            model="claude-sonnet-4-20250514", api_key="sk-ant-test-mock-key", temperature=0.2
+        )
+        assert llm.llm_pool_info()["size"] == 1
+
+    def test_different_settings_get_different_clients(self, mock_llm_class, monkeypatch) -> None:
+        """Model, temperature, provider and API key are all part of the key."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-test")
+        clients = [
+            llm.get_llm("claude-sonnet-4-20250514", temperature=0.2),
+            llm.get_llm("claude-sonnet-4-20250514", temperature=0.8),
+            llm.get_llm("claude-opus-4-20250514", temperature=0.2),
+            llm.get_llm("claude-sonnet-4-20250514", temperature=0.2, provider=llm.LLMProvider.OPENROUTER),
+        ]
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-rotated")
+        clients.append(llm.get_llm("claude-sonnet-4-20250514", temperature=0.2))
+
+        assert len({id(client) for client in clients}) == 5
+        assert clients[3].kwargs["base_url"] == "https://openrouter.ai/api/v1"
+
+    def test_close_llm_pool_closes_clients(self, mock_llm_class) -> None:
+        """close_llm_pool() closes every client and later calls create new ones."""
+        first = llm.get_llm()
+
+        llm.close_llm_pool()
+
+        first.close.assert_called_once()
+        assert llm.get_llm() is not first
+        assert mock_llm_class.call_count == 2
+
+    def test_pool_is_bounded(self, mock_llm_class, monkeypatch) -> None:
+        """The least recently used client is dropped when the pool is full."""
+        monkeypatch.setattr(llm, "_llm_pool", llm.LRUCache(2))
+
+        first = llm.get_llm(temperature=0.1)
+        llm.get_llm(temperature=0.2)
+        llm.get_llm(temperature=0.3)
+
+        assert llm.llm_pool_info()["size"] == 2
+        assert llm.get_llm(temperature=0.1) is not first
+
+
+class TestPromptCache:
+    """Tests for prompt caching options."""
+
+    def test_cacheable_prompt(self, monkeypatch) -> None:
+        """System prompts become a cached text block unless caching is disabled."""
+        assert llm.cacheable_prompt("You are a writer.") == [
+            {"type": "text", "text": "You are a writer.", "cache_control": {"type": "ephemeral"}}
+        ]
+
+        monkeypatch.setenv("AGENTIC_CREW_NO_PROMPT_CACHE", "1")
+
+        assert llm.cacheable_prompt("You are a writer.") == "You are a writer."
+
+    def test_openrouter_llm_injects_cache_breakpoint(self, mock_llm_class, monkeypatch) -> None:
+        """OpenRouter (LiteLLM) clients add a breakpoint after the system message."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-test")
+
+        cached = llm.get_llm(provider=llm.LLMProvider.OPENROUTER)
+        monkeypatch.setenv("AGENTIC_CREW_NO_PROMPT_CACHE", "1")
+        uncached = llm.get_llm(provider=llm.LLMProvider.OPENROUTER)
+
+        assert cached.kwargs["cache_control_injection_points"] == [{"location": "message", "role": "system"}]
+        assert "cache_control_injection_points" not in uncached.kwargs
+
+
+class TestResolveLLM:
+    """Tests for the provider choice shared by get_llm and result keys."""
+
+    def test_prefers_anthropic_then_openrouter(self, monkeypatch) -> None:
+        """Claude models go to Anthropic when its key is set, otherwise to OpenRouter."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-test")
+        assert llm.resolve_llm("claude-sonnet-4-20250514") == (llm.LLMProvider.ANTHROPIC, "claude-sonnet-4-20250514")
+        assert llm.resolve_llm("openrouter/x") == (llm.LLMProvider.OPENROUTER, "openrouter/x")
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY")
+        assert llm.resolve_llm("claude-sonnet-4-20250514") == (llm.LLMProvider.OPENROUTER, "openrouter/auto")
+
+        monkeypatch.delenv("OPENROUTER_API_KEY")
+        assert llm.resolve_llm() is None
@@ -137,25 +137,42 @@ class TestManagerAgent:
 
         with (
             patch("agentic_crew.core.manager.discover_packages") as mock_discover,
+            patch("agentic_crew.core.manager.index_crews") as mock_index,
             patch("agentic_crew.core.manager.get_crew_config") as mock_get_config,
             patch("agentic_crew.core.manager.run_crew_auto") as mock_run,
         ):
             mock_discover.return_value = mock_packages
-
-            # First package doesn't have the crew
-            def get_config_side_effect(pkg_dir, crew_name):
-                if pkg_dir == Path("/pkg1/.crewai"):
-                    raise ValueError("Crew not found")
-                return mock_config
-
-            mock_get_config.side_effect = get_config_side_effect
+            mock_index.return_value = {"game_design": ["pkg2"], "other": ["pkg1"]}
+            mock_get_config.return_value = mock_config
             mock_run.return_value = "Success"
 
             result = manager.delegate("design", "test task")
+            manager.delegate("design", "another task")
 
             assert result == "Success"
-            # Should have tried pkg1 (failed), then found in pkg2 (config is cached)
-            assert mock_get_config.call_count == 2
+            # Resolved through the index: only the owning package is loaded
+            mock_get_config.assert_called_once_with(Path("/pkg2/.crewai"), "game_design")
+            mock_index.assert_called_once_with(mock_packages)
+
+    def test_delegate_ambiguous_crew_raises_error(self):
+        """A crew name defined by several packages must be qualified."""
+        manager = ManagerAgent(crews={"design": "game_design", "pinned": "pkg2:game_design"})
+
+        mock_packages = {"pkg1": Path("/pkg1/.crewai"), "pkg2": Path("/pkg2/.crewai")}
+
+        with (
+            patch("agentic_crew.core.manager.discover_packages", return_value=mock_packages),
+            patch("agentic_crew.core.manager.index_crews", return_value={"game_design": ["pkg1", "pkg2"]}),
+            patch("agentic_crew.core.manager.get_crew_config") as mock_get_config,
+            patch("agentic_crew.core.manager.run_crew_auto", return_value="Success"),
+        ):
+            mock_get_config.return_value = {"name": "game_design", "agents": {}, "tasks": {}}
+
+            with pytest.raises(ValueError, match=r"defined in several packages: \['pkg1', 'pkg2'\]"):
+                manager.delegate("design", "test task")
+            assert manager.delegate("pinned", "test task") == "Success"
+
+            mock_get_config.assert_called_once_with(Path("/pkg2/.crewai"), "game_design")
 
     def test_delegate_crew_not_found_raises_error(self):
         """Test that crew not found in any package raises ValueError."""
@@ -187,7 +204,7 @@ class TestManagerAgent:
         with (
             patch("agentic_crew.core.manager.discover_packages") as mock_discover,
             patch("agentic_crew.core.manager.get_crew_config") as mock_get_config,
-            patch("agentic_crew.core.manager.run_crew_auto") as mock_run,
+            patch("agentic_crew.core.manager.run_crew_auto_async") as mock_run,
         ):
             mock_discover.return_value = mock_packages
             mock_get_config.return_value = mock_config
@@ -210,7 +227,7 @@ class TestManagerAgent:
         with (
             patch("agentic_crew.core.manager.discover_packages") as mock_discover,
             patch("agentic_crew.core.manager.get_crew_config") as mock_get_config,
-            patch("agentic_crew.core.manager.run_crew_auto") as mock_run,
+            patch("agentic_crew.core.manager.run_crew_auto_async") as mock_run,
         ):
             mock_discover.return_value = mock_packages
 
@@ -337,7 +354,7 @@ class TestManagerAgentSubclass:
         with (
             patch("agentic_crew.core.manager.discover_packages") as mock_discover,
             patch("agentic_crew.core.manager.get_crew_config") as mock_get_config,
-            patch("agentic_crew.core.manager.run_crew_auto") as mock_run,
+            patch("agentic_crew.core.manager.run_crew_auto_async") as mock_run,
         ):
             mock_discover.return_value = mock_packages
             mock_get_config.return_value = mock_config
@@ -382,7 +399,7 @@ class TestManagerAgentSubclass:
         with (
             patch("agentic_crew.core.manager.discover_packages") as mock_discover,
             patch("agentic_crew.core.manager.get_crew_config") as mock_get_config,
-            patch("agentic_crew.core.manager.run_crew_auto") as mock_run,
+            patch("agentic_crew.core.manager.run_crew_auto_async") as mock_run,
         ):
             mock_discover.return_value = mock_packages
             mock_get_config.return_value = mock_config
@@ -392,3 +409,306 @@ class TestManagerAgentSubclass:
 
             assert result == "QA passed"
             assert mock_run.call_count == 3
+
+
+class TestManagerConcurrency:
+    """Tests for the manager-owned executor, role limits and metrics."""
+
+    def _manager(self, **kwargs) -> ManagerAgent:
+        manager = ManagerAgent(crews={"design": "game_design", "qa": "qa_crew"}, **kwargs)
+        manager._crew_config_cache = {
+            "game_design": {"name": "game_design", "agents": {}, "tasks": {}},
+            "qa_crew": {"name": "qa_crew", "agents": {}, "tasks": {}},
+        }
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_role_limit_queues_delegations(self):
+        """Delegations beyond a role's limit wait; stats report the queue depth."""
+        manager = self._manager(role_limits={"design": 2})
+        running = peak = 0
+
+        async def run(config, inputs, framework=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        with patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=run):
+            await manager.delegate_parallel([("design", f"t{i}") for i in range(6)] + [("qa", "check")])
+
+        assert peak == 3  # two design crews plus the unlimited qa crew
+        design = manager.stats()["roles"]["design"]
+        assert design["completed"] == 6
+        assert design["queued"] == 0
+        assert design["max_queued"] >= 4
+        assert manager.stats()["roles"]["qa"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted(self):
+        """Failed delegations release their slot and count as failed."""
+        manager = self._manager(role_limits={"design": 1})
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            await manager.delegate_async("design", "t")
+
+        with patch("agentic_crew.core.manager.run_crew_auto_async", return_value="ok"):
+            assert await manager.delegate_async("design", "t") == "ok"
+        assert manager.stats()["roles"]["design"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_thread_bound_runs_use_manager_executor(self):
+        """Runners without native async run in the manager's threads."""
+        import threading
+
+        manager = self._manager(max_workers=2)
+        threads = []
+
+        with patch("agentic_crew.core.decomposer.get_runner") as mock_get_runner:
+            runner = mock_get_runner.return_value
+            runner.reusable_crews = True
+
+            def run(crew, inputs):
+                threads.append(threading.current_thread().name)
+                return "ok"
+
+            runner.run.side_effect = run
+            from agentic_crew.runners.base import BaseRunner
+
+            runner.arun = lambda crew, inputs: BaseRunner.arun(runner, crew, inputs)
+            await manager.delegate_async("design", "t", framework="crewai")
+
+        assert threads[0].startswith("agentic-crew-manager")
+        assert manager.stats()["executor"]["max_workers"] == 2
+        manager.close()
+
+    @pytest.mark.asyncio
+    async def test_crewai_runs_use_manager_executor(self, crew_mocker):
+        """CrewAI kickoffs run in the manager's bounded threads, not the loop's default pool."""
+        import threading
+
+        crew_mocker.mock_crewai()
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        manager = self._manager(max_workers=1)
+        threads = []
+        crew = crew_mocker.MagicMock()
+        crew.kickoff.side_effect = lambda inputs: threads.append(threading.current_thread().name) or "ok"
+        runner = CrewAIRunner()
+        runner.build_crew = lambda config: crew
+
+        with patch("agentic_crew.core.decomposer.get_runner", return_value=runner):
+            outputs = await manager.delegate_parallel([("design", "a"), ("design", "b")], framework="crewai")
+
+        assert outputs == ["ok", "ok"]
+        assert len(threads) == 2
+        assert all(name.startswith("agentic-crew-manager") for name in threads)
+        manager.close()
+
+    def test_invalid_limits(self):
+        """Executor size and role limits must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            ManagerAgent(crews={}, max_workers=0)
+        with pytest.raises(ValueError, match="role 'design'"):
+            ManagerAgent(crews={}, role_limits={"design": 0})
+
+    def test_close_shuts_down_executor(self):
+        """close() shuts the pool down; the manager can be used as a context manager."""
+        with self._manager() as manager:
+            executor = manager.executor
+        assert manager._executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+class TestManagerTimeouts:
+    """Tests for delegation deadlines and cancellation."""
+
+    def _manager(self, **kwargs) -> ManagerAgent:
+        manager = ManagerAgent(crews={"design": "game_design", "qa": "qa_crew"}, **kwargs)
+        manager._crew_config_cache = {
+            "game_design": {"name": "game_design", "agents": {}, "tasks": {}},
+            "qa_crew": {"name": "qa_crew", "agents": {}, "tasks": {}},
+        }
+        return manager
+
+    @staticmethod
+    def _runs(cancelled: list[str]):
+        """Fake crew runs: qa finishes at once, design hangs until cancelled."""
+
+        async def run(config, inputs, framework=None):
+            if config["name"] == "qa_crew":
+                return "QA"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(config["name"])
+                raise
+            return "Design"
+
+        return run
+
+    @pytest.mark.asyncio
+    async def test_delegation_timeout_cancels_the_run(self):
+        """A delegation past its timeout is cancelled and raises DeadlineExceeded."""
+        from agentic_crew.runners.base import DeadlineExceeded
+
+        manager = self._manager(delegation_timeout=0.05)
+        cancelled: list[str] = []
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=self._runs(cancelled)),
+            pytest.raises(DeadlineExceeded, match="Delegation to 'design' timed out"),
+        ):
+            await manager.delegate_async("design", "t")
+
+        assert cancelled == ["game_design"]
+        assert manager.stats()["roles"]["design"]["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_propagates_to_the_run(self):
+        """Crew runs see the delegation's deadline through remaining_time()."""
+        from agentic_crew.runners.base import remaining_time, use_deadline
+
+        manager = self._manager()
+        seen = []
+
+        async def run(config, inputs, framework=None):
+            seen.append(remaining_time())
+            return "ok"
+
+        with patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=run):
+            await manager.delegate_async("design", "t")
+            await manager.delegate_async("design", "t", timeout=30)
+            with use_deadline(5):
+                await manager.delegate_async("design", "t", timeout=30)
+
+        assert seen[0] is None
+        assert 29 < seen[1] <= 30
+        assert seen[2] <= 5
+
+    @pytest.mark.asyncio
+    async def test_parallel_timeout_returns_partial_results(self):
+        """delegate_parallel cancels stragglers and reports what finished."""
+        from agentic_crew.runners.base import DeadlineExceeded
+
+        manager = self._manager()
+        cancelled: list[str] = []
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=self._runs(cancelled)),
+            pytest.raises(DeadlineExceeded, match="1 of 2 delegations") as exc_info,
+        ):
+            await manager.delegate_parallel([("design", "t"), ("qa", "t")], timeout=0.05)
+
+        assert exc_info.value.partial == [None, "QA"]
+        assert cancelled == ["game_design"]
+
+    @pytest.mark.asyncio
+    async def test_parallel_failure_cancels_siblings(self):
+        """One failed delegation cancels the others instead of leaving them running."""
+        manager = self._manager()
+        cancelled: list[str] = []
+        hang = self._runs(cancelled)
+
+        async def run(config, inputs, framework=None):
+            if config["name"] == "qa_crew":
+                await asyncio.sleep(0.01)
+                raise RuntimeError("qa broke")
+            return await hang(config, inputs, framework)
+
+        with (
+            patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=run),
+            pytest.raises(RuntimeError, match="qa broke"),
+        ):
+            await manager.delegate_parallel([("design", "t"), ("qa", "t")])
+
+        # Siblings are fully cancelled by the time delegate_parallel raises
+        assert cancelled == ["game_design"]
+        assert manager.stats()["roles"]["design"]["running"] == 0
+        assert manager.stats()["roles"]["design"]["cancelled"] == 1
+
+
+class TestManagerResultStore:
+    """Tests for memoized delegations."""
+
+    @pytest.fixture(autouse=True)
+    def detected(self):
+        with patch("agentic_crew.core.manager.detect_framework", return_value="crewai") as mock_detect:
+            yield mock_detect
+
+    def _manager(self) -> ManagerAgent:
+        from agentic_crew.core.result_store import ResultStore
+
+        manager = ManagerAgent(crews={"design": "game_design"}, result_store=ResultStore())
+        manager._crew_config_cache = {"game_design": {"name": "game_design", "agents": {}, "tasks": {}}}
+        return manager
+
+    def test_identical_delegations_run_once(self):
+        """Repeated delegations with equal inputs return the stored result."""
+        manager = self._manager()
+
+        with patch("agentic_crew.core.manager.run_crew_auto", return_value="Design") as mock_run:
+            assert manager.delegate("design", "make it") == "Design"
+            assert manager.delegate("design", {"task": "make it"}) == "Design"
+            manager.delegate("design", "make it", framework="strands")
+            manager.delegate("design", "something else")
+
+        assert mock_run.call_count == 3
+        assert manager.stats()["results"]["hits"] == 1
+
+    def test_results_are_keyed_by_the_framework_that_runs(self, detected):
+        """Auto-detected and explicit runs on one framework share results; a new detection does not."""
+        manager = self._manager()
+
+        with patch("agentic_crew.core.manager.run_crew_auto", return_value="Design") as mock_run:
+            manager.delegate("design", "make it")
+            manager.delegate("design", "make it", framework="crewai")
+            manager.delegate("design", "make it", framework="auto")
+            detected.return_value = "langgraph"
+            manager.delegate("design", "make it")
+
+        assert mock_run.call_count == 2
+        assert manager.stats()["results"]["hits"] == 2
+
+    def test_results_are_keyed_by_the_provider_chosen_from_the_environment(self, monkeypatch):
+        """A result produced through OpenRouter is not served to a run on Anthropic."""
+        manager = self._manager()
+
+        with patch("agentic_crew.core.manager.run_crew_auto", return_value="Design") as mock_run:
+            manager.delegate("design", "make it")
+            monkeypatch.delenv("ANTHROPIC_API_KEY")
+            monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-test")
+            manager.delegate("design", "make it")
+            manager.delegate("design", "make it")
+
+        assert mock_run.call_count == 2
+        assert manager.stats()["results"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_delegations_share_the_store(self):
+        """delegate_async reads results stored by delegate and vice versa."""
+        manager = self._manager()
+
+        with patch("agentic_crew.core.manager.run_crew_auto", return_value="Design"):
+            manager.delegate("design", "make it")
+        with patch("agentic_crew.core.manager.run_crew_auto_async") as mock_run:
+            assert await manager.delegate_async("design", "make it") == "Design"
+        mock_run.assert_not_called()
+
+    def test_results_are_not_stored_without_store(self):
+        """Memoization is opt-in."""
+        manager = ManagerAgent(crews={"design": "game_design"})
+        manager._crew_config_cache = {"game_design": {"name": "game_design", "agents": {}, "tasks": {}}}
+
+        with patch("agentic_crew.core.manager.run_crew_auto", return_value="Design") as mock_run:
+            manager.delegate("design", "make it")
+            manager.delegate("design", "make it")
+
+        assert mock_run.call_count == 2
+        assert "results" not in manager.stats()
@@ -0,0 +1,205 @@
+"""Tests for the process-pool crew backend."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+from agentic_crew.core.decomposer import run_crew_batch
+from agentic_crew.core.manager import ManagerAgent
+from agentic_crew.core.process_pool import CrewProcessPool, WorkerCrashedError
+from agentic_crew.runners.base import BaseRunner, DeadlineExceeded, use_deadline
+
+CONFIG = {"name": "echo", "agents": {}, "tasks": {}}
+
+
+class _EchoRunner(BaseRunner):
+    """Runner used inside the worker processes, driven by an "action" input."""
+
+    framework_name = "crewai"
+
+    def build_crew(self, crew_config):
+        return crew_config["name"]
+
+    def run(self, crew, inputs):
+        action = inputs.get("action")
+        if action == "crash":
+            os._exit(3)
+        if action == "fail":
+            raise ValueError("bad input")
+        if action == "sleep":
+            time.sleep(30)
+        return f"{crew}:{inputs.get('task')}:{os.getpid()}"
+
+    def build_agent(self, agent_config, tools=None):
+        return agent_config
+
+    def build_task(self, task_config, agent):
+        return task_config
+
+
+def _use_echo_runner() -> None:
+    """Worker initializer: run every crew with _EchoRunner."""
+    import agentic_crew.core.decomposer as decomposer
+
+    decomposer.get_runner = lambda framework=None: _EchoRunner()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with CrewProcessPool(max_workers=2, frameworks=[], initializer=_use_echo_runner) as pool:
+        yield pool
+
+
+def _pid(output: str) -> int:
+    return int(output.rsplit(":", 1)[1])
+
+
+class TestCrewProcessPool:
+    """Tests for CrewProcessPool."""
+
+    def test_runs_crews_in_worker_processes(self, pool):
+        """Outputs come back intact from another process."""
+        output = pool.run(CONFIG, {"task": "héllo ✓"}, framework="crewai")
+
+        assert output.startswith("echo:héllo ✓:")
+        assert _pid(output) != os.getpid()
+        assert pool.stats()["workers"] == 2
+
+    def test_crew_errors_are_reported(self, pool):
+        """An exception in the crew fails the run but keeps the worker."""
+        with pytest.raises(RuntimeError, match="ValueError: bad input"):
+            pool.run(CONFIG, {"action": "fail"}, framework="crewai")
+
+        assert pool.run(CONFIG, {"task": "t"}, framework="crewai").startswith("echo:t:")
+
+    def test_crash_fails_only_its_run(self, pool):
+        """A dying worker raises WorkerCrashedError and is replaced."""
+        crashed = pool.stats()["crashed"]
+
+        with pytest.raises(WorkerCrashedError, match="exit code 3"):
+            pool.run(CONFIG, {"action": "crash"}, framework="crewai")
+
+        assert pool.run(CONFIG, {"task": "t"}, framework="crewai").startswith("echo:t:")
+        assert pool.stats()["crashed"] == crashed + 1
+        assert pool.stats()["workers"] == 2
+
+    def test_deadline_kills_busy_worker(self, pool):
+        """A run still going at the deadline is stopped."""
+        started = time.monotonic()
+
+        with use_deadline(0.5), pytest.raises(DeadlineExceeded):
+            pool.run(CONFIG, {"action": "sleep"}, framework="crewai")
+
+        assert time.monotonic() - started < 10
+        assert pool.run(CONFIG, {"task": "t"}, framework="crewai").startswith("echo:t:")
+
+    @pytest.mark.asyncio
+    async def test_cancelling_arun_kills_the_worker(self, pool):
+        """Cancellation reaches the worker process running the crew."""
+        started = time.monotonic()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.arun(CONFIG, {"action": "sleep"}, framework="crewai"), 0.5)
+
+        assert time.monotonic() - started < 10
+        assert (await pool.arun(CONFIG, {"task": "t"}, framework="crewai")).startswith("echo:t:")
+
+    @pytest.mark.asyncio
+    async def test_manager_delegates_to_the_pool(self, pool):
+        """ManagerAgent runs its crews in the pool when given one."""
+        manager = ManagerAgent(crews={"echo": "echo"}, process_pool=pool)
+        manager._crew_config_cache = {"echo": CONFIG}
+
+        outputs = await manager.delegate_parallel([("echo", "a"), ("echo", "b")], framework="crewai")
+
+        assert [output.split(":")[1] for output in outputs] == ["a", "b"]
+        assert all(_pid(output) != os.getpid() for output in outputs)
+        assert manager.delegate("echo", "c", framework="crewai").startswith("echo:c:")
+        assert "processes" in manager.stats()
+
+    def test_batch_crash_fails_only_its_input(self, pool):
+        """run_crew_batch with a pool isolates a crashing input."""
+        inputs = [{"task": "a"}, {"action": "crash"}, {"task": "c"}]
+
+        results = sorted(
+            run_crew_batch(CONFIG, inputs, concurrency=2, framework="crewai", pool=pool), key=lambda r: r.index
+        )
+
+        assert [result.success for result in results] == [True, False, True]
+        assert "exit code 3" in results[1].error
+
+    def test_closed_pool_rejects_runs(self):
+        """A closed pool cannot be used."""
+        pool = CrewProcessPool(max_workers=1, frameworks=[])
+        pool.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.run(CONFIG, {}, framework="crewai")
+
+    def test_close_wakes_runs_waiting_for_a_worker(self):
+        """Runs queued for a busy worker fail with a clear error when the pool closes."""
+        import threading
+
+        pool = CrewProcessPool(max_workers=1, frameworks=[], initializer=_use_echo_runner)
+        pool.start()
+        errors: dict[str, BaseException] = {}
+
+        def run(name: str, inputs: dict) -> None:
+            try:
+                pool.run(CONFIG, inputs, framework="crewai")
+            except Exception as e:
+                errors[name] = e
+
+        busy = threading.Thread(target=run, args=("busy", {"action": "sleep"}))
+        busy.start()
+        while pool.stats()["idle"]:
+            time.sleep(0.01)
+        waiting = threading.Thread(target=run, args=("waiting", {"task": "t"}))
+        waiting.start()
+        time.sleep(0.1)
+
+        pool.close()
+        busy.join(10)
+        waiting.join(10)
+
+        assert not waiting.is_alive()
+        assert isinstance(errors["waiting"], RuntimeError)
+        assert "closed" in str(errors["waiting"])
+        assert isinstance(errors["busy"], WorkerCrashedError)
+
+    def test_cancelled_job_raises_a_regular_exception(self, pool):
+        """Only arun turns a cancelled job into asyncio.CancelledError."""
+        from agentic_crew.core.process_pool import _Job
+
+        job = _Job()
+        job.cancel()
+
+        with pytest.raises(RuntimeError, match="cancelled"):
+            pool._run(job, CONFIG, {}, "crewai")
+
+    def test_deadline_bounds_the_wait_for_a_worker(self):
+        """A run under a deadline does not wait past it for a busy pool."""
+        import threading
+
+        pool = CrewProcessPool(max_workers=1, frameworks=[], initializer=_use_echo_runner)
+        pool.start()
+
+        def occupy() -> None:
+            with pytest.raises(WorkerCrashedError):
+                pool.run(CONFIG, {"action": "sleep"}, framework="crewai")
+
+        busy = threading.Thread(target=occupy)
+        busy.start()
+        while pool.stats()["idle"]:
+            time.sleep(0.01)
+        started = time.monotonic()
+
+        with use_deadline(0.2), pytest.raises(DeadlineExceeded, match="waiting for a worker"):
+            pool.run(CONFIG, {"task": "t"}, framework="crewai")
+
+        assert time.monotonic() - started < 5
+        pool.close()
+        busy.join(10)
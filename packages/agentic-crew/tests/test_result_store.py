@@ -0,0 +1,58 @@
+"""Tests for the delegation result store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from agentic_crew.core.result_store import ResultStore
+
+
+class TestResultStore:
+    """Tests for ResultStore."""
+
+    def test_key_depends_on_fingerprint_and_inputs(self) -> None:
+        """Keys are stable for equal inputs regardless of dict order."""
+        assert ResultStore.key("f", {"a": 1, "b": 2}) == ResultStore.key("f", {"b": 2, "a": 1})
+        assert ResultStore.key("f", {"a": 1}) != ResultStore.key("f", {"a": 2})
+        assert ResultStore.key("f", {"a": 1}) != ResultStore.key("g", {"a": 1})
+
+    def test_memory_then_disk(self, isolated_cache_dir: Path) -> None:
+        """Results survive a new store instance through the on-disk layer."""
+        ResultStore().put("ab12", "output")
+
+        store = ResultStore()
+        assert store.get("ab12") == "output"
+        assert store.get("ab12") == "output"
+        assert store.get("missing") is None
+        assert store.stats() == {"hits": 2, "misses": 1, "disk_hits": 1, "stores": 0, "memory_size": 1}
+        assert (isolated_cache_dir / "results" / "ab" / "ab12.json").exists()
+
+    def test_expired_results_are_removed(self, isolated_cache_dir: Path) -> None:
+        """Entries older than the TTL are misses and are deleted."""
+        store = ResultStore(ttl=60)
+        with patch("agentic_crew.core.result_store.time.time", return_value=1000.0):
+            store.put("ab12", "old")
+        with patch("agentic_crew.core.result_store.time.time", return_value=1061.0):
+            assert store.get("ab12") is None
+        assert not (isolated_cache_dir / "results" / "ab" / "ab12.json").exists()
+
+    def test_memory_only_when_disk_cache_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """AGENTIC_CREW_NO_CACHE keeps results in memory only."""
+        monkeypatch.setenv("AGENTIC_CREW_NO_CACHE", "1")
+        store = ResultStore()
+        store.put("ab12", "output")
+
+        assert store.directory is None
+        assert store.get("ab12") == "output"
+        assert ResultStore().get("ab12") is None
+
+    def test_clear(self) -> None:
+        """clear() drops memory and disk entries."""
+        store = ResultStore()
+        store.put("ab12", "output")
+        store.clear()
+
+        assert store.get("ab12") is None
+        assert ResultStore().get("ab12") is None
@@ -8,6 +8,9 @@ from __future__ import annotations
 
 import sys
 from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
+
+import pytest
 
 if TYPE_CHECKING:
     from pytest_agentic_crew.mocking import CrewMocker
@@ -169,6 +172,99 @@ class TestCrewAIRunner:
 
         assert result == "Direct string result"
 
+    @pytest.mark.asyncio
+    async def test_arun_runs_kickoff_in_run_executor(self, crew_mocker: CrewMocker) -> None:
+        """Test that arun runs kickoff in the current run executor, not the loop's default one."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        crew_mocker.mock_crewai()
+
+        from agentic_crew.runners.base import use_executor
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        runner = CrewAIRunner()
+        threads = []
+        mock_crew = crew_mocker.MagicMock()
+        mock_crew.kickoff.side_effect = lambda inputs: (
+            threads.append(threading.current_thread().name) or (crew_mocker.MagicMock(raw="Async output"))
+        )
+
+        with ThreadPoolExecutor(1, thread_name_prefix="bounded") as executor, use_executor(executor):
+            result = await runner.arun(mock_crew, {"input": "test input"})
+
+        mock_crew.kickoff.assert_called_once_with(inputs={"input": "test input"})
+        mock_crew.kickoff_async.assert_not_called()
+        assert threads[0].startswith("bounded")
+        assert result == "Async output"
+
+    def test_run_stops_at_next_step_after_deadline(self, crew_mocker: CrewMocker) -> None:
+        """Past the deadline the next step stops the run, even through CrewAI's task retries."""
+        import contextlib
+        import time
+
+        crew_mocker.mock_crewai()
+
+        from agentic_crew.runners.base import DeadlineExceeded, use_deadline
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        runner = CrewAIRunner()
+        steps = []
+        mock_crew = crew_mocker.MagicMock()
+        step_callback = mock_crew.step_callback
+
+        def kickoff(inputs):
+            for step in range(3):
+                # CrewAI retries tasks that raise
+                with contextlib.suppress(Exception):
+                    mock_crew.step_callback(step)
+                steps.append(step)
+                time.sleep(0.06)
+
+        mock_crew.kickoff.side_effect = kickoff
+
+        with use_deadline(0.1), pytest.raises(DeadlineExceeded):
+            runner.run(mock_crew, {})
+
+        assert steps == [0, 1]
+        assert step_callback.call_count == 2
+        assert mock_crew.step_callback is step_callback
+
+    @pytest.mark.asyncio
+    async def test_cancelled_arun_stops_the_crew(self, crew_mocker: CrewMocker) -> None:
+        """A cancelled arun stops its kickoff thread at the next step or task."""
+        import asyncio
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        crew_mocker.mock_crewai()
+
+        from agentic_crew.runners.base import use_executor
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        runner = CrewAIRunner()
+        started, release = threading.Event(), threading.Event()
+        finished = []
+        mock_crew = crew_mocker.MagicMock()
+
+        def kickoff(inputs):
+            started.set()
+            release.wait(5)
+            mock_crew.task_callback("first task")
+            finished.append("second task")
+
+        mock_crew.kickoff.side_effect = kickoff
+
+        with ThreadPoolExecutor(1) as executor, use_executor(executor):
+            run = asyncio.ensure_future(runner.arun(mock_crew, {}))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            run.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await run
+            release.set()
+
+        assert finished == []
+
     def test_handles_knowledge_sources(self, crew_mocker: CrewMocker, tmp_path) -> None:
         """Test that knowledge sources are loaded from paths."""
         crew_mocker.mock_crewai()
@@ -243,6 +339,94 @@ class TestCrewAIRunner:
         assert "context" in second_task_kwargs
         assert second_task_kwargs["context"] == [mock_task1]
 
+    def _build_tasks(self, crew_mocker: CrewMocker, tasks: dict, **crew_extra: Any) -> dict[str, dict]:
+        """Build a crew and return the Task kwargs by task name, in build order."""
+        crew_mocker.mock_crewai()
+
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        crew_mocker.patch_crewai_crew()
+        crew_mocker.patch_crewai_agent()
+        MockTask = crew_mocker.patch_crewai_task()
+        crew_mocker.patch_crewai_process()
+        crew_mocker.patch_get_llm()
+
+        agents = {"agent1": {"role": "Agent", "goal": "Goal", "backstory": "Story"}}
+        tasks = {name: {"description": name, "agent": "agent1", **cfg} for name, cfg in tasks.items()}
+        CrewAIRunner().build_crew({"agents": agents, "tasks": tasks, "knowledge_paths": [], **crew_extra})
+
+        return {call.kwargs["name"]: call.kwargs for call in MockTask.call_args_list}
+
+    def test_independent_tasks_run_async(self, crew_mocker: CrewMocker) -> None:
+        """Tasks with no dependencies between them get async_execution."""
+        built = self._build_tasks(
+            crew_mocker,
+            {
+                "research": {"context": []},
+                "analysis": {"context": []},
+                "report": {"context": ["research", "analysis"]},
+            },
+        )
+
+        assert list(built) == ["research", "analysis", "report"]
+        assert built["research"].get("async_execution") is True
+        assert built["analysis"].get("async_execution") is True
+        assert "async_execution" not in built["report"]
+
+    def test_async_levels_are_separated_by_sync_barrier(self, crew_mocker: CrewMocker) -> None:
+        """A level following async tasks starts with a sync task; the crew ends sync."""
+        built = self._build_tasks(
+            crew_mocker,
+            {
+                "a": {"context": []},
+                "b": {"context": []},
+                "c": {"context": ["a"]},
+                "d": {"context": ["b"]},
+                "e": {"context": ["a"]},
+            },
+        )
+
+        assert {name for name, kwargs in built.items() if kwargs.get("async_execution")} == {"a", "b", "d"}
+
+    def test_declared_empty_context_is_passed_to_crewai(self, crew_mocker: CrewMocker) -> None:
+        """context: [] reaches CrewAI as an empty list; a missing context key is left out."""
+        built = self._build_tasks(crew_mocker, {"a": {}, "b": {"context": []}, "c": {"context": ["a"]}})
+
+        assert "context" not in built["a"]
+        assert built["b"]["context"] == []
+        assert len(built["c"]["context"]) == 1
+
+    def test_forward_context_reference_is_resolved(self, crew_mocker: CrewMocker) -> None:
+        """Context may name a task defined later in the file."""
+        built = self._build_tasks(crew_mocker, {"summary": {"context": ["notes"]}, "notes": {"context": []}})
+
+        assert list(built) == ["notes", "summary"]
+        assert len(built["summary"]["context"]) == 1
+
+    def test_explicit_async_settings_are_kept(self, crew_mocker: CrewMocker) -> None:
+        """Crews that configure async_execution themselves are left alone."""
+        built = self._build_tasks(
+            crew_mocker,
+            {"a": {"context": [], "async_execution": False}, "b": {"context": []}, "c": {"context": ["a", "b"]}},
+        )
+
+        assert not any(kwargs.get("async_execution") for kwargs in built.values())
+
+    def test_hierarchical_crews_are_not_parallelized(self, crew_mocker: CrewMocker) -> None:
+        """The manager agent schedules hierarchical crews."""
+        built = self._build_tasks(
+            crew_mocker,
+            {"a": {"context": []}, "b": {"context": []}, "c": {"context": ["a", "b"]}},
+            process="hierarchical",
+        )
+
+        assert not any(kwargs.get("async_execution") for kwargs in built.values())
+
+    def test_unknown_context_raises(self, crew_mocker: CrewMocker) -> None:
+        """Context entries naming missing tasks are configuration errors."""
+        with pytest.raises(ValueError, match="unknown task"):
+            self._build_tasks(crew_mocker, {"a": {"context": ["missing"]}})
+
 
 class TestLangGraphRunner:
     """Tests for LangGraph runner implementation."""
@@ -295,6 +479,133 @@ class TestLangGraphRunner:
 
         mock_create.assert_called_once()
 
+    CREW = {
+        "llm": {"model": "claude-sonnet-4-20250514"},
+        "agents": {
+            "researcher": {"role": "Researcher", "goal": "Find facts"},
+            "writer": {"role": "Writer", "llm": "claude-haiku-4-5-20251001"},
+        },
+        "tasks": {
+            "research": {"description": "Research {topic}", "agent": "researcher", "context": []},
+            "outline": {"description": "Outline {topic}", "agent": "writer", "context": []},
+            "report": {
+                "description": "Write it",
+                "expected_output": "A report",
+                "agent": "writer",
+                "context": ["research", "outline"],
+            },
+        },
+    }
+
+    def test_build_crew_compiles_task_graph(self, crew_mocker: CrewMocker) -> None:
+        """Tasks become nodes; independent tasks fan out and joins wait for all deps."""
+        mocks = crew_mocker.mock_langgraph()
+        graph_module = mocks["langgraph.graph"]
+        mock_create = crew_mocker.patch_create_react_agent()
+        MockLLM = crew_mocker.patch_chat_anthropic()
+
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        graph = LangGraphRunner().build_crew(self.CREW)
+
+        builder = graph_module.StateGraph.return_value
+        assert graph is builder.compile.return_value
+        assert [c.args[0] for c in builder.add_node.call_args_list] == ["research", "outline", "report"]
+        edges = [c.args for c in builder.add_edge.call_args_list]
+        assert (graph_module.START, "research") in edges
+        assert (graph_module.START, "outline") in edges
+        assert (["research", "outline"], "report") in edges
+        assert ("report", graph_module.END) in edges
+        # One agent per configured agent, each with its own model
+        assert mock_create.call_count == 2
+        assert [c.kwargs["model"] for c in MockLLM.call_args_list] == [
+            "claude-sonnet-4-20250514",
+            "claude-haiku-4-5-20251001",
+        ]
+
+    def test_compiled_graphs_are_shared_through_built_crew_cache(self, crew_mocker: CrewMocker) -> None:
+        """Identical configs reuse the graph cached by the decomposer, not by the runner."""
+        mocks = crew_mocker.mock_langgraph()
+        crew_mocker.patch_create_react_agent()
+        crew_mocker.patch_chat_anthropic()
+
+        from agentic_crew.core.decomposer import _get_built_crew
+
+        first = _get_built_crew(self.CREW, "langgraph", cache=True)
+
+        assert _get_built_crew(dict(self.CREW), "langgraph", cache=True).crew is first.crew
+        assert mocks["langgraph.graph"].StateGraph.return_value.compile.call_count == 1
+        # The runner itself compiles afresh, e.g. with newly configured credentials
+        first.runner.build_crew(self.CREW)
+        assert mocks["langgraph.graph"].StateGraph.return_value.compile.call_count == 2
+
+    def test_task_node_prompt_includes_inputs_and_dependencies(self, crew_mocker: CrewMocker) -> None:
+        """Nodes fill placeholders from inputs and pass dependency outputs to the agent."""
+        mocks = crew_mocker.mock_langgraph()
+        mock_create = crew_mocker.patch_create_react_agent()
+        crew_mocker.patch_chat_anthropic()
+        agent = mock_create.return_value
+        agent.invoke.return_value = {"messages": [crew_mocker.MagicMock(content="Final report")]}
+
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        LangGraphRunner().build_crew(self.CREW)
+        RunnableLambda = mocks["langchain_core.runnables"].RunnableLambda
+        report = RunnableLambda.call_args_list[2].args[0]
+
+        update = report(
+            {"outputs": {"research": "facts", "outline": "plan"}},
+            {"configurable": {"inputs": {"topic": "otters"}}},
+        )
+
+        system, user = agent.invoke.call_args.args[0]["messages"]
+        assert system == (
+            "system",
+            [{"type": "text", "text": "You are a Writer.", "cache_control": {"type": "ephemeral"}}],
+        )
+        assert "Expected output: A report" in user[1]
+        assert "## Output of research\nfacts" in user[1]
+        assert "## Output of outline\nplan" in user[1]
+        assert update["outputs"] == {"report": "Final report"}
+
+    def test_task_node_prompt_caching_can_be_disabled(self, crew_mocker: CrewMocker, monkeypatch) -> None:
+        """With AGENTIC_CREW_NO_PROMPT_CACHE the system prompt is plain text."""
+        monkeypatch.setenv("AGENTIC_CREW_NO_PROMPT_CACHE", "1")
+        from agentic_crew.runners.langgraph_runner import _TaskNode
+
+        node = _TaskNode("t", {"description": "Do it"}, system_prompt="You are a Writer.", dependencies=())
+
+        assert node.messages({}, None)[0] == ("system", "You are a Writer.")
+
+    @pytest.mark.asyncio
+    async def test_task_node_stops_after_deadline(self, crew_mocker: CrewMocker) -> None:
+        """No task starts once the run's deadline has passed."""
+        crew_mocker.mock_langgraph()
+
+        from agentic_crew.runners.base import DeadlineExceeded, use_deadline
+        from agentic_crew.runners.langgraph_runner import _TaskNode
+
+        agent = crew_mocker.MagicMock()
+        node = _TaskNode("t", {"description": "Do it", "agent": agent}, system_prompt="", dependencies=())
+
+        with use_deadline(0):
+            with pytest.raises(DeadlineExceeded):
+                node.invoke({}, None)
+            with pytest.raises(DeadlineExceeded):
+                await node.ainvoke({}, None)
+
+        agent.invoke.assert_not_called()
+        agent.ainvoke.assert_not_called()
+
+    def test_build_crew_rejects_unknown_agent(self, crew_mocker: CrewMocker) -> None:
+        """Tasks must reference a configured agent."""
+        crew_mocker.mock_langgraph()
+
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        with pytest.raises(ValueError, match="invalid agent"):
+            LangGraphRunner().build_crew({"agents": {}, "tasks": {"t": {"description": "x", "agent": "nobody"}}})
+
     def test_run_invokes_graph(self, crew_mocker: CrewMocker) -> None:
         """Test that run invokes the LangGraph workflow."""
         crew_mocker.mock_langgraph()
@@ -330,6 +641,26 @@ class TestLangGraphRunner:
         assert "messages" in invoke_args
         assert any("test task" in str(msg) for msg in invoke_args["messages"])
 
+    @pytest.mark.asyncio
+    async def test_arun_uses_ainvoke(self, crew_mocker: CrewMocker) -> None:
+        """Test that arun awaits ainvoke with the same messages as run."""
+        crew_mocker.mock_langgraph()
+
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        runner = LangGraphRunner()
+
+        mock_graph = crew_mocker.MagicMock()
+        mock_graph.ainvoke = AsyncMock(return_value={"messages": [crew_mocker.MagicMock(content="Async response")]})
+
+        result = await runner.arun(mock_graph, {"input": "test prompt"})
+
+        mock_graph.ainvoke.assert_awaited_once_with(
+            {"messages": [("user", "test prompt")]}, config={"configurable": {"inputs": {"input": "test prompt"}}}
+        )
+        mock_graph.invoke.assert_not_called()
+        assert result == "Async response"
+
     def test_get_llm_returns_chat_anthropic(self, crew_mocker: CrewMocker) -> None:
         """Test that get_llm returns ChatAnthropic instance."""
         crew_mocker.mock_langgraph()
@@ -343,6 +674,21 @@ class TestLangGraphRunner:
 
         MockLLM.assert_called_once_with(model="claude-sonnet-4-20250514")
 
+    def test_get_llm_reuses_clients(self, crew_mocker: CrewMocker) -> None:
+        """Test that agents using the same model share one ChatAnthropic client."""
+        crew_mocker.mock_langgraph()
+
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        MockLLM = crew_mocker.patch_chat_anthropic()
+
+        first = LangGraphRunner().get_llm("claude-sonnet-4-20250514")
+        second = LangGraphRunner().get_llm("claude-sonnet-4-20250514")
+        LangGraphRunner().get_llm()
+
+        assert first is second
+        assert MockLLM.call_count == 2
+
     def test_get_llm_uses_default_model(self, crew_mocker: CrewMocker) -> None:
         """Test that get_llm uses default model when none specified."""
         crew_mocker.mock_langgraph()
@@ -540,6 +886,24 @@ class TestStrandsRunner:
 
         mock_agent.assert_called_once_with("do something")
 
+    @pytest.mark.asyncio
+    async def test_arun_uses_invoke_async(self, crew_mocker: CrewMocker) -> None:
+        """Test that arun awaits the agent's invoke_async."""
+        crew_mocker.mock_strands()
+
+        from agentic_crew.runners.strands_runner import StrandsRunner
+
+        runner = StrandsRunner()
+
+        mock_agent = crew_mocker.MagicMock()
+        mock_agent.invoke_async = AsyncMock(return_value="Async agent response")
+
+        result = await runner.arun(mock_agent, {"task": "do something"})
+
+        mock_agent.invoke_async.assert_awaited_once_with("do something")
+        mock_agent.assert_not_called()
+        assert result == "Async agent response"
+
     def test_get_model_provider_from_string(self, crew_mocker: CrewMocker) -> None:
         """Test extracting model provider from string config."""
         crew_mocker.mock_strands()
@@ -598,7 +962,50 @@ class TestStrandsRunner:
         MockAgent.assert_called_once()
         call_kwargs = MockAgent.call_args[1]
         assert "system_prompt" in call_kwargs
-        assert call_kwargs["model_id"] == "claude-3-5-sonnet"
+        assert call_kwargs["model"] == "claude-3-5-sonnet"
+
+    def test_prompt_caching_uses_bedrock_model(self, crew_mocker: CrewMocker, monkeypatch) -> None:
+        """Agents on Bedrock models with prompt caching cache their system prompt and tools."""
+        crew_mocker.mock_strands()
+        MockBedrock = crew_mocker.mock_modules(["strands.models"])["strands.models"].BedrockModel
+
+        from agentic_crew.runners.strands_runner import StrandsRunner
+
+        MockAgent = crew_mocker.patch_strands_agent()
+        runner = StrandsRunner()
+
+        runner.build_agent({"role": "Writer", "llm": "us.anthropic.claude-sonnet-4-20250514-v1:0"})
+
+        MockBedrock.assert_called_once_with(
+            model_id="us.anthropic.claude-sonnet-4-20250514-v1:0", cache_prompt="default", cache_tools="default"
+        )
+        assert MockAgent.call_args.kwargs["model"] is MockBedrock.return_value
+
+        runner.build_agent({"role": "Writer", "llm": "claude-3-5-sonnet"})
+        monkeypatch.setenv("AGENTIC_CREW_NO_PROMPT_CACHE", "1")
+        runner.build_agent({"role": "Writer", "llm": "amazon.nova-pro-v1:0"})
+
+        assert MockBedrock.call_count == 1
+        assert [c.kwargs["model"] for c in MockAgent.call_args_list[1:]] == [
+            "claude-3-5-sonnet",
+            "amazon.nova-pro-v1:0",
+        ]
+
+    def test_unconfigured_model_is_left_to_strands(self, crew_mocker: CrewMocker) -> None:
+        """Without a configured model, agents get Strands' default model as before."""
+        crew_mocker.mock_strands()
+        MockBedrock = crew_mocker.mock_modules(["strands.models"])["strands.models"].BedrockModel
+
+        from agentic_crew.runners.strands_runner import StrandsRunner
+
+        MockAgent = crew_mocker.patch_strands_agent()
+        runner = StrandsRunner()
+
+        runner.build_agent({"role": "Writer"})
+        runner.build_crew({"agents": {}, "tasks": {}})
+
+        MockBedrock.assert_not_called()
+        assert all("model" not in c.kwargs for c in MockAgent.call_args_list)
 
     def test_build_task_returns_dict(self, crew_mocker: CrewMocker) -> None:
         """Test that build_task returns task configuration dict."""
@@ -652,6 +1059,193 @@ class TestStrandsRunner:
         assert "Write content" in system_prompt
 
 
+class _FakeStrandsAgent:
+    """Strands agent stand-in that records prompts and reports token usage."""
+
+    def __init__(self, system_prompt: str, tools: list, model: str | None = None):
+        self.system_prompt = system_prompt
+        self.model = model
+        self.prompts: list[str] = []
+        self.spans: list[tuple[float, float]] = []
+        self.active = 0
+        self.peak = 0
+        self.event_loop_metrics = type("Metrics", (), {})()
+        self.event_loop_metrics.accumulated_usage = {
+            "inputTokens": 0,
+            "outputTokens": 0,
+            "totalTokens": 0,
+            "cacheReadInputTokens": 0,
+        }
+
+    async def invoke_async(self, prompt: str) -> str:
+        import asyncio
+        import time
+
+        self.prompts.append(prompt)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        start = time.monotonic()
+        await asyncio.sleep(0.01)
+        self.spans.append((start, time.monotonic()))
+        self.active -= 1
+        usage = self.event_loop_metrics.accumulated_usage
+        usage["inputTokens"] += 10
+        usage["outputTokens"] += 5
+        usage["totalTokens"] += 15
+        usage["cacheReadInputTokens"] += 8
+        return f"{self.system_prompt.split('.')[0]} done"
+
+    async def stream_async(self, prompt: str):
+        result = await self.invoke_async(prompt)
+        yield {"data": result}
+        yield {"result": result}
+
+
+class TestStrandsMultiAgent:
+    """Tests for multi-agent Strands crews."""
+
+    CREW = {
+        "multi_agent": True,
+        "llm": {"model": "claude-sonnet-4-20250514"},
+        "agents": {
+            "researcher": {"role": "Researcher"},
+            "analyst": {"role": "Analyst", "llm": "claude-haiku-4-5-20251001"},
+            "writer": {"role": "Writer"},
+        },
+        "tasks": {
+            "research": {"description": "Research {topic}", "agent": "researcher", "context": []},
+            "analysis": {"description": "Analyze {topic}", "agent": "analyst", "context": []},
+            "report": {"description": "Write", "agent": "writer", "context": ["research", "analysis"]},
+        },
+    }
+
+    def _build(self, crew_mocker: CrewMocker) -> tuple[Any, Any]:
+        crew_mocker.mock_strands()
+
+        from agentic_crew.runners.strands_runner import StrandsRunner
+
+        MockAgent = crew_mocker.patch_strands_agent()
+        MockAgent.side_effect = _FakeStrandsAgent
+        runner = StrandsRunner()
+        return runner, runner.build_crew(self.CREW)
+
+    def test_builds_one_agent_per_configured_agent(self, crew_mocker: CrewMocker) -> None:
+        """Each agent gets its own Strands agent and model."""
+        runner, crew = self._build(crew_mocker)
+
+        from agentic_crew.runners.strands_runner import StrandsCrew
+
+        assert isinstance(crew, StrandsCrew)
+        assert {name: agent.model for name, agent in crew.agents.items()} == {
+            "researcher": "claude-sonnet-4-20250514",
+            "analyst": "claude-haiku-4-5-20251001",
+            "writer": "claude-sonnet-4-20250514",
+        }
+        assert crew.task_agents == {"research": "researcher", "analysis": "analyst", "report": "writer"}
+
+    @pytest.mark.asyncio
+    async def test_arun_orchestrates_tasks(self, crew_mocker: CrewMocker) -> None:
+        """Dependent tasks see their context outputs; usage is tracked per agent."""
+        runner, crew = self._build(crew_mocker)
+
+        result = await runner.arun(crew, {"topic": "otters"})
+
+        assert result == "You are a Writer done"
+        assert crew.agents["researcher"].prompts == ["Research otters"]
+        report_prompt = crew.agents["writer"].prompts[0]
+        assert "## Output of research\nYou are a Researcher done" in report_prompt
+        assert "## Output of analysis\nYou are a Analyst done" in report_prompt
+        assert crew.usage["analyst"] == {
+            "input_tokens": 10,
+            "output_tokens": 5,
+            "total_tokens": 15,
+            "cache_read_tokens": 8,
+            "cache_write_tokens": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_run_inside_running_event_loop(self, crew_mocker: CrewMocker) -> None:
+        """The synchronous run() works when called from a coroutine."""
+        from agentic_crew.runners.base import remaining_time, use_deadline
+
+        runner, crew = self._build(crew_mocker)
+        seen = []
+        invoke_async = crew.agents["writer"].invoke_async
+
+        async def record(prompt: str) -> Any:
+            seen.append(remaining_time())
+            return await invoke_async(prompt)
+
+        crew.agents["writer"].invoke_async = record
+
+        with use_deadline(60):
+            result = runner.run(crew, {"topic": "otters"})
+
+        assert result == "You are a Writer done"
+        # The caller's deadline reaches the tasks run on the private loop
+        assert len(seen) == 1 and 0 < seen[0] <= 60
+
+    def test_independent_tasks_run_concurrently(self, crew_mocker: CrewMocker) -> None:
+        """Tasks without dependencies on each other overlap; same-agent tasks do not."""
+        runner, crew = self._build(crew_mocker)
+        tasks = {**self.CREW["tasks"], "analysis": {**self.CREW["tasks"]["analysis"], "agent": "researcher"}}
+        serial = runner.build_crew({**self.CREW, "tasks": tasks})
+
+        runner.run(crew, {"topic": "otters"})
+        runner.run(serial, {"topic": "otters"})
+
+        (research,) = crew.agents["researcher"].spans
+        (analysis,) = crew.agents["analyst"].spans
+        (report,) = crew.agents["writer"].spans
+        assert analysis[0] < research[1] and research[0] < analysis[1]
+        assert report[0] >= max(research[1], analysis[1])
+        assert serial.agents["researcher"].peak == 1
+        assert len(serial.agents["researcher"].prompts) == 2
+
+    def test_stream_reports_tasks_and_usage(self, crew_mocker: CrewMocker) -> None:
+        """Streams carry task boundaries and end with per-agent usage."""
+        from agentic_crew.runners.events import CrewEvent
+
+        runner, crew = self._build(crew_mocker)
+
+        events = list(runner.stream(crew, {"topic": "otters"}))
+
+        assert events[-1].type == "final"
+        assert events[-1].output == "You are a Writer done"
+        assert set(events[-1].usage) == {"researcher", "analyst", "writer"}
+        assert CrewEvent("task_finished", task="research", output="You are a Researcher done") in events
+        started = [event.task for event in events if event.type == "task_started"]
+        assert started[-1] == "report"
+
+    def test_failed_task_fails_the_run(self, crew_mocker: CrewMocker) -> None:
+        """An agent error propagates and dependent tasks do not run."""
+        runner, crew = self._build(crew_mocker)
+        crew.agents["researcher"].invoke_async = AsyncMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            runner.run(crew, {"topic": "otters"})
+        assert crew.agents["writer"].prompts == []
+
+    def test_no_task_starts_after_deadline(self, crew_mocker: CrewMocker) -> None:
+        """Tasks whose context finishes past the deadline are not run."""
+        import asyncio
+
+        from agentic_crew.runners.base import DeadlineExceeded, use_deadline
+
+        runner, crew = self._build(crew_mocker)
+
+        async def slow_research(prompt: str) -> str:
+            await asyncio.sleep(0.1)
+            return "facts"
+
+        crew.agents["researcher"].invoke_async = slow_research
+
+        with use_deadline(0.05), pytest.raises(DeadlineExceeded):
+            runner.run(crew, {"topic": "otters"})
+        assert crew.agents["analyst"].prompts == ["Analyze otters"]
+        assert crew.agents["writer"].prompts == []
+
+
 class TestBaseRunner:
     """Tests for base runner interface."""
 
@@ -712,6 +1306,30 @@ class TestBaseRunner:
 
         assert result == "result"
 
+    @pytest.mark.asyncio
+    async def test_arun_default_runs_in_thread(self, crew_mocker: CrewMocker) -> None:
+        """Test that runners without a native async API fall back to run()."""
+        import threading
+
+        from agentic_crew.runners.base import BaseRunner
+
+        class TestRunner(BaseRunner):
+            def build_crew(self, crew_config: dict[str, Any]) -> Any:
+                return crew_mocker.MagicMock()
+
+            def run(self, crew: Any, inputs: dict[str, Any]) -> str:
+                return threading.current_thread().name
+
+            def build_agent(self, agent_config: dict[str, Any], tools: list | None = None) -> Any:
+                return crew_mocker.MagicMock()
+
+            def build_task(self, task_config: dict[str, Any], agent: Any) -> Any:
+                return crew_mocker.MagicMock()
+
+        result = await TestRunner().arun(crew_mocker.MagicMock(), {})
+
+        assert result != threading.current_thread().name
+
     def test_get_llm_default_implementation(self, crew_mocker: CrewMocker) -> None:
         """Test that get_llm has a default implementation."""
         mock_get_llm = crew_mocker.patch_get_llm()
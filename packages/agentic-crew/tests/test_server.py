@@ -0,0 +1,188 @@
+"""Tests for the JSON-RPC stdio server."""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from agentic_crew.server import (
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    REQUEST_CANCELLED,
+    StdioServer,
+)
+
+
+def _serve(*requests: dict | str) -> list[dict]:
+    """Run a server over the given request lines and return its messages."""
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in requests]
+    stdout = io.StringIO()
+    StdioServer(io.StringIO("\n".join(lines) + "\n"), stdout).serve()
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def _by_id(messages: list[dict]) -> dict:
+    return {m["id"]: m for m in messages if "id" in m}
+
+
+@pytest.fixture
+def workspace_patches(temp_workspace: Path):
+    """Point the CLI helpers used by the server at the test workspace."""
+    from agentic_crew.core.discovery import discover_packages
+
+    packages = discover_packages(temp_workspace)
+    with (
+        patch("agentic_crew.main.discover_packages", return_value=packages),
+        patch("agentic_crew.core.discovery.discover_packages", return_value=packages),
+        patch("agentic_crew.core.discovery.get_workspace_root", return_value=temp_workspace),
+    ):
+        yield
+
+
+class TestStdioServer:
+    """Tests for request handling."""
+
+    def test_ready_notification_first(self) -> None:
+        """The server announces itself before answering requests."""
+        messages = _serve()
+
+        assert messages[0]["method"] == "ready"
+        assert "version" in messages[0]["params"]
+
+    def test_list_matches_cli_shape(self, workspace_patches) -> None:
+        """list returns the same payload as `list --json`."""
+        result = _by_id(_serve({"jsonrpc": "2.0", "id": 1, "method": "list"}))[1]["result"]
+
+        assert result == {
+            "crews": [
+                {
+                    "package": "otterfall",
+                    "name": "test_crew",
+                    "description": "A test crew",
+                    "required_framework": "crewai",
+                }
+            ]
+        }
+
+    def test_info_matches_cli_shape(self, workspace_patches) -> None:
+        """info returns the same payload as `info --json`."""
+        params = {"package": "otterfall", "crew": "test_crew"}
+        result = _by_id(_serve({"jsonrpc": "2.0", "id": "a", "method": "info", "params": params}))["a"]["result"]
+
+        assert result["name"] == "test_crew"
+        assert result["agents"] == [{"name": "test_agent", "role": "Test Agent"}]
+        assert result["tasks"][0]["name"] == "test_task"
+
+    def test_info_unknown_package_lists_available(self, workspace_patches) -> None:
+        """Unknown packages produce an error carrying the available packages."""
+        params = {"package": "nope", "crew": "test_crew"}
+        error = _by_id(_serve({"jsonrpc": "2.0", "id": 1, "method": "info", "params": params}))[1]["error"]
+
+        assert "not found" in error["message"]
+        assert error["data"]["available_packages"] == ["otterfall"]
+
+    def test_run_returns_cli_result_shape(self, workspace_patches) -> None:
+        """run returns success/output/framework_used/duration_ms like `run --json`."""
+        params = {"package": "otterfall", "crew": "test_crew", "input": "hello"}
+        with patch("agentic_crew.core.decomposer.run_crew_auto", return_value="done") as mock_run:
+            result = _by_id(_serve({"jsonrpc": "2.0", "id": 7, "method": "run", "params": params}))[7]["result"]
+
+        assert result["success"] is True
+        assert result["output"] == "done"
+        assert result["framework_used"] == "crewai"
+        assert isinstance(result["duration_ms"], int)
+        assert mock_run.call_args.kwargs["inputs"]["input"] == "hello"
+
+    def test_run_failure_is_reported_in_result(self, workspace_patches) -> None:
+        """Crew failures keep the CLI's success=false shape."""
+        params = {"package": "otterfall", "crew": "test_crew"}
+        with patch("agentic_crew.core.decomposer.run_crew_auto", side_effect=RuntimeError("boom")):
+            result = _by_id(_serve({"jsonrpc": "2.0", "id": 1, "method": "run", "params": params}))[1]["result"]
+
+        assert result["success"] is False
+        assert result["error"] == "boom"
+
+    def test_protocol_errors(self) -> None:
+        """Malformed lines, unknown methods and bad params get JSON-RPC errors."""
+        messages = _serve(
+            "{not json",
+            {"jsonrpc": "2.0", "id": 1, "method": "explode"},
+            {"jsonrpc": "2.0", "id": 2, "method": "run", "params": {"package": "x"}},
+        )
+
+        assert messages[1]["error"]["code"] == PARSE_ERROR
+        by_id = _by_id(messages)
+        assert by_id[1]["error"]["code"] == METHOD_NOT_FOUND
+        assert by_id[2]["error"]["code"] == INVALID_PARAMS
+
+    def test_cancel_running_run(self, workspace_patches) -> None:
+        """Cancelling a running crew answers it with RequestCancelled, tells it to stop and drops its result."""
+        from agentic_crew.runners.base import cancellation_requested
+
+        started = threading.Event()
+        release = threading.Event()
+        stopped = []
+
+        def slow_run(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            stopped.append(cancellation_requested())
+            return "late"
+
+        stdout = io.StringIO()
+        server = StdioServer(io.StringIO(), stdout)
+        params = {"package": "otterfall", "crew": "test_crew"}
+        with patch("agentic_crew.core.decomposer.run_crew_auto", side_effect=slow_run):
+            server.handle_line(json.dumps({"jsonrpc": "2.0", "id": 1, "method": "run", "params": params}))
+            assert started.wait(5)
+            server.handle_line(json.dumps({"jsonrpc": "2.0", "id": 2, "method": "cancel", "params": {"id": 1}}))
+            release.set()
+            server.serve()
+
+        by_id = _by_id([json.loads(line) for line in stdout.getvalue().splitlines()])
+        assert by_id[2]["result"] == {"cancelled": True}
+        assert by_id[1]["error"]["code"] == REQUEST_CANCELLED
+        assert "late" not in stdout.getvalue()
+        assert stopped == [True]
+
+    def test_cancel_unknown_run(self) -> None:
+        """Cancelling a run that is not pending reports cancelled=false."""
+        result = _by_id(_serve({"jsonrpc": "2.0", "id": 1, "method": "cancel", "params": {"id": 99}}))[1]["result"]
+
+        assert result == {"cancelled": False}
+
+
+class TestServeCommand:
+    """Tests for `agentic-crew serve`."""
+
+    def test_serve_requires_stdio(self) -> None:
+        """serve without a transport is a usage error."""
+        from agentic_crew.main import main
+
+        with patch("sys.argv", ["agentic-crew", "serve"]), pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 2
+
+    def test_serve_stdio_subprocess(self, tmp_path: Path) -> None:
+        """A real server process answers on stdout and exits when stdin closes."""
+        request = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "cancel", "params": {"id": 5}})
+        result = subprocess.run(
+            [sys.executable, "-m", "agentic_crew", "serve", "--stdio"],
+            input=request + "\n",
+            capture_output=True,
+            text=True,
+            cwd=tmp_path,
+            timeout=60,
+            check=True,
+        )
+
+        messages = [json.loads(line) for line in result.stdout.splitlines()]
+        assert messages[0]["method"] == "ready"
+        assert messages[1] == {"jsonrpc": "2.0", "id": 1, "result": {"cancelled": False}}
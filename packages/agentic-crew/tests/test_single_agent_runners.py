@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import subprocess
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from agentic_crew.runners.base import DeadlineExceeded, use_deadline
 from agentic_crew.runners.local_cli_runner import LocalCLIConfig, LocalCLIRunner
 from agentic_crew.runners.single_agent_runner import SingleAgentRunner
 
@@ -412,3 +415,49 @@ profiles:
         assert cmd[0] == "ollama"
         assert cmd[1] == "run"
         assert "codellama" in cmd
+
+
+class TestLocalCLIRunnerDeadlines:
+    """The CLI tool's process is bounded by the current deadline."""
+
+    def _runner(self, timeout: int = 300) -> LocalCLIRunner:
+        return LocalCLIRunner(LocalCLIConfig(command=sys.executable, task_flag="-c", timeout=timeout))
+
+    @patch("subprocess.run")
+    def test_run_uses_the_earlier_of_timeout_and_deadline(self, mock_run: MagicMock):
+        """The subprocess timeout shrinks to the time left before the deadline."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="Output", stderr="")
+        runner = self._runner()
+
+        runner.run("pass")
+        with use_deadline(5):
+            runner.run("pass")
+
+        assert mock_run.call_args_list[0].kwargs["timeout"] == 300
+        assert mock_run.call_args_list[1].kwargs["timeout"] <= 5
+
+    @patch("subprocess.run")
+    def test_run_after_deadline_does_not_start(self, mock_run: MagicMock):
+        """A command is not started once the deadline has passed."""
+        with use_deadline(0), pytest.raises(DeadlineExceeded, match="before the command started"):
+            self._runner().run("pass")
+
+        mock_run.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_arun(self):
+        """arun runs the command in a subprocess and returns its output."""
+        assert await self._runner().arun("print('hello')") == "hello\n"
+
+        with pytest.raises(RuntimeError, match="exit code 3"):
+            await self._runner().arun("raise SystemExit(3)")
+
+    @pytest.mark.asyncio
+    async def test_arun_kills_the_process_at_the_deadline(self):
+        """A command still running at the deadline is killed."""
+        started = time.monotonic()
+
+        with use_deadline(0.2), pytest.raises(DeadlineExceeded, match="timed out"):
+            await self._runner().arun("import time; time.sleep(30)")
+
+        assert time.monotonic() - started < 10
@@ -0,0 +1,390 @@
+"""Tests for streamed crew events (BaseRunner.stream/astream and run --stream)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from agentic_crew.runners.events import CrewEvent, iterate_async
+
+if TYPE_CHECKING:
+    from pytest_agentic_crew.mocking import CrewMocker
+
+
+async def _collect(agen) -> list[CrewEvent]:
+    return [event async for event in agen]
+
+
+class TestCrewEvent:
+    """Tests for the event type and helpers."""
+
+    def test_to_dict_drops_unset_fields(self) -> None:
+        """Only fields that carry data are serialized."""
+        assert CrewEvent("token", task="t", delta="hi").to_dict() == {"type": "token", "task": "t", "delta": "hi"}
+
+    def test_iterate_async(self) -> None:
+        """Async generators can be consumed from synchronous code."""
+
+        async def numbers():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield i
+
+        assert list(iterate_async(numbers())) == [0, 1, 2]
+
+    def test_base_runner_default_yields_final(self) -> None:
+        """Runners without streaming support report only the final output."""
+        from agentic_crew.runners.base import BaseRunner
+
+        class TestRunner(BaseRunner):
+            def build_crew(self, crew_config: dict[str, Any]) -> Any:
+                return None
+
+            def run(self, crew: Any, inputs: dict[str, Any]) -> str:
+                return "done"
+
+            def build_agent(self, agent_config: dict[str, Any], tools: list | None = None) -> Any:
+                return None
+
+            def build_task(self, task_config: dict[str, Any], agent: Any) -> Any:
+                return None
+
+        runner = TestRunner()
+
+        assert list(runner.stream(None, {})) == [CrewEvent("final", output="done")]
+        assert asyncio.run(_collect(runner.astream(None, {}))) == [CrewEvent("final", output="done")]
+
+
+class TestLangGraphStreaming:
+    """LangGraph stream chunks are translated into events."""
+
+    CHUNKS = [
+        ("messages", (SimpleNamespace(type="AIMessageChunk", content="Hel"), {"langgraph_node": "agent"})),
+        (
+            "messages",
+            (
+                SimpleNamespace(type="AIMessageChunk", content=[{"type": "text", "text": "lo"}]),
+                {"langgraph_node": "agent"},
+            ),
+        ),
+        (
+            "updates",
+            {
+                "agent": {
+                    "messages": [
+                        SimpleNamespace(type="ai", content="Hello", tool_calls=[{"name": "search", "args": {"q": "x"}}])
+                    ]
+                }
+            },
+        ),
+        ("messages", (SimpleNamespace(type="tool", content="result"), {"langgraph_node": "tools"})),
+        ("updates", {"tools": {"messages": [SimpleNamespace(type="tool", content="result")]}}),
+        ("values", {"messages": [SimpleNamespace(content="Final answer")]}),
+    ]
+
+    EXPECTED = [
+        CrewEvent("task_started", task="agent"),
+        CrewEvent("token", task="agent", delta="Hel"),
+        CrewEvent("token", task="agent", delta="lo"),
+        CrewEvent("tool_call", task="agent", tool="search", tool_input={"q": "x"}),
+        CrewEvent("task_finished", task="agent", output="Hello"),
+        CrewEvent("task_started", task="tools"),
+        CrewEvent("task_finished", task="tools", output="result"),
+        CrewEvent("final", output="Final answer"),
+    ]
+
+    def test_stream(self, crew_mocker: CrewMocker) -> None:
+        """stream() uses the graph's stream with messages/updates/values modes."""
+        crew_mocker.mock_langgraph()
+        from agentic_crew.runners.langgraph_runner import STREAM_MODES, LangGraphRunner
+
+        graph = MagicMock()
+        graph.stream.return_value = iter(self.CHUNKS)
+
+        events = list(LangGraphRunner().stream(graph, {"input": "hi"}))
+
+        graph.stream.assert_called_once_with(
+            {"messages": [("user", "hi")]},
+            config={"configurable": {"inputs": {"input": "hi"}}},
+            stream_mode=STREAM_MODES,
+        )
+        assert events == self.EXPECTED
+
+    def test_astream(self, crew_mocker: CrewMocker) -> None:
+        """astream() consumes the graph's astream."""
+        crew_mocker.mock_langgraph()
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        async def chunks(*args, **kwargs):
+            for chunk in self.CHUNKS:
+                yield chunk
+
+        graph = MagicMock()
+        graph.astream = chunks
+
+        assert asyncio.run(_collect(LangGraphRunner().astream(graph, {"input": "hi"}))) == self.EXPECTED
+
+    def test_final_reports_usage_per_task(self, crew_mocker: CrewMocker) -> None:
+        """Usage metadata on the final messages, with cache details, is summed per task."""
+        crew_mocker.mock_langgraph()
+        from agentic_crew.runners.langgraph_runner import LangGraphRunner
+
+        def usage(input_tokens: int, cache_read: int, cache_creation: int) -> dict[str, Any]:
+            details = {"cache_read": cache_read, "cache_creation": cache_creation}
+            return {
+                "input_tokens": input_tokens,
+                "output_tokens": 5,
+                "total_tokens": input_tokens + 5,
+                "input_token_details": details,
+            }
+
+        messages = [
+            SimpleNamespace(content="task", name=None),
+            SimpleNamespace(content="notes", name="research", usage_metadata=usage(100, 0, 90)),
+            SimpleNamespace(content="essay", name="write", usage_metadata=usage(120, 90, 0)),
+        ]
+        graph = MagicMock()
+        graph.stream.return_value = iter([("values", {"messages": messages})])
+
+        final = list(LangGraphRunner().stream(graph, {"input": "hi"}))[-1]
+
+        assert final.output == "essay"
+        assert final.usage["write"] == {
+            "input_tokens": 120,
+            "output_tokens": 5,
+            "total_tokens": 125,
+            "cache_read_tokens": 90,
+            "cache_write_tokens": 0,
+        }
+        assert final.usage["research"]["cache_write_tokens"] == 90
+        assert set(final.usage) == {"research", "write"}
+
+
+class TestStrandsStreaming:
+    """Strands stream_async events are translated into events."""
+
+    def test_stream(self, crew_mocker: CrewMocker) -> None:
+        """Text deltas become tokens and completed tool uses become tool calls."""
+        crew_mocker.mock_strands()
+        from agentic_crew.runners.strands_runner import StrandsRunner
+
+        async def stream_async(prompt):
+            assert prompt == "do it"
+            yield {"data": "Work"}
+            yield {"current_tool_use": {"name": "search", "input": '{"q"'}}
+            yield {"message": {"role": "assistant", "content": [{"toolUse": {"name": "search", "input": {"q": 1}}}]}}
+            yield {"data": "ing"}
+            yield {"result": "Working"}
+
+        agent = MagicMock()
+        agent.stream_async = stream_async
+
+        events = list(StrandsRunner().stream(agent, {"task": "do it"}))
+
+        assert events == [
+            CrewEvent("token", delta="Work"),
+            CrewEvent("tool_call", tool="search", tool_input={"q": 1}),
+            CrewEvent("token", delta="ing"),
+            CrewEvent("final", output="Working"),
+        ]
+
+    def test_final_event_reports_agent_usage(self, crew_mocker: CrewMocker) -> None:
+        """The final event carries the run's token usage, including prompt cache reads and writes."""
+        crew_mocker.mock_strands()
+        from agentic_crew.runners.strands_runner import StrandsRunner
+
+        agent = MagicMock()
+        agent.event_loop_metrics.accumulated_usage = {"inputTokens": 100, "outputTokens": 10, "totalTokens": 110}
+
+        async def stream_async(prompt):
+            agent.event_loop_metrics.accumulated_usage = {
+                "inputTokens": 130,
+                "outputTokens": 15,
+                "totalTokens": 145,
+                "cacheReadInputTokens": 20,
+                "cacheWriteInputTokens": 5,
+            }
+            yield {"result": "Done"}
+
+        agent.stream_async = stream_async
+
+        final = list(StrandsRunner().stream(agent, {"task": "do it"}))[-1]
+
+        assert final == CrewEvent(
+            "final",
+            output="Done",
+            usage={
+                "crew": {
+                    "input_tokens": 30,
+                    "output_tokens": 5,
+                    "total_tokens": 35,
+                    "cache_read_tokens": 20,
+                    "cache_write_tokens": 5,
+                }
+            },
+        )
+
+
+class TestCrewAIStreaming:
+    """CrewAI step/task callbacks are translated into events."""
+
+    def _crew(self, existing_task_callback=None):
+        crew = SimpleNamespace(
+            tasks=[SimpleNamespace(name="research", description="R"), SimpleNamespace(name=None, description="Write")],
+            step_callback=None,
+            task_callback=existing_task_callback,
+        )
+
+        def kickoff(inputs):
+            crew.step_callback(SimpleNamespace(tool="search", tool_input="q"))
+            crew.step_callback(SimpleNamespace(output="thought"))
+            crew.task_callback(SimpleNamespace(name="research", raw="notes"))
+            crew.task_callback(SimpleNamespace(name=None, description="Write", raw="essay"))
+            return SimpleNamespace(raw="essay")
+
+        crew.kickoff = kickoff
+        return crew
+
+    def test_stream_reports_tasks_and_tools(self, crew_mocker: CrewMocker) -> None:
+        """Tasks start in order as previous ones finish; tool actions become tool calls."""
+        crew_mocker.mock_crewai()
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        events = list(CrewAIRunner().stream(self._crew(), {}))
+
+        assert events == [
+            CrewEvent("task_started", task="research"),
+            CrewEvent("tool_call", tool="search", tool_input="q"),
+            CrewEvent("task_finished", task="research", output="notes"),
+            CrewEvent("task_started", task="Write"),
+            CrewEvent("task_finished", task="Write", output="essay"),
+            CrewEvent("final", output="essay"),
+        ]
+
+    def test_final_reports_crew_usage(self, crew_mocker: CrewMocker) -> None:
+        """The crew's usage metrics, including cached prompt tokens, end the stream."""
+        crew_mocker.mock_crewai()
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        crew = self._crew()
+        crew.usage_metrics = SimpleNamespace(
+            prompt_tokens=300, completion_tokens=40, total_tokens=340, cached_prompt_tokens=250
+        )
+
+        final = list(CrewAIRunner().stream(crew, {}))[-1]
+
+        assert final.usage == {
+            "crew": {
+                "input_tokens": 300,
+                "output_tokens": 40,
+                "total_tokens": 340,
+                "cache_read_tokens": 250,
+                "cache_write_tokens": 0,
+            }
+        }
+
+    def test_existing_callbacks_are_chained_and_restored(self, crew_mocker: CrewMocker) -> None:
+        """User callbacks still fire and are put back after the run."""
+        crew_mocker.mock_crewai()
+        from agentic_crew.runners.crewai_runner import CrewAIRunner
+
+        existing = MagicMock()
+        crew = self._crew(existing_task_callback=existing)
+
+        list(CrewAIRunner().stream(crew, {}))
+
+        assert existing.call_count == 2
+        assert crew.task_callback is existing
+        assert crew.step_callback is None
+
+
+class TestStreamCrewAuto:
+    """stream_crew_auto selects the runner and holds the crew lease."""
+
+    def test_streams_runner_events(self) -> None:
+        """Events come from the selected runner's stream()."""
+        from agentic_crew.core.decomposer import _get_built_crew, stream_crew_auto
+
+        config = {"name": "c", "agents": {}, "tasks": {}}
+        with patch("agentic_crew.core.decomposer.get_runner") as mock_get_runner:
+            runner = mock_get_runner.return_value
+            runner.reusable_crews = True
+            runner.stream.return_value = iter([CrewEvent("final", output="ok")])
+
+            events = list(stream_crew_auto(config, inputs={"a": 1}, framework="crewai"))
+
+            entry = _get_built_crew(config, "crewai", cache=True)
+            runner.stream.assert_called_once_with(entry.crew, {"a": 1})
+            assert not entry.lock.locked()
+
+        assert events == [CrewEvent("final", output="ok")]
+
+
+class TestRunStreamCommand:
+    """Tests for `agentic-crew run --stream`."""
+
+    def test_emits_ndjson_events(self, temp_workspace: Path, capsys) -> None:
+        """Each event is one JSON line; the final one carries run metadata."""
+        from agentic_crew.core.discovery import discover_packages
+        from agentic_crew.main import main
+
+        events = [CrewEvent("task_started", task="t"), CrewEvent("final", output="done")]
+        with (
+            patch("sys.argv", ["agentic-crew", "run", "otterfall", "test_crew", "--input", "x", "--stream"]),
+            patch("agentic_crew.main.discover_packages", return_value=discover_packages(temp_workspace)),
+            patch("agentic_crew.core.decomposer.stream_crew_auto", return_value=iter(events)),
+        ):
+            main()
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert lines[0] == {"type": "task_started", "task": "t"}
+        assert lines[1]["type"] == "final"
+        assert lines[1]["output"] == "done"
+        assert lines[1]["framework_used"] == "crewai"
+        assert "duration_ms" in lines[1]
+
+    def test_crew_output_goes_to_stderr(self, temp_workspace: Path, capsys) -> None:
+        """Text printed while streaming (e.g. CrewAI verbose logs) does not corrupt the NDJSON."""
+        from agentic_crew.core.discovery import discover_packages
+        from agentic_crew.main import main
+
+        def stream(*args, **kwargs):
+            print("Agent: thinking...")
+            yield CrewEvent("task_started", task="t")
+            print("Agent: done")
+            yield CrewEvent("final", output="done")
+
+        with (
+            patch("sys.argv", ["agentic-crew", "run", "otterfall", "test_crew", "--input", "x", "--stream"]),
+            patch("agentic_crew.main.discover_packages", return_value=discover_packages(temp_workspace)),
+            patch("agentic_crew.core.decomposer.stream_crew_auto", side_effect=stream),
+        ):
+            main()
+
+        captured = capsys.readouterr()
+        assert [json.loads(line)["type"] for line in captured.out.splitlines()] == ["task_started", "final"]
+        assert "Agent: thinking..." in captured.err
+        assert "Agent: done" in captured.err
+
+    def test_unknown_package_emits_error_event(self, capsys) -> None:
+        """Configuration errors are reported as an error event with exit code 2."""
+        from agentic_crew.main import main
+
+        with (
+            patch("sys.argv", ["agentic-crew", "run", "nope", "crew", "--stream"]),
+            patch("agentic_crew.main.discover_packages", return_value={}),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main()
+
+        assert exc_info.value.code == 2
+        assert json.loads(capsys.readouterr().out) == {
+            "type": "error",
+            "error": "Package 'nope' not found",
+            "available_packages": [],
+        }
@@ -0,0 +1,71 @@
+"""Tests for task dependency graphs."""
+
+from __future__ import annotations
+
+import pytest
+from agentic_crew.core.task_graph import TaskGraph
+
+
+class TestFromTasks:
+    """Dependencies derived from task context."""
+
+    def test_missing_context_chains_to_previous_task(self) -> None:
+        """Tasks without a context key keep sequential crew semantics."""
+        graph = TaskGraph.from_tasks({"a": {}, "b": {}, "c": {}})
+
+        assert graph.dependencies == {"a": (), "b": ("a",), "c": ("b",)}
+        assert graph.is_sequential()
+
+    def test_explicit_context_forms_levels(self) -> None:
+        """Independent tasks share a level; dependents follow them."""
+        graph = TaskGraph.from_tasks(
+            {
+                "research": {"context": []},
+                "analysis": {"context": []},
+                "report": {"context": ["research", "analysis"]},
+            }
+        )
+
+        assert graph.levels() == [["research", "analysis"], ["report"]]
+        assert not graph.is_sequential()
+
+    def test_forward_references_are_ordered(self) -> None:
+        """A task may reference a task defined after it."""
+        graph = TaskGraph.from_tasks({"summary": {"context": ["notes"]}, "notes": {"context": []}})
+
+        assert graph.order() == ["notes", "summary"]
+
+    def test_unknown_context_raises(self) -> None:
+        """Typos in context are reported instead of silently dropped."""
+        with pytest.raises(ValueError, match="unknown task 'reserch'"):
+            TaskGraph.from_tasks({"research": {}, "report": {"context": ["reserch"]}})
+
+    def test_cycle_raises(self) -> None:
+        """Cyclic context references are rejected."""
+        with pytest.raises(ValueError, match="cycle"):
+            TaskGraph.from_tasks({"a": {"context": ["b"]}, "b": {"context": ["a"]}})
+
+
+class TestCriticalPath:
+    """Tests for critical_path and dependents."""
+
+    GRAPH = {"a": [], "b": [], "c": ["a"], "d": ["b", "c"]}
+
+    def test_unweighted(self) -> None:
+        """Without durations the longest chain by task count wins."""
+        assert TaskGraph(self.GRAPH).critical_path() == ["a", "c", "d"]
+
+    def test_weighted(self) -> None:
+        """Durations decide which branch is critical."""
+        durations = {"a": 1, "b": 10, "c": 1, "d": 1}
+
+        assert TaskGraph(self.GRAPH).critical_path(durations) == ["b", "d"]
+
+    def test_dependents(self) -> None:
+        """dependents() inverts the dependency mapping."""
+        assert TaskGraph(self.GRAPH).dependents() == {"a": ["c"], "b": ["d"], "c": ["d"], "d": []}
+
+    def test_empty(self) -> None:
+        """An empty graph has no levels and no critical path."""
+        assert TaskGraph({}).levels() == []
+        assert TaskGraph({}).critical_path() == []
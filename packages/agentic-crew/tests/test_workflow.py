@@ -0,0 +1,198 @@
+"""Tests for DAG workflows (run_workflow and ManagerAgent.run_workflow)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from agentic_crew.core.manager import ManagerAgent
+from agentic_crew.core.workflow import CONTINUE, WorkflowError, WorkflowStep, run_workflow
+from agentic_crew.runners.base import DeadlineExceeded, remaining_time
+
+DIAMOND = [
+    WorkflowStep("design"),
+    WorkflowStep("code", depends_on=["design"]),
+    WorkflowStep("art", depends_on=["design"]),
+    WorkflowStep("qa", depends_on=["code", "art"]),
+]
+
+
+class _Delegate:
+    """Fake delegate that records calls and tracks concurrency per role."""
+
+    def __init__(self, delays: dict[str, float] | None = None, fail: set[str] | None = None):
+        self.delays = delays or {}
+        self.fail = fail or set()
+        self.calls: list[tuple[str, object]] = []
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.total = self.peak_total = 0
+
+    async def __call__(self, role: str, inputs):
+        self.calls.append((role, inputs))
+        self.active[role] = self.active.get(role, 0) + 1
+        self.peak[role] = max(self.peak.get(role, 0), self.active[role])
+        self.total += 1
+        self.peak_total = max(self.peak_total, self.total)
+        try:
+            await asyncio.sleep(self.delays.get(role, 0.01))
+            if role in self.fail:
+                raise RuntimeError(f"{role} broke")
+            return f"{role} out"
+        finally:
+            self.active[role] -= 1
+            self.total -= 1
+
+
+class TestRunWorkflow:
+    """Tests for the DAG scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_diamond_runs_independent_steps_in_parallel(self) -> None:
+        """Steps start when their dependencies finish; siblings overlap."""
+        delegate = _Delegate(delays={"art": 0.05})
+
+        result = await run_workflow(DIAMOND, delegate, task="make a game")
+
+        assert result.success
+        assert result.outputs["qa"] == "qa out"
+        assert delegate.calls[0] == ("design", "make a game")
+        assert delegate.calls[-1] == ("qa", {"task": "make a game", "code": "code out", "art": "art out"})
+        assert delegate.peak_total == 2
+        assert result.critical_path == ["design", "art", "qa"]
+
+    @pytest.mark.asyncio
+    async def test_input_mapper_and_role(self) -> None:
+        """Callable inputs receive dependency outputs; role defaults to the name."""
+        delegate = _Delegate()
+        steps = [
+            WorkflowStep("draft", role="writer"),
+            WorkflowStep("review", role="writer", depends_on=["draft"], inputs=lambda r: {"text": r["draft"]}),
+        ]
+
+        await run_workflow(steps, delegate)
+
+        assert delegate.calls[1] == ("writer", {"text": "writer out"})
+
+    @pytest.mark.asyncio
+    async def test_limits(self) -> None:
+        """max_parallel and role_limits bound concurrent delegations."""
+        delegate = _Delegate()
+        steps = [WorkflowStep(f"a{i}", role="a") for i in range(4)] + [
+            WorkflowStep(f"b{i}", role="b") for i in range(4)
+        ]
+
+        await run_workflow(steps, delegate, max_parallel=3, role_limits={"a": 1})
+
+        assert delegate.peak["a"] == 1
+        assert delegate.peak_total <= 3
+
+    @pytest.mark.asyncio
+    async def test_fail_fast_raises_with_partial_result(self) -> None:
+        """The first failure cancels the rest and raises WorkflowError."""
+        delegate = _Delegate(delays={"art": 1.0}, fail={"code"})
+
+        with pytest.raises(WorkflowError, match="code broke") as exc_info:
+            await run_workflow(DIAMOND, delegate)
+
+        result = exc_info.value.result
+        assert exc_info.value.step == "code"
+        assert result.outputs == {"design": "design out"}
+        assert sorted(result.skipped) == ["art", "qa"]
+
+    @pytest.mark.asyncio
+    async def test_continue_skips_only_dependents(self) -> None:
+        """With CONTINUE, unaffected steps still run."""
+        delegate = _Delegate(fail={"code"})
+        steps = [*DIAMOND, WorkflowStep("docs", depends_on=["design"])]
+
+        result = await run_workflow(steps, delegate, on_error=CONTINUE)
+
+        assert not result.success
+        assert result.errors == {"code": "code broke"}
+        assert result.skipped == ["qa"]
+        assert set(result.outputs) == {"design", "art", "docs"}
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_and_keeps_partial_result(self) -> None:
+        """A workflow past its deadline raises with the steps that finished."""
+        delegate = _Delegate(delays={"art": 10})
+
+        with pytest.raises(DeadlineExceeded, match="Workflow timed out") as exc_info:
+            await run_workflow(DIAMOND, delegate, timeout=0.1)
+
+        result = exc_info.value.partial
+        assert set(result.outputs) == {"design", "code"}
+        assert sorted(result.skipped) == ["art", "qa"]
+        assert delegate.total == 0
+
+    @pytest.mark.asyncio
+    async def test_steps_see_the_workflow_deadline(self) -> None:
+        """Delegations started by steps inherit the workflow deadline."""
+        seen = []
+
+        async def delegate(role, inputs):
+            seen.append(remaining_time())
+            return "ok"
+
+        await run_workflow([WorkflowStep("a")], delegate, timeout=30)
+        await run_workflow([WorkflowStep("a")], delegate)
+
+        assert 0 < seen[0] <= 30
+        assert seen[1] is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_workflows(self) -> None:
+        """Bad steps and settings are rejected before anything runs."""
+        delegate = _Delegate()
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            await run_workflow([WorkflowStep("a"), WorkflowStep("a")], delegate)
+        with pytest.raises(ValueError, match="unknown task 'b'"):
+            await run_workflow([WorkflowStep("a", depends_on=["b"])], delegate)
+        with pytest.raises(ValueError, match="on_error"):
+            await run_workflow([WorkflowStep("a")], delegate, on_error="retry")
+        assert delegate.calls == []
+
+
+class TestManagerRunWorkflow:
+    """Tests for ManagerAgent.run_workflow."""
+
+    @pytest.mark.asyncio
+    async def test_delegates_each_step(self) -> None:
+        """Steps are delegated through delegate_async with the framework override."""
+        manager = ManagerAgent(crews={"design": "d", "code": "c", "art": "a", "qa": "q"})
+
+        with patch.object(ManagerAgent, "delegate_async", autospec=True) as mock_delegate:
+            mock_delegate.side_effect = lambda self, role, inputs, framework=None: f"{role} out"
+            result = await manager.run_workflow(DIAMOND, task="t", framework="langgraph")
+
+        assert result.outputs["qa"] == "qa out"
+        assert {call.args[1] for call in mock_delegate.call_args_list} == {"design", "code", "art", "qa"}
+        assert all(call.args[3] == "langgraph" for call in mock_delegate.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_step_timeout_fails_the_step(self) -> None:
+        """A step past step_timeout fails and, with CONTINUE, skips its dependents."""
+        manager = ManagerAgent(crews={"design": "d", "code": "c", "art": "a", "qa": "q"})
+        manager._crew_config_cache = {name: {"name": name, "agents": {}, "tasks": {}} for name in "dcaq"}
+
+        async def run(config, inputs, framework=None):
+            await asyncio.sleep(10 if config["name"] == "a" else 0)
+            return config["name"]
+
+        with patch("agentic_crew.core.manager.run_crew_auto_async", side_effect=run):
+            result = await manager.run_workflow(DIAMOND, task="t", on_error=CONTINUE, step_timeout=0.05)
+
+        assert set(result.outputs) == {"design", "code"}
+        assert "timed out" in result.errors["art"]
+        assert result.skipped == ["qa"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_role_raises(self) -> None:
+        """Steps must reference a configured crew role."""
+        manager = ManagerAgent(crews={"design": "d"})
+
+        with pytest.raises(ValueError, match="Unknown crew role 'qa' in step 'qa'"):
+            await manager.run_workflow([WorkflowStep("qa")])
@@ -232,3 +232,38 @@ class TestCrewConfigFrameworkConflict:
         get_crew_config(crewai_dir, "test_crew")
         captured = capsys.readouterr()
         assert "Warning" not in captured.out
+
+
+class TestLoadYaml:
+    """Tests for the shared YAML loading layer."""
+
+    DOCUMENT = "agent:\n  role: Reviewer\n  tools: [read, write]\n  retries: 3\n  enabled: yes\n  note: ~\n"
+
+    def test_matches_safe_load(self) -> None:
+        """load_yaml returns exactly what yaml.safe_load returns."""
+        from agentic_crew.utils.files import load_yaml
+
+        assert load_yaml(self.DOCUMENT) == yaml.safe_load(self.DOCUMENT)
+
+    def test_uses_libyaml_when_available(self) -> None:
+        """The C loader is selected whenever PyYAML was built with libyaml."""
+        from agentic_crew.utils import files
+
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert files.SafeLoader is expected
+        assert files.LIBYAML_AVAILABLE is yaml.__with_libyaml__
+
+    def test_pure_python_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without libyaml the pure-Python SafeLoader gives the same result."""
+        from agentic_crew.utils import files
+
+        monkeypatch.setattr(files, "SafeLoader", yaml.SafeLoader)
+
+        assert files.load_yaml(self.DOCUMENT) == yaml.safe_load(self.DOCUMENT)
+
+    def test_rejects_unsafe_tags(self) -> None:
+        """Python object tags are refused, as with safe_load."""
+        from agentic_crew.utils.files import load_yaml
+
+        with pytest.raises(yaml.YAMLError):
+            load_yaml("!!python/object/apply:os.system ['true']")
@@ -35,6 +35,11 @@ CREWAI_MODULES = [
 LANGGRAPH_MODULES = [
     "langgraph",
     "langgraph.prebuilt",
+    "langgraph.graph",
+    "langgraph.graph.message",
+    "langchain_core",
+    "langchain_core.messages",
+    "langchain_core.runnables",
     "langchain_anthropic",
 ]
 